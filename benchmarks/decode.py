@@ -0,0 +1,104 @@
+"""
+Response decoding benchmark.
+
+Compares the two ways a page of messages or contacts can be turned into models:
+
+- ``dict``: ``json.loads`` to Python objects, then ``model_validate`` on the dict.
+- ``bytes``: the raw body straight into ``model_validate_json``.
+
+Run with ``python -m benchmarks.decode [--page-sizes 100 1000] [--iterations 50]``.
+Results are printed as JSON.
+"""
+import json
+import time
+import argparse
+import tracemalloc
+
+from typing import Any, Callable, Dict, List
+from src.schemas.contacts import ListContactsResponse
+from src.schemas.messages import ListMessagesResponse
+
+
+def message_page(size: int) -> bytes:
+    """Build the raw body of a ``GET /messages`` page with ``size`` messages."""
+    return json.dumps({
+        "messages": [
+            {
+                "id": f"msg{i}",
+                "from": "+123456789",
+                "to": {"id": f"contact{i}", "name": "John Doe", "phone": "+987654321"} if i % 2 else f"contact{i}",
+                "content": "Hello, World!",
+                "status": "delivered",
+                "createdAt": "2024-12-06T03:01:37.416Z",
+                "deliveredAt": "2024-12-06T03:01:38.002Z",
+            }
+            for i in range(size)
+        ],
+        "page": 1,
+        "quantityPerPage": size,
+    }).encode()
+
+
+def contact_page(size: int) -> bytes:
+    """Build the raw body of a ``GET /contacts`` page with ``size`` contacts."""
+    return json.dumps({
+        "contactsList": [{"id": f"contact{i}", "name": "John Doe", "phone": "+123456789"} for i in range(size)],
+        "pageNumber": 1,
+        "pageSize": size,
+    }).encode()
+
+
+def _measure(decode: Callable[[bytes], Any], body: bytes, iterations: int) -> Dict[str, float]:
+    decode(body)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(body)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"pages_per_second": round(iterations / elapsed, 2), "peak_bytes": peak}
+
+
+def run(page_sizes: List[int] = (100, 1000), iterations: int = 50) -> List[Dict[str, Any]]:
+    """
+    Benchmark both decode paths for message and contact pages.
+
+    Returns:
+        list: One result per resource and page size, with throughput, peak allocation
+        and the speedup of the bytes path over the dict path.
+    """
+    results = []
+    for resource, model, build in (
+        ("messages", ListMessagesResponse, message_page),
+        ("contacts", ListContactsResponse, contact_page),
+    ):
+        for size in page_sizes:
+            body = build(size)
+            via_dict = _measure(lambda raw: model.model_validate(json.loads(raw)), body, iterations)
+            via_bytes = _measure(model.model_validate_json, body, iterations)
+            results.append({
+                "resource": resource,
+                "page_size": size,
+                "body_bytes": len(body),
+                "dict": via_dict,
+                "bytes": via_bytes,
+                "records_per_second": round(via_bytes["pages_per_second"] * size),
+                "speedup": round(via_bytes["pages_per_second"] / via_dict["pages_per_second"], 2),
+                "peak_bytes_ratio": round(via_bytes["peak_bytes"] / max(via_dict["peak_bytes"], 1), 2),
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(args.page_sizes, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+SDK import-time benchmark.
+
+Imports each module in a fresh interpreter, from an empty working directory and
+without ``API_KEY`` or ``WEBHOOK_SECRET`` set, and reports:
+
+- the median wall time of the import, excluding interpreter startup;
+- which heavy optional modules (HTTP libraries, settings loader) were imported;
+- whether the import read the settings or wrote a ``logs/`` directory.
+
+Run with ``python -m benchmarks.import_time [--modules src.sdk.client] [--iterations 5]``.
+Results are printed as JSON.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ("src.sdk.client", "src.sdk.features.messages", "src.sdk.features.contacts")
+HEAVY_MODULES = ("requests", "httpx", "pydantic_settings")
+
+_PROBE = """
+import sys, json, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+config = sys.modules.get("src.core.config")
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+    "settings_loaded": bool(config and config._settings is not None),
+}}))
+"""
+
+
+def measure(module: str) -> Dict[str, Any]:
+    """Import ``module`` once in a fresh interpreter and report what it cost."""
+    env = {key: value for key, value in os.environ.items() if key not in ("API_KEY", "WEBHOOK_SECRET")}
+    env["PYTHONPATH"] = ROOT
+    with tempfile.TemporaryDirectory() as cwd:
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result["created_logs_dir"] = os.path.exists(os.path.join(cwd, "logs"))
+    return result
+
+
+def run(modules: List[str] = DEFAULT_MODULES, iterations: int = 5) -> List[Dict[str, Any]]:
+    """
+    Benchmark the import of each module.
+
+    Returns:
+        list: One result per module, with the median import time in milliseconds and
+        the side effects observed on the last run.
+    """
+    results = []
+    for module in modules:
+        runs = [measure(module) for _ in range(iterations)]
+        last = runs[-1]
+        results.append({
+            "module": module,
+            "median_ms": round(statistics.median(r["seconds"] for r in runs) * 1000, 1),
+            "heavy_modules": last["loaded"],
+            "settings_loaded": last["settings_loaded"],
+            "created_logs_dir": last["created_logs_dir"],
+        })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES))
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.modules, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Benchmark suite for the SDK and webhook hot paths.
+
+Scenarios, each reported under a flat key:
+
+- ``sdk.<sync|async>.send_message`` / ``sdk.<sync|async>.list_messages``: calls
+  through ``Messages`` / ``AsyncMessages`` against the in-process mock API
+  (``src.server.mock_api``, no latency or faults), with ``concurrency`` calls in flight.
+- ``validation.messages.<page size>.<strict|off>``: turning a raw page into models
+  (``strict``), or into dicts without validation (``off``).
+- ``signature.verify.<size>B``: ``verify_signature`` on webhook bodies.
+- ``webhooks.post`` / ``webhooks.post.duplicate`` / ``webhooks.post.forged``:
+  new, redelivered and forged ``POST /webhooks`` against the FastAPI app in process.
+
+Results are written as JSON. Pass ``--baseline`` with an earlier result file to
+flag scenarios whose throughput dropped by more than ``--tolerance``; the
+command then exits with status 1.
+
+Run with ``python -m benchmarks.suite [--quick] [--output results.json] [--baseline old.json]``.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import contextlib
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from benchmarks.decode import message_page
+from src.server.mock_api import MockApi
+
+MESSAGE = {"to": {"id": "contact123"}, "content": "Hello, World!", "from": "+123456789"}
+# Shared components of the webhook app, as they are before first use
+WEBHOOK_APP_STATE = {
+    "webhook_queue": None, "_webhook_queue_built": False, "admission": None,
+    "dedup_store": None, "_dedup_store_built": False, "status_store": None, "_status_store_built": False,
+}
+
+
+def summarize(samples: Sequence[float], elapsed: float) -> Dict[str, float]:
+    """Summarize per-operation latencies (seconds) measured over ``elapsed`` wall seconds."""
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000
+
+    return {
+        "ops": len(ordered),
+        "ops_per_second": round(len(ordered) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(percentile(0.5), 3),
+        "p90_ms": round(percentile(0.9), 3),
+        "p99_ms": round(percentile(0.99), 3),
+    }
+
+
+def measure_sync(call: Callable[[], Any], operations: int, concurrency: int = 1) -> Dict[str, float]:
+    """Run ``call`` ``operations`` times from ``concurrency`` threads."""
+    call()  # warm up connections and caches
+
+    def timed(_) -> float:
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if concurrency == 1:
+        samples = [timed(i) for i in range(operations)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(timed, range(operations)))
+    return {**summarize(samples, time.perf_counter() - start), "concurrency": concurrency}
+
+
+async def measure_async(call: Callable[[], Awaitable[Any]], operations: int, concurrency: int = 1) -> Dict[str, float]:
+    """Await ``call()`` ``operations`` times with up to ``concurrency`` calls in flight."""
+    await call()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    samples = await asyncio.gather(*(timed() for _ in range(operations)))
+    return {**summarize(samples, time.perf_counter() - start), "concurrency": concurrency}
+
+
+def bench_sdk(config, operations: int, concurrency: int, page_size: int) -> Dict[str, Dict[str, float]]:
+    from src.sdk.client import ApiClient, AsyncApiClient
+    from src.sdk.features.messages import AsyncMessages, Messages
+
+    results = {}
+    with ApiClient(config=config, pool_maxsize=concurrency) as client:
+        messages = Messages(client)
+        results["sdk.sync.send_message"] = measure_sync(lambda: messages.send_message(MESSAGE), operations, concurrency)
+        results["sdk.sync.list_messages"] = measure_sync(
+            lambda: messages.list_messages(page=1, limit=page_size), operations, concurrency,
+        )
+
+    async def run_async() -> None:
+        async with AsyncApiClient(config=config, max_keepalive_connections=concurrency) as client:
+            messages = AsyncMessages(client)
+            results["sdk.async.send_message"] = await measure_async(
+                lambda: messages.send_message(MESSAGE), operations, concurrency,
+            )
+            results["sdk.async.list_messages"] = await measure_async(
+                lambda: messages.list_messages(page=1, limit=page_size), operations, concurrency,
+            )
+
+    asyncio.run(run_async())
+    return results
+
+
+def bench_validation(page_sizes: Sequence[int], iterations: int) -> Dict[str, Dict[str, float]]:
+    from src.core.validators import validate_response
+    from src.schemas.messages import ListMessagesResponse
+
+    results = {}
+    for size in page_sizes:
+        body = message_page(size)
+        decode = validate_response(ListMessagesResponse)(lambda: body)
+        # Typed results are parsed in every mode; "off" skips the parse for dict results
+        for mode, as_dict in (("strict", False), ("off", True)):
+            stats = measure_sync(lambda: decode(validation=mode, as_dict=as_dict), iterations)
+            stats["us_per_record"] = round(stats["mean_ms"] * 1000 / size, 3)
+            results[f"validation.messages.{size}.{mode}"] = stats
+    return results
+
+
+def bench_signature(sizes: Sequence[int], iterations: int) -> Dict[str, Dict[str, float]]:
+    from src.core.security import generate_signature, verify_signature
+
+    results = {}
+    for size in sizes:
+        body = json.dumps({"id": "msg1", "status": "delivered", "padding": "x" * max(size - 40, 0)}).encode()
+        signature = generate_signature(body, "benchmark-secret")
+        results[f"signature.verify.{size}B"] = measure_sync(
+            lambda: verify_signature(body, signature, "benchmark-secret"), iterations,
+        )
+    return results
+
+
+async def asgi_post(app, path: str, body: bytes, headers: Dict[str, str]) -> int:
+    """Send one POST straight to an ASGI app, without a client or socket, and return the status code."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 50000), "server": ("webhooks.local", 80),
+    }
+    messages = iter([{"type": "http.request", "body": body, "more_body": False}])
+    status = 0
+
+    async def receive():
+        return next(messages, {"type": "http.disconnect"})
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+@contextlib.contextmanager
+def fresh_webhook_app(app_module):
+    """
+    Give the webhook app fresh shared components (queue, dedup and status stores, ...)
+    for a run, then close the ones it built and restore the previous ones.
+    """
+    previous = {name: getattr(app_module, name) for name in WEBHOOK_APP_STATE}
+    for name, value in WEBHOOK_APP_STATE.items():
+        setattr(app_module, name, value)
+    try:
+        yield app_module.app
+    finally:
+        if app_module.webhook_queue is not None:
+            app_module.webhook_queue.close()
+        if app_module.dedup_store is not None:
+            app_module.dedup_store.close()
+        for name, value in previous.items():
+            setattr(app_module, name, value)
+
+
+def bench_webhooks(operations: int, concurrency: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Deliveries to ``POST /webhooks``, driven straight through the ASGI interface so
+    the numbers reflect the app rather than an HTTP client: new events
+    (``webhooks.post``), redeliveries of one event (``webhooks.post.duplicate``)
+    and forged signatures (``webhooks.post.forged``).
+    """
+    import uuid
+    from src.core.config import get_settings
+    from src.core.security import generate_signature
+    from src.server import app as app_module
+
+    secret = get_settings().WEBHOOK_SECRET
+    run_id = uuid.uuid4().hex[:8]
+
+    def signed(index: int, key: str) -> Tuple[bytes, Dict[str, str]]:
+        body = json.dumps({"id": f"bench-{run_id}-{index}", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}).encode()
+        return body, {
+            "Authorization": f"Bearer {generate_signature(body, key)}",
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+        }
+
+    # Signed up front so signing is not part of the measurement; one extra for the warm-up call
+    scenarios = {
+        "webhooks.post": [signed(i, secret) for i in range(operations + 1)],
+        "webhooks.post.duplicate": [signed(-1, secret)] * (operations + 1),
+        "webhooks.post.forged": [signed(-2, "not-the-secret")] * (operations + 1),
+    }
+    results = {}
+
+    async def deliver(requests: List[Tuple[bytes, Dict[str, str]]]) -> Dict[str, Any]:
+        pending = iter(requests)
+        statuses: Dict[str, int] = {}
+
+        async def post() -> None:
+            body, headers = next(pending)
+            status = str(await asgi_post(app, "/webhooks", body, headers))
+            statuses[status] = statuses.get(status, 0) + 1
+
+        stats = await measure_async(post, operations, concurrency)
+        return {**stats, "statuses": statuses}
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), fresh_webhook_app(app_module) as app:
+        for name, requests in scenarios.items():
+            results[name] = asyncio.run(deliver(requests))
+    return results
+
+
+def run(
+    operations: int = 500,
+    concurrency: int = 8,
+    page_size: int = 100,
+    page_sizes: Sequence[int] = (10, 100, 1000),
+    iterations: int = 200,
+    signature_sizes: Sequence[int] = (256, 4096),
+) -> Dict[str, Any]:
+    """
+    Run every scenario and return the results with run metadata.
+
+    Returns:
+        dict: ``meta`` (versions, parameters, timestamp) and ``results`` keyed by scenario.
+    """
+    from src.core.codec import get_codec
+    from src.core.config import Settings, get_settings
+
+    base = get_settings()
+    results: Dict[str, Dict[str, Any]] = {}
+    with MockApi(api_key=base.API_KEY, seed_messages=page_size) as api:
+        config = Settings(**{**base.model_dump(), "BASE_URL": api.url, "CACHE_ENABLED": False})
+        results.update(bench_sdk(config, operations, concurrency, page_size))
+    results.update(bench_validation(page_sizes, iterations))
+    results.update(bench_signature(signature_sizes, iterations * 10))
+    results.update(bench_webhooks(operations, concurrency))
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_codec": get_codec().name,
+            "parameters": {
+                "operations": operations,
+                "concurrency": concurrency,
+                "page_size": page_size,
+                "page_sizes": list(page_sizes),
+                "iterations": iterations,
+            },
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    List scenarios whose throughput fell by more than ``tolerance`` (0.2 = 20%) versus a baseline run.
+    Scenarios missing from either run are ignored.
+    """
+    regressions = []
+    for name, stats in current["results"].items():
+        before = baseline.get("results", {}).get(name, {}).get("ops_per_second")
+        if not before:
+            continue
+        ratio = stats["ops_per_second"] / before
+        if ratio < 1 - tolerance:
+            regressions.append({"scenario": name, "baseline": before, "current": stats["ops_per_second"], "ratio": round(ratio, 3)})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=500, help="Calls per SDK and webhook scenario.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=100, help="Page size of list_messages calls.")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000], help="Validation page sizes.")
+    parser.add_argument("--iterations", type=int, default=200, help="Repetitions of in-memory scenarios.")
+    parser.add_argument("--quick", action="store_true", help="Small run for smoke testing.")
+    parser.add_argument("--output", help="Result file. Defaults to benchmarks/results/<timestamp>.json.")
+    parser.add_argument("--baseline", help="Earlier result file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed throughput drop versus the baseline.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("API_KEY", "benchmark")
+    os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+    if args.quick:
+        args.operations, args.iterations, args.page_sizes = 50, 20, [10, 100]
+
+    report = run(args.operations, args.concurrency, args.page_size, args.page_sizes, args.iterations)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+
+    output = args.output or os.path.join(
+        os.path.dirname(__file__), "results", datetime.now().strftime("%Y%m%d-%H%M%S") + ".json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,7 +48,7 @@ def manage_contacts_example(contacts):
         print(contacts_list)
 
         # Delete the created contact
-        contact_id = response["id"]
+        contact_id = response.id
         logger.info(f"Deleting contact with ID: {contact_id}")
         contacts.delete_contact(contact_id)
         logger.info(f"Contact with ID {contact_id} deleted successfully.")
@@ -34,6 +34,7 @@ setup(
         "pydantic-settings",
     ],
     extras_require={
+        "orjson": ["orjson"],
         "dev": [
             "flake8",
             "black",
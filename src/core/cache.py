@@ -0,0 +1,199 @@
+import copy
+import time
+import threading
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, NamedTuple, Optional
+from .logger import logger
+from .requests import endpoint_template
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+DEFAULT_TTLS = {"/contacts/{id}": 300.0, "/messages/{id}": 60.0}
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    size: int
+    value: Any
+
+
+class CacheStats:
+    """Thread-safe hit, miss, eviction and invalidation counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of GET responses with per-resource TTLs.
+
+    Only endpoints whose route template has a TTL are cached, e.g.
+    ``"/contacts/{id}"``. The cache is bounded by entry count and, optionally, by
+    the total size of the cached response bodies; the least recently used entries
+    are evicted first. Any write (POST, PUT, PATCH, DELETE) to a cached endpoint
+    invalidates it.
+
+    Each invalidation is numbered. A caller takes the current ``generation`` before
+    fetching a response and passes it to ``set``, which drops the response if its
+    endpoint was invalidated in the meantime, so a read that raced with a write
+    cannot cache the body from before the write.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = None,
+        ttls: Dict[str, float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int, optional): Maximum total size of cached bodies. No limit when omitted.
+            ttls (dict, optional): Seconds to keep a response, keyed by endpoint template.
+                Defaults to 300s for contacts and 60s for messages.
+            clock (Callable, optional): Monotonic time source.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        # Generation of the latest invalidation per endpoint, bounded like the entries;
+        # ``_forgotten`` is the latest generation dropped from it (or cleared)
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._forgotten = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["ResponseCache"]:
+        """Build the cache configured through ``Settings``, or None when disabled."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.CACHE_ENABLED:
+            return None
+        return cls(
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            max_bytes=settings.CACHE_MAX_BYTES or None,
+            ttls={"/contacts/{id}": settings.CACHE_CONTACT_TTL, "/messages/{id}": settings.CACHE_MESSAGE_TTL},
+        )
+
+    def ttl_for(self, method: str, endpoint: str) -> Optional[float]:
+        """Return the TTL of a cacheable request, or None if it must not be cached."""
+        if method.upper() != "GET" or "?" in endpoint:
+            return None
+        ttl = self.ttls.get(endpoint_template(endpoint))
+        return ttl if ttl and ttl > 0 else None
+
+    def get(self, endpoint: str) -> Any:
+        """
+        Look up a cached response.
+
+        Returns:
+            Any: A copy of the cached body, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(endpoint)
+                self.stats.increment("expirations")
+                entry = None
+            if entry is None:
+                self.stats.increment("misses")
+                return None
+            self._entries.move_to_end(endpoint)
+        self.stats.increment("hits")
+        return copy.deepcopy(entry.value)
+
+    @property
+    def generation(self) -> int:
+        """Number of the latest invalidation, to pass to ``set``."""
+        return self._generation
+
+    def set(self, endpoint: str, value: Any, ttl: float, size: int = 0, generation: int = None) -> None:
+        """
+        Store a response.
+
+        Args:
+            endpoint (str): Request path, used as the key.
+            value (Any): Raw response body, as bytes; callers decode it on every hit.
+            ttl (float): Seconds before the entry expires.
+            size (int): Size of the raw body in bytes, counted against ``max_bytes``.
+            generation (int, optional): ``generation`` read before the response was
+                fetched. The response is not stored if the endpoint was invalidated since.
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and self._invalidated.get(endpoint, self._forgotten) > generation:
+                logger.debug("Not caching %s: invalidated while it was fetched", endpoint)
+                return
+            self._remove(endpoint)
+            self._entries[endpoint] = _Entry(self._clock() + ttl, size, copy.deepcopy(value))
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.increment("evictions")
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop the cached response of an endpoint, if any, and fence off reads already in flight."""
+        endpoint = endpoint.split("?", 1)[0]
+        with self._lock:
+            self._generation += 1
+            self._invalidated[endpoint] = self._generation
+            self._invalidated.move_to_end(endpoint)
+            if len(self._invalidated) > self.max_entries:
+                self._forgotten = self._invalidated.popitem(last=False)[1]
+            if self._remove(endpoint):
+                self.stats.increment("invalidations")
+                logger.debug("Invalidated cached response for %s", endpoint)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+            self._invalidated.clear()
+            self._forgotten = self._generation
+
+    def _remove(self, endpoint: str) -> bool:
+        entry = self._entries.pop(endpoint, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = len(self._entries), self._bytes
+        return {**self.stats.snapshot(), "entries": entries, "bytes": size}
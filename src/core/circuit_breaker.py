@@ -0,0 +1,234 @@
+import time
+import threading
+
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict
+from .logger import logger
+from .exceptions import CircuitOpenError, RateLimitError, ServerError, TransientError
+from .requests import imported_types
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+FAILURE_ERRORS = (ServerError, TransientError)
+# Our own request rate, not the endpoint's health: neither a failure nor a success
+NEUTRAL_ERRORS = (RateLimitError,)
+# Transport failures, resolved lazily so neither HTTP library is imported here
+TRANSPORT_FAILURES = ("requests.exceptions.RequestException", "httpx.TransportError")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for a single endpoint.
+
+    The breaker tracks the outcome of the last ``window_size`` calls. Once at least
+    ``minimum_calls`` were recorded and the failure rate reaches
+    ``failure_rate_threshold``, it opens and rejects calls with ``CircuitOpenError``
+    for ``open_timeout`` seconds. It then lets ``half_open_probes`` calls through:
+    if they all succeed the breaker closes, any failure opens it again.
+
+    ``before_call`` returns a ticket to pass back with the call's outcome. Outcomes
+    only count in the state their call was admitted in, so a slow call admitted
+    while the breaker was closed cannot close it when it completes during the
+    half-open probing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            name (str): Breaker key, e.g. ``"GET /contacts/{id}"``.
+            failure_rate_threshold (float): Failure share (0-1) that opens the breaker.
+            minimum_calls (int): Calls needed in the window before the rate is evaluated.
+            window_size (int): Number of most recent calls considered.
+            open_timeout (float): Seconds to stay open before probing.
+            half_open_probes (int): Probe calls allowed while half-open.
+            clock (Callable, optional): Monotonic time source.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = max(1, min(minimum_calls, window_size))
+        self.open_timeout = open_timeout
+        self.half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._generation = 0  # bumped on every transition; tickets from earlier states are ignored
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.open_timeout:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning("Circuit '%s' %s -> %s", self.name, self._state.value, state.value)
+        self._state = state
+        self._generation += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state is CircuitState.CLOSED:
+            self._window.clear()
+
+    def _failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return self._window.count(False) / len(self._window)
+
+    def before_call(self) -> int:
+        """
+        Admit or reject a call.
+
+        Returns:
+            int: Ticket identifying the state the call was admitted in, to pass to
+            ``record`` or ``cancel``.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes in flight.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.CLOSED:
+                return self._generation
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return self._generation
+            self.rejected += 1
+            remaining = max(self.open_timeout - (self._clock() - self._opened_at), 0.0)
+        raise CircuitOpenError(self.name, retry_after=remaining)
+
+    def _current(self, ticket: int = None) -> bool:
+        """Whether an outcome with ``ticket`` belongs to the current state (None for untracked calls)."""
+        self._maybe_half_open()
+        return ticket is None or ticket == self._generation
+
+    def record_success(self, ticket: int = None) -> None:
+        with self._lock:
+            if not self._current(ticket):
+                return
+            if self._state is CircuitState.HALF_OPEN:
+                self._probe_successes += 1
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                if self._probe_successes >= self.half_open_probes:
+                    self._transition(CircuitState.CLOSED)
+                return
+            self._append(True)
+
+    def record_failure(self, ticket: int = None) -> None:
+        with self._lock:
+            if not self._current(ticket):
+                return
+            if self._state is CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN)
+                return
+            self._append(False)
+
+    def _append(self, success: bool) -> None:
+        self._window.append(success)
+        if (
+            self._state is CircuitState.CLOSED
+            and len(self._window) >= self.minimum_calls
+            and self._failure_rate() >= self.failure_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def cancel(self, ticket: int = None) -> None:
+        """Release an admitted call that finished without an outcome."""
+        with self._lock:
+            if self._current(ticket) and self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def record(self, error: Exception = None, ticket: int = None) -> None:
+        """
+        Record the outcome of an admitted call. Only server-side and transport
+        failures count against the breaker; client errors such as 404 do not, and
+        a 429 only releases the call.
+
+        Args:
+            error (Exception, optional): What the call raised, None on success.
+            ticket (int, optional): The ticket ``before_call`` returned for the call.
+        """
+        if isinstance(error, NEUTRAL_ERRORS):
+            self.cancel(ticket)
+        elif error is not None and isinstance(error, FAILURE_ERRORS + imported_types(*TRANSPORT_FAILURES)):
+            self.record_failure(ticket)
+        else:
+            self.record_success(ticket)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state.value,
+                "failure_rate": round(self._failure_rate(), 4),
+                "calls": len(self._window),
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily created circuit breakers keyed by ``"<METHOD> <endpoint template>"``.
+    """
+
+    def __init__(self, **breaker_options):
+        """
+        Args:
+            **breaker_options: Keyword arguments passed to every ``CircuitBreaker``.
+        """
+        self._options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> "CircuitBreakerRegistry":
+        """Build a registry configured through ``Settings``."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        return cls(
+            failure_rate_threshold=settings.CIRCUIT_FAILURE_RATE,
+            minimum_calls=settings.CIRCUIT_MINIMUM_CALLS,
+            window_size=settings.CIRCUIT_WINDOW_SIZE,
+            open_timeout=settings.CIRCUIT_OPEN_SECONDS,
+            half_open_probes=settings.CIRCUIT_HALF_OPEN_PROBES,
+        )
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(key, **self._options))
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {key: breaker.snapshot() for key, breaker in list(self._breakers.items())}
@@ -0,0 +1,128 @@
+import copy
+import asyncio
+import threading
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional
+from .logger import logger
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+COALESCABLE_METHODS = ("GET", "HEAD")
+
+
+class CoalesceStats:
+    """Thread-safe counters of executed and coalesced calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"executions": self.executions, "coalesced": self.coalesced}
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse identical concurrent calls into one.
+
+    The first caller for a key runs the call; callers arriving while it is in flight
+    wait for it and receive a copy of its result, or the same error. Nothing is
+    cached: the next call after completion runs again. ``do`` serves threads and
+    ``do_async`` serves coroutines; the two never share calls.
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["SingleFlight"]:
+        """Build the coalescer configured through ``Settings``, or None when disabled."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        return cls() if settings.COALESCE_GET_REQUESTS else None
+
+    @staticmethod
+    def key_for(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Return the coalescing key of a request, or None if it must always run on its own.
+        Only idempotent methods without a body or custom headers are coalesced.
+        """
+        if method.upper() not in COALESCABLE_METHODS or set(kwargs) - {"params", "timeout"}:
+            return None
+        params = kwargs.get("params") or {}
+        return method.upper(), endpoint, tuple(sorted(params.items()))
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Raises:
+            Exception: The error raised by the shared call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            self.stats.increment("coalesced")
+            logger.debug("Coalescing %s with the in-flight call", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        self.stats.increment("executions")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless an identical call is in flight, then share its outcome.
+
+        The shared call runs as its own task, so a caller being cancelled does not
+        cancel it for the others.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            self.stats.increment("executions")
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            return await asyncio.shield(task)
+
+        self.stats.increment("coalesced")
+        logger.debug("Coalescing %s with the in-flight call", key)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
@@ -0,0 +1,96 @@
+import json
+
+from typing import Any, Optional, Union
+from .logger import logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JsonCodec:
+    """
+    Interface of the JSON codec used for request bodies, response decoding and signing.
+
+    ``dumps`` must be deterministic and compact: the same bytes are sent and signed.
+    """
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec built on the standard library ``json`` module, always available."""
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec built on ``orjson``, which encodes straight to bytes."""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install it with `pip install orjson`.")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS = {"stdlib": StdlibJsonCodec, "orjson": OrjsonCodec}
+_codec: Optional[JsonCodec] = None
+
+
+def build_codec(name: str = "auto") -> JsonCodec:
+    """
+    Build a codec by name.
+
+    Args:
+        name (str): ``"orjson"``, ``"stdlib"`` or ``"auto"`` (orjson when installed).
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If ``"orjson"`` is requested but not installed.
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "stdlib"
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Choose from: auto, {', '.join(CODECS)}.")
+    return CODECS[name]()
+
+
+def get_codec() -> JsonCodec:
+    """Return the process-wide codec, built from ``JSON_CODEC`` on first use."""
+    global _codec
+    if _codec is None:
+        from .config import get_settings
+
+        _codec = build_codec(get_settings().JSON_CODEC)
+        logger.debug("Using the %s JSON codec", _codec.name)
+    return _codec
+
+
+def set_codec(codec: Union[JsonCodec, str]) -> None:
+    """
+    Replace the process-wide codec.
+
+    Args:
+        codec (JsonCodec | str): A codec instance, or a name accepted by ``build_codec``.
+    """
+    global _codec
+    _codec = build_codec(codec) if isinstance(codec, str) else codec
@@ -1,8 +1,10 @@
 import os
+import threading
 
+from typing import Any, Literal, Optional
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
-from src.core.logger import logger
+from src.core.logger import configure_logging, logger
 
 
 class Settings(BaseSettings):
@@ -10,11 +12,89 @@ class Settings(BaseSettings):
     API_KEY: str = Field(json_schema_extra={"env": "API_KEY"})
     WEBHOOK_SECRET: str = Field(json_schema_extra={"env": "WEBHOOK_SECRET"})
 
+    # HTTP transport
+    HTTP_POOL_CONNECTIONS: int = Field(default=10, ge=1, json_schema_extra={"env": "HTTP_POOL_CONNECTIONS"})
+    HTTP_POOL_MAXSIZE: int = Field(default=10, ge=1, json_schema_extra={"env": "HTTP_POOL_MAXSIZE"})
+    HTTP_MAX_CONNECTIONS: int = Field(default=100, ge=1, json_schema_extra={"env": "HTTP_MAX_CONNECTIONS"})
+    HTTP_POOL_BLOCK: bool = Field(default=False, json_schema_extra={"env": "HTTP_POOL_BLOCK"})
+    HTTP_CONNECT_TIMEOUT: float = Field(default=5.0, gt=0, json_schema_extra={"env": "HTTP_CONNECT_TIMEOUT"})
+    HTTP_READ_TIMEOUT: float = Field(default=30.0, gt=0, json_schema_extra={"env": "HTTP_READ_TIMEOUT"})
+
+    # Retries
+    RETRY_MAX_ATTEMPTS: int = Field(default=3, ge=1, json_schema_extra={"env": "RETRY_MAX_ATTEMPTS"})
+    RETRY_BASE_DELAY: float = Field(default=0.5, ge=0, json_schema_extra={"env": "RETRY_BASE_DELAY"})
+    RETRY_MAX_DELAY: float = Field(default=30.0, ge=0, json_schema_extra={"env": "RETRY_MAX_DELAY"})
+    RETRY_BUDGET_RATIO: float = Field(default=0.2, ge=0, json_schema_extra={"env": "RETRY_BUDGET_RATIO"})
+    RETRY_BUDGET_MIN_PER_SECOND: float = Field(default=10.0, ge=0, json_schema_extra={"env": "RETRY_BUDGET_MIN_PER_SECOND"})
+
+    # Circuit breaker
+    CIRCUIT_BREAKER_ENABLED: bool = Field(default=False, json_schema_extra={"env": "CIRCUIT_BREAKER_ENABLED"})
+    CIRCUIT_FAILURE_RATE: float = Field(default=0.5, gt=0, le=1, json_schema_extra={"env": "CIRCUIT_FAILURE_RATE"})
+    CIRCUIT_MINIMUM_CALLS: int = Field(default=10, ge=1, json_schema_extra={"env": "CIRCUIT_MINIMUM_CALLS"})
+    CIRCUIT_WINDOW_SIZE: int = Field(default=20, ge=1, json_schema_extra={"env": "CIRCUIT_WINDOW_SIZE"})
+    CIRCUIT_OPEN_SECONDS: float = Field(default=30.0, ge=0, json_schema_extra={"env": "CIRCUIT_OPEN_SECONDS"})
+    CIRCUIT_HALF_OPEN_PROBES: int = Field(default=1, ge=1, json_schema_extra={"env": "CIRCUIT_HALF_OPEN_PROBES"})
+
+    # Client-side rate limiting and adaptive concurrency
+    RATE_LIMIT_PER_SECOND: float = Field(default=0, ge=0, json_schema_extra={"env": "RATE_LIMIT_PER_SECOND"})
+    RATE_LIMIT_BURST: float = Field(default=0, ge=0, json_schema_extra={"env": "RATE_LIMIT_BURST"})
+    ADAPTIVE_CONCURRENCY_ENABLED: bool = Field(default=False, json_schema_extra={"env": "ADAPTIVE_CONCURRENCY_ENABLED"})
+    CONCURRENCY_INITIAL: int = Field(default=10, ge=1, json_schema_extra={"env": "CONCURRENCY_INITIAL"})
+    CONCURRENCY_MIN: int = Field(default=1, ge=1, json_schema_extra={"env": "CONCURRENCY_MIN"})
+    CONCURRENCY_MAX: int = Field(default=100, ge=1, json_schema_extra={"env": "CONCURRENCY_MAX"})
+
+    # Response cache
+    CACHE_ENABLED: bool = Field(default=False, json_schema_extra={"env": "CACHE_ENABLED"})
+    CACHE_MAX_ENTRIES: int = Field(default=1024, ge=1, json_schema_extra={"env": "CACHE_MAX_ENTRIES"})
+    CACHE_MAX_BYTES: int = Field(default=0, ge=0, json_schema_extra={"env": "CACHE_MAX_BYTES"})
+    CACHE_CONTACT_TTL: float = Field(default=300.0, ge=0, json_schema_extra={"env": "CACHE_CONTACT_TTL"})
+    CACHE_MESSAGE_TTL: float = Field(default=60.0, ge=0, json_schema_extra={"env": "CACHE_MESSAGE_TTL"})
+
+    # Request coalescing
+    COALESCE_GET_REQUESTS: bool = Field(default=False, json_schema_extra={"env": "COALESCE_GET_REQUESTS"})
+
+    # Schema validation: "sampled" and "off" only skip response validation for as_dict=True calls
+    VALIDATION_MODE: Literal["strict", "sampled", "off"] = Field(default="strict", json_schema_extra={"env": "VALIDATION_MODE"})
+    VALIDATION_SAMPLE_RATE: int = Field(default=100, ge=1, json_schema_extra={"env": "VALIDATION_SAMPLE_RATE"})
+
+    # JSON codec: orjson when installed ("auto"), or forced to "orjson" / "stdlib"
+    JSON_CODEC: Literal["auto", "orjson", "stdlib"] = Field(default="auto", json_schema_extra={"env": "JSON_CODEC"})
+
+    # Logging: "sync" handlers, "queue" (background listener thread) or "off"
+    LOG_MODE: Literal["sync", "queue", "off"] = Field(default="sync", json_schema_extra={"env": "LOG_MODE"})
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(default="INFO", json_schema_extra={"env": "LOG_LEVEL"})
+    LOG_SAMPLE_RATE: int = Field(default=1, ge=1, json_schema_extra={"env": "LOG_SAMPLE_RATE"})
+
+    # Request metrics (latency histograms, status counts, retries, bytes, in-flight)
+    METRICS_ENABLED: bool = Field(default=False, json_schema_extra={"env": "METRICS_ENABLED"})
+
+    # Webhook server: queue between signature check and processing, and its worker pool
+    WEBHOOK_QUEUE_ENABLED: bool = Field(default=True, json_schema_extra={"env": "WEBHOOK_QUEUE_ENABLED"})
+    WEBHOOK_QUEUE_SIZE: int = Field(default=1000, ge=1, json_schema_extra={"env": "WEBHOOK_QUEUE_SIZE"})
+    WEBHOOK_WORKERS: int = Field(default=4, ge=1, json_schema_extra={"env": "WEBHOOK_WORKERS"})
+    # Webhook admission control: 0 disables a limit; sources are client addresses unless a forwarded-for header is named
+    WEBHOOK_MAX_IN_FLIGHT: int = Field(default=256, ge=0, json_schema_extra={"env": "WEBHOOK_MAX_IN_FLIGHT"})
+    WEBHOOK_MAX_IN_FLIGHT_PER_SOURCE: int = Field(default=0, ge=0, json_schema_extra={"env": "WEBHOOK_MAX_IN_FLIGHT_PER_SOURCE"})
+    WEBHOOK_SOURCE_HEADER: str = Field(default="", json_schema_extra={"env": "WEBHOOK_SOURCE_HEADER"})
+    WEBHOOK_RETRY_AFTER: float = Field(default=1.0, ge=0, json_schema_extra={"env": "WEBHOOK_RETRY_AFTER"})
+
+    # Webhook deduplication: in memory per process, or in a SQLite file shared by every worker process
+    WEBHOOK_DEDUP_ENABLED: bool = Field(default=True, json_schema_extra={"env": "WEBHOOK_DEDUP_ENABLED"})
+    WEBHOOK_DEDUP_TTL: float = Field(default=86400.0, gt=0, json_schema_extra={"env": "WEBHOOK_DEDUP_TTL"})
+    WEBHOOK_DEDUP_MAX_ENTRIES: int = Field(default=100_000, ge=1, json_schema_extra={"env": "WEBHOOK_DEDUP_MAX_ENTRIES"})
+    WEBHOOK_DEDUP_SQLITE_PATH: str = Field(default="", json_schema_extra={"env": "WEBHOOK_DEDUP_SQLITE_PATH"})
+
+    # Webhook status tracking: forward-only status per message, bounded by capacity and age, optionally snapshotted on shutdown
+    WEBHOOK_STATUS_TRACKING_ENABLED: bool = Field(default=False, json_schema_extra={"env": "WEBHOOK_STATUS_TRACKING_ENABLED"})
+    WEBHOOK_STATUS_CAPACITY: int = Field(default=1_000_000, ge=1, json_schema_extra={"env": "WEBHOOK_STATUS_CAPACITY"})
+    WEBHOOK_STATUS_MAX_AGE: float = Field(default=86400.0, gt=0, json_schema_extra={"env": "WEBHOOK_STATUS_MAX_AGE"})
+    WEBHOOK_STATUS_SNAPSHOT_PATH: str = Field(default="", json_schema_extra={"env": "WEBHOOK_STATUS_SNAPSHOT_PATH"})
+
     @field_validator("BASE_URL")
     def validate_base_url(cls, value):
         if not value.startswith("http"):
             raise ValueError("BASE_URL must start with 'http'")
-        logger.info(f"Validated BASE_URL: {value}")
+        logger.debug("Validated BASE_URL: %s", value)
         return value
 
     @field_validator("API_KEY", "WEBHOOK_SECRET")
@@ -22,10 +102,62 @@ class Settings(BaseSettings):
         field_name = info.field_name  # Get the name of the field being validated
         if not value:
             raise ValueError(f"{field_name} cannot be empty.")
-        logger.info(f"Validated {field_name}: {value}")
+        logger.debug("Validated %s", field_name)
         return value
 
     model_config = ConfigDict(env_file=os.path.join(os.path.dirname(__file__), "../../.env"), env_file_encoding="utf-8")
 
 
-settings = Settings()
+_settings: Optional[Settings] = None
+_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, reading and validating the environment on
+    first use and then applying the logging configuration.
+
+    Raises:
+        pydantic.ValidationError: If required variables such as ``API_KEY`` are missing.
+    """
+    global _settings
+    if _settings is None:
+        with _lock:
+            if _settings is None:
+                set_settings(Settings())
+    return _settings
+
+
+def set_settings(value: Settings) -> None:
+    """
+    Replace the process-wide settings, e.g. with an explicitly built ``Settings(...)``
+    in applications that do not configure the SDK through environment variables.
+
+    Args:
+        value (Settings): The settings to use from now on.
+    """
+    global _settings
+    _settings = value
+    configure_logging(mode=value.LOG_MODE, level=value.LOG_LEVEL, sample_rate=value.LOG_SAMPLE_RATE)
+
+
+class _LazySettings:
+    """
+    Stand-in for the process-wide ``Settings`` that builds them on first attribute
+    access, so importing the SDK neither reads the environment nor configures logging.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(_settings) if _settings is not None else "<Settings (not loaded)>"
+
+
+settings = _LazySettings()
@@ -1,4 +1,4 @@
-from .api import ApiError, UnauthorizedError, NotFoundError, ServerError, TransientError
+from .api import ApiError, UnauthorizedError, NotFoundError, ServerError, TransientError, RateLimitError, CircuitOpenError
 from .resource import ContactNotFoundError, MessageNotFoundError, ResourceNotFoundError
 from .decorators import handle_exceptions, handle_404_error
 
@@ -8,6 +8,8 @@ __all__ = [
     "NotFoundError",
     "ServerError",
     "TransientError",
+    "RateLimitError",
+    "CircuitOpenError",
     "ContactNotFoundError",
     "MessageNotFoundError",
     "ResourceNotFoundError",
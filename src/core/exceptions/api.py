@@ -1,6 +1,3 @@
-from src.core.logger import logger
-
-
 class ApiError(Exception):
     """
     Base exception class for all API-related errors.
@@ -14,10 +11,6 @@ class ApiError(Exception):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
-        if status_code:
-            logger.error(f"[API Error] {status_code}: {message}")
-        else:
-            logger.error(f"[API Error]: {message}")
 
     def __str__(self):
         return f"{self.message} (HTTP {self.status_code})" if self.status_code else self.message
@@ -28,7 +21,6 @@ class UnauthorizedError(ApiError):
 
     def __init__(self, message: str = "Unauthorized access. Check your API key."):
         super().__init__(message, status_code=401)
-        logger.warning("[UnauthorizedError] Ensure your API key is valid.")
 
 
 class NotFoundError(ApiError):
@@ -36,7 +28,6 @@ class NotFoundError(ApiError):
 
     def __init__(self, message: str = "Requested resource not found."):
         super().__init__(message, status_code=404)
-        logger.warning("[NotFoundError] Resource does not exist.")
 
 
 class ServerError(ApiError):
@@ -44,15 +35,39 @@ class ServerError(ApiError):
 
     def __init__(self, message: str = "Internal server error. Please try again later.", status_code: int = 500):
         super().__init__(message, status_code=status_code)
-        logger.error("[ServerError] The server encountered an issue.")
 
 
 class TransientError(ApiError):
-    """Exception raised for transient server errors like 502 Bad Gateway or 503 Service Unavailable."""
+    """
+    Exception raised for transient server errors like 429 Too Many Requests,
+    502 Bad Gateway, 503 Service Unavailable or 504 Gateway Timeout.
+
+    Attributes:
+        retry_after (float, optional): Seconds the server asked us to wait, from ``Retry-After``.
+    """
 
-    def __init__(self, message: str = "Transient server error. Please retry.", status_code: int = None):
+    def __init__(self, message: str = "Transient server error. Please retry.", status_code: int = None, retry_after: float = None):
         super().__init__(message, status_code=status_code)
-        if status_code:
-            logger.warning(f"[TransientError] {message} (HTTP {status_code})")
-        else:
-            logger.warning(f"[TransientError] {message}")
+        self.retry_after = retry_after
+
+
+class RateLimitError(TransientError):
+    """Exception raised for 429 Too Many Requests responses."""
+
+    def __init__(self, message: str = "Rate limit exceeded. Slow down.", retry_after: float = None):
+        super().__init__(message, status_code=429, retry_after=retry_after)
+
+
+class CircuitOpenError(ApiError):
+    """
+    Exception raised without calling the API when the circuit breaker for an endpoint is open.
+
+    Attributes:
+        endpoint (str): The breaker key, e.g. ``"POST /messages"``.
+        retry_after (float): Seconds until the breaker lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float = 0.0):
+        super().__init__(f"Circuit open for {endpoint}; failing fast.")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
@@ -1,8 +1,13 @@
-from httpx import HTTPStatusError
+import inspect
+from functools import wraps
+from typing import TYPE_CHECKING
 from src.core.logger import logger
 from .resource import ContactNotFoundError, MessageNotFoundError
 from .api import ApiError
 
+if TYPE_CHECKING:
+    import httpx
+
 
 def handle_exceptions(func):
     """
@@ -18,21 +23,34 @@ def handle_exceptions(func):
         ApiError: Reraises known API errors for logging and debugging.
         RuntimeError: Raises unexpected errors as runtime exceptions.
     """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except ApiError as api_error:
+                logger.error("[ApiError]: %s", api_error)
+                raise
+            except Exception as unexpected_error:
+                logger.error("[Unhandled Exception]: %s", unexpected_error)
+                raise RuntimeError(f"An unexpected error occurred: {unexpected_error}")
+        return async_wrapper
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except ApiError as api_error:
-            logger.error(f"[ApiError]: {api_error}")
+            logger.error("[ApiError]: %s", api_error)
             raise
         except Exception as unexpected_error:
-            logger.error(f"[Unhandled Exception]: {unexpected_error}")
+            logger.error("[Unhandled Exception]: %s", unexpected_error)
             raise RuntimeError(f"An unexpected error occurred: {unexpected_error}")
 
     return wrapper
 
 
-def handle_404_error(e: HTTPStatusError, resource_id: str, resource_type: str) -> None:
+def handle_404_error(e: "httpx.HTTPStatusError", resource_id: str, resource_type: str) -> None:
     """
     Handle 404 errors for specific resources.
 
@@ -0,0 +1,126 @@
+import time
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Sequence, Tuple
+from .logger import logger
+
+PHASES = ("validation", "serialization", "network", "decode")
+
+
+class RequestTrace:
+    """
+    Record of one SDK call, handed to every ``RequestHooks`` callback.
+
+    Attributes:
+        method (str): HTTP method, set once the call reaches the client.
+        endpoint (str): Request path.
+        attempt (int): Number of the current attempt, starting at 1.
+        status (int, optional): Status code of the last response received.
+        error (BaseException, optional): Error of the failed attempt or call.
+        timings (dict): Seconds spent per phase, summed over attempts:
+            ``validation`` (request payload), ``serialization`` (building and
+            encoding the body), ``network`` (waiting for the HTTP response) and
+            ``decode`` (turning the body into the returned value, including
+            response validation).
+        data (dict): Free space for hooks, e.g. to keep the span of a call.
+    """
+    __slots__ = ("method", "endpoint", "attempt", "status", "error", "timings", "data", "started", "hooks")
+
+    def __init__(self):
+        self.method: Optional[str] = None
+        self.endpoint: Optional[str] = None
+        self.attempt = 1
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.data: Dict[str, Any] = {}
+        self.started = time.perf_counter()
+        self.hooks: Sequence["RequestHooks"] = ()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the call started."""
+        return time.perf_counter() - self.started
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.timings[phase] += seconds
+
+    def emit(self, event: str) -> None:
+        """Call ``event`` on every hook. A failing hook is logged and never breaks the call."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(self)
+            except Exception as e:
+                logger.warning("Request hook %s.%s failed: %s", type(hook).__name__, event, e)
+
+
+class RequestHooks:
+    """
+    Base class of request lifecycle hooks; override the events you need.
+
+    - ``before_request``: before each attempt is sent, after validation,
+      serialization and admission (circuit breaker, rate limiter).
+    - ``after_response``: once the call returned its result.
+    - ``on_retry``: after a failed attempt, before waiting to retry it.
+    - ``on_error``: once the call failed for good.
+
+    A call emits exactly one of ``after_response`` and ``on_error``. Both fire
+    after the response has been decoded and validated, so ``trace.timings`` is
+    complete.
+    """
+
+    def before_request(self, trace: RequestTrace) -> None:
+        pass
+
+    def after_response(self, trace: RequestTrace) -> None:
+        pass
+
+    def on_retry(self, trace: RequestTrace) -> None:
+        pass
+
+    def on_error(self, trace: RequestTrace) -> None:
+        pass
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("current_trace", default=None)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Return the trace of the call in progress, if any."""
+    return _current_trace.get()
+
+
+def open_trace() -> Tuple[RequestTrace, Any]:
+    """
+    Join the trace of the call in progress, or start one.
+
+    Returns:
+        tuple: The trace, and a token to pass to ``close_trace`` if this caller
+        started it (None otherwise).
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        return trace, None
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def close_trace(trace: RequestTrace, token: Any, error: BaseException = None) -> None:
+    """
+    End a trace started by ``open_trace`` and emit ``after_response`` or ``on_error``.
+    Does nothing for callers that joined an existing trace.
+    """
+    if token is None:
+        return
+    _current_trace.reset(token)
+    if trace.hooks:
+        if error is not None:
+            trace.error = error
+        trace.emit("on_error" if error is not None else "after_response")
+
+
+def add_phase(phase: str, started: float) -> None:
+    """Add the time since ``started`` (a ``time.perf_counter()`` reading) to the current trace."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.timings[phase] += time.perf_counter() - started
@@ -1,10 +1,93 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Hashable, List, Optional, Union
 
-# Ensure logs directory exists
+LOG_MODES = ("sync", "queue", "off")
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+# Above CRITICAL: every ``isEnabledFor`` check fails, so disabled logging costs one cached lookup
+SILENT = logging.CRITICAL + 1
+
+# Directory of the log file, created when the first record is written
 log_dir = "logs"
-os.makedirs(log_dir, exist_ok=True)
+
+_contexts: Dict[str, logging.Logger] = {}
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Let through the first occurrence of a message and then one in every ``rate``.
+
+    Occurrences are counted per logger, level and message template (the
+    unformatted ``%``-style string), so repeated messages with different
+    arguments are sampled together. Records at or above ``max_level``
+    (warnings and errors by default) are never dropped. A record emitted after
+    drops carries the number of dropped records in its ``suppressed`` attribute.
+    """
+
+    def __init__(self, rate: int, max_level: int = logging.WARNING, max_keys: int = 1024):
+        """
+        Args:
+            rate (int): Keep one record in ``rate`` per template. 1 keeps every record.
+            max_level (int): Records at this level or above are always kept. Defaults to WARNING.
+            max_keys (int): Templates tracked before the counters are reset.
+        """
+        super().__init__()
+        if rate < 1:
+            raise ValueError("rate must be >= 1")
+        self.rate = rate
+        self.max_level = max_level
+        self.max_keys = max_keys
+        self._counts: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate == 1 or record.levelno >= self.max_level:
+            return True
+        key = (record.name, record.levelno, record.msg)
+        with self._lock:
+            if key not in self._counts and len(self._counts) >= self.max_keys:
+                self._counts.clear()
+            seen = self._counts.get(key, 0)
+            self._counts[key] = seen + 1
+        if seen % self.rate:
+            return False
+        record.suppressed = self.rate - 1 if seen else 0
+        return True
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its directory and file on the first write."""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+def _build_handlers() -> List[logging.Handler]:
+    """Console handler gated by the logger level, rotating file handler for WARNING and above."""
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    file_handler = _LazyRotatingFileHandler(
+        os.path.join(log_dir, "app.log"), maxBytes=5 * 1024 * 1024, backupCount=3
+    )
+    file_handler.setLevel(logging.WARNING)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return [console_handler, file_handler]
+
+
+def _level(level: Union[int, str]) -> int:
+    return level if isinstance(level, int) else logging.getLevelName(level.upper())
+
 
 # Central logger
 def get_logger(context="sdk"):
@@ -18,30 +101,78 @@ def get_logger(context="sdk"):
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(f"logger.{context}")
-    logger.setLevel(logging.DEBUG)
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
-    console_handler.setFormatter(console_format)
-
-    # File handler
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, "app.log"), maxBytes=5 * 1024 * 1024, backupCount=3
-    )
-    file_handler.setLevel(logging.WARNING)
-    file_format = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
-    file_handler.setFormatter(file_format)
+    logger.setLevel(logging.INFO)
 
     # Add handlers if not already added
     if not logger.hasHandlers():
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        for handler in _build_handlers():
+            logger.addHandler(handler)
 
+    _contexts[context] = logger
     return logger
 
 
+def configure_logging(
+    mode: str = "sync",
+    level: Union[int, str] = logging.INFO,
+    levels: Dict[str, Union[int, str]] = None,
+    sample_rate: int = 1,
+) -> None:
+    """
+    Reconfigure the SDK loggers.
+
+    Args:
+        mode (str): ``"sync"`` writes records from the calling thread, ``"queue"`` hands
+            them to a background ``QueueListener`` thread that does the formatting and
+            I/O, and ``"off"`` makes the SDK emit no logs at all.
+        level (int | str): Minimum level of every SDK logger. Records below it are
+            discarded before any formatting. Defaults to INFO.
+        levels (dict, optional): Per-context overrides, e.g. ``{"webhooks": "DEBUG"}``.
+        sample_rate (int): Keep one in ``sample_rate`` repeated DEBUG and INFO records per
+            message template. Defaults to 1 (no sampling).
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    global _listener
+    if mode not in LOG_MODES:
+        raise ValueError(f"Unknown log mode '{mode}'. Choose from: {', '.join(LOG_MODES)}.")
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+        handlers = _build_handlers() if mode != "off" else [logging.NullHandler()]
+        if mode == "queue":
+            records = queue.SimpleQueue()
+            _listener = QueueListener(records, *handlers, respect_handler_level=True)
+            _listener.start()
+            handlers = [QueueHandler(records)]
+
+        for context, logger in _contexts.items():
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            for handler in handlers:
+                logger.addHandler(handler)
+            for log_filter in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+                logger.removeFilter(log_filter)
+            if sample_rate > 1:
+                logger.addFilter(SamplingFilter(sample_rate))
+            logger.propagate = mode != "off"
+            logger.setLevel(SILENT if mode == "off" else _level((levels or {}).get(context, level)))
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records before the interpreter exits."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # Create loggers for SDK and Webhook
 logger = get_logger("sdk")
 webhook_logger = get_logger("webhooks")
@@ -0,0 +1,226 @@
+import bisect
+import threading
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+# Request latency bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.9, 0.99)
+PREFIX = "messaging_sdk"
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Observations only increment a bucket counter, so memory stays constant.
+    Quantiles are estimated by linear interpolation inside the bucket that holds
+    them, like Prometheus' ``histogram_quantile``. Not thread-safe by itself; the
+    registry serializes access.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the ``q`` quantile (0 to 1).
+
+        Returns:
+            float | None: The estimate in seconds, or None without observations. Values
+            in the +Inf bucket are reported as the largest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class _EndpointMetrics:
+    __slots__ = ("latency", "statuses", "retries", "transient_errors", "bytes_sent", "bytes_received", "in_flight")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self.retries = 0
+        self.transient_errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint request metrics for the API clients.
+
+    Metrics are keyed by ``"<METHOD> <endpoint template>"``, e.g.
+    ``"GET /contacts/{id}"``, so per-resource calls share one series. The registry
+    records latency histograms, counts by status code (``"error"`` when no
+    response was received), retries, transient errors, bytes sent and received,
+    and requests in flight. Read it as a dict with ``snapshot`` or as Prometheus
+    text with ``to_prometheus``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets (Sequence[float]): Latency bucket upper bounds in seconds, ascending.
+        """
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+        self.buckets = tuple(buckets)
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["MetricsRegistry"]:
+        """Build the registry configured through ``Settings``, or None when disabled."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        return cls() if settings.METRICS_ENABLED else None
+
+    def _series(self, key: str) -> _EndpointMetrics:
+        series = self._endpoints.get(key)
+        if series is None:
+            series = self._endpoints[key] = _EndpointMetrics(self.buckets)
+        return series
+
+    def request_started(self, key: str) -> None:
+        with self._lock:
+            self._series(key).in_flight += 1
+
+    def request_finished(
+        self,
+        key: str,
+        seconds: float,
+        status: Union[int, str],
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        transient: bool = False,
+    ) -> None:
+        """
+        Record a completed request started with ``request_started``.
+
+        Args:
+            key (str): Endpoint key.
+            seconds (float): Time from sending the request to receiving the response.
+            status (int | str): HTTP status code, or ``"error"`` if no response arrived.
+            bytes_sent (int): Size of the encoded request body.
+            bytes_received (int): Size of the response body.
+            transient (bool): True if the request failed with a transient error.
+        """
+        with self._lock:
+            series = self._series(key)
+            series.in_flight -= 1
+            series.latency.observe(seconds)
+            series.statuses[str(status)] += 1
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+            if transient:
+                series.transient_errors += 1
+
+    def record_retry(self, key: str) -> None:
+        with self._lock:
+            self._series(key).retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Report every endpoint's readings.
+
+        Returns:
+            dict: Per endpoint key, ``requests``, ``statuses``, ``latency`` (``p50``,
+            ``p90``, ``p99``, ``count`` and ``sum`` in seconds), ``retries``,
+            ``transient_errors``, ``bytes_sent``, ``bytes_received`` and ``in_flight``.
+        """
+        with self._lock:
+            return {
+                key: {
+                    "requests": series.latency.count,
+                    "statuses": dict(series.statuses),
+                    "latency": {
+                        **{f"p{round(q * 100)}": series.latency.quantile(q) for q in QUANTILES},
+                        "count": series.latency.count,
+                        "sum": series.latency.sum,
+                    },
+                    "retries": series.retries,
+                    "transient_errors": series.transient_errors,
+                    "bytes_sent": series.bytes_sent,
+                    "bytes_received": series.bytes_received,
+                    "in_flight": series.in_flight,
+                }
+                for key, series in self._endpoints.items()
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render the readings in the Prometheus text exposition format.
+
+        Returns:
+            str: Metric families prefixed with ``messaging_sdk_`` and labelled by
+            ``method`` and ``endpoint`` (and ``status`` for request counts).
+        """
+        families = {
+            "request_duration_seconds": ("histogram", "Request latency in seconds.", []),
+            "requests_total": ("counter", "Requests sent, by status code.", []),
+            "retries_total": ("counter", "Retry attempts.", []),
+            "transient_errors_total": ("counter", "Requests failed with a transient error.", []),
+            "bytes_sent_total": ("counter", "Request body bytes sent.", []),
+            "bytes_received_total": ("counter", "Response body bytes received.", []),
+            "requests_in_flight": ("gauge", "Requests currently in flight.", []),
+        }
+        with self._lock:
+            for key, series in sorted(self._endpoints.items()):
+                method, _, endpoint = key.partition(" ")
+                labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"'
+                lines = families["request_duration_seconds"][2]
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), series.latency.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"_sum{{{labels}}} {series.latency.sum!r}")
+                lines.append(f"_count{{{labels}}} {series.latency.count}")
+                for status, count in sorted(series.statuses.items()):
+                    families["requests_total"][2].append(f'{{{labels},status="{_escape(status)}"}} {count}')
+                families["retries_total"][2].append(f"{{{labels}}} {series.retries}")
+                families["transient_errors_total"][2].append(f"{{{labels}}} {series.transient_errors}")
+                families["bytes_sent_total"][2].append(f"{{{labels}}} {series.bytes_sent}")
+                families["bytes_received_total"][2].append(f"{{{labels}}} {series.bytes_received}")
+                families["requests_in_flight"][2].append(f"{{{labels}}} {series.in_flight}")
+
+        output: List[str] = []
+        for name, (kind, help_text, samples) in families.items():
+            output.append(f"# HELP {PREFIX}_{name} {help_text}")
+            output.append(f"# TYPE {PREFIX}_{name} {kind}")
+            output.extend(f"{PREFIX}_{name}{sample}" for sample in samples)
+        return "\n".join(output) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
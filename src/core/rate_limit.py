@@ -0,0 +1,271 @@
+import time
+import asyncio
+import threading
+
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+from .logger import logger
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and get back how long to wait before using it, so the
+    bucket never blocks by itself and works for both threads and coroutines.
+    """
+
+    def __init__(self, rate: float, burst: float = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            burst (float, optional): Bucket capacity. Defaults to ``rate`` (one second of traffic).
+            clock (Callable, optional): Monotonic time source.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, borrowing from the future when the bucket is empty.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds``, e.g. after a 429 with ``Retry-After``."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiting per API key and endpoint.
+
+    Buckets are keyed by ``"<api key>:<METHOD> <endpoint template>"``. Limits are looked
+    up by endpoint key (``"POST /messages"``) first and fall back to the default rate.
+    Share one instance between clients that use the same API key.
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        burst: float = None,
+        limits: Dict[str, Tuple[float, Optional[float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate (float, optional): Default requests per second. None leaves unlisted endpoints unlimited.
+            burst (float, optional): Default burst size.
+            limits (dict, optional): Per-endpoint ``(rate, burst)`` overrides keyed by endpoint key.
+            clock (Callable, optional): Monotonic time source.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["RateLimiter"]:
+        """Build the limiter configured through ``Settings``, or None when disabled."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.RATE_LIMIT_PER_SECOND:
+            return None
+        return cls(rate=settings.RATE_LIMIT_PER_SECOND, burst=settings.RATE_LIMIT_BURST or None)
+
+    def _bucket(self, api_key: str, endpoint_key: str) -> Optional[TokenBucket]:
+        bucket_key = f"{api_key}:{endpoint_key}"
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            rate, burst = self.limits.get(endpoint_key, (self.rate, self.burst))
+            if not rate:
+                return None
+            with self._lock:
+                bucket = self._buckets.setdefault(bucket_key, TokenBucket(rate, burst, clock=self._clock))
+        return bucket
+
+    def acquire(self, api_key: str, endpoint_key: str) -> float:
+        """
+        Reserve a request slot.
+
+        Returns:
+            float: Seconds to wait before sending.
+        """
+        bucket = self._bucket(api_key, endpoint_key)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def pause(self, api_key: str, endpoint_key: str, seconds: float) -> None:
+        bucket = self._bucket(api_key, endpoint_key)
+        if bucket is not None:
+            logger.warning("Rate limited on %s; pausing for %.2fs", endpoint_key, seconds)
+            bucket.pause(seconds)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) limit on in-flight requests.
+
+    Each successful response raises the limit by ``increase / limit``, so it grows
+    by about ``increase`` per round of requests. An overload signal (429 or transient
+    error) multiplies it by ``decrease_factor``, at most once per ``cooldown`` seconds.
+    Other outcomes (client errors, cancelled requests) leave the limit unchanged.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 10,
+        min_limit: float = 1,
+        max_limit: float = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            initial_limit (float): Starting concurrency.
+            min_limit (float): Lowest concurrency allowed.
+            max_limit (float): Highest concurrency allowed.
+            increase (float): Additive step per round of healthy responses.
+            decrease_factor (float): Multiplier applied on overload, in (0, 1).
+            cooldown (float): Minimum seconds between two decreases.
+            clock (Callable, optional): Monotonic time source.
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self._async_waiters = deque()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["AdaptiveConcurrencyLimiter"]:
+        """Build the limiter configured through ``Settings``, or None when disabled."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.ADAPTIVE_CONCURRENCY_ENABLED:
+            return None
+        return cls(
+            initial_limit=settings.CONCURRENCY_INITIAL,
+            min_limit=settings.CONCURRENCY_MIN,
+            max_limit=settings.CONCURRENCY_MAX,
+        )
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _has_room(self) -> bool:
+        return self._in_flight < int(self._limit)
+
+    def acquire(self, timeout: float = None) -> bool:
+        """
+        Block until a request slot is free.
+
+        Returns:
+            bool: False if ``timeout`` expired first.
+        """
+        with self._cond:
+            if not self._cond.wait_for(self._has_room, timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    async def acquire_async(self) -> None:
+        """Wait for a request slot without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._has_room():
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                entry = (loop, waiter)
+                self._async_waiters.append(entry)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    try:
+                        self._async_waiters.remove(entry)
+                    except ValueError:
+                        # Already woken for a free slot: hand the wake-up on to the next waiter
+                        self._wake()
+                raise
+
+    def release(self, overloaded: bool = False, succeeded: bool = True) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of the request.
+
+        Args:
+            overloaded (bool): True if the server signalled overload (429 or transient error).
+            succeeded (bool): True if the request completed successfully; only those
+                raise the limit.
+        """
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if overloaded:
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.warning("Overload detected; concurrency limit lowered to %s", self.limit)
+            elif succeeded:
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._wake()
+
+    def _wake(self) -> None:
+        self._cond.notify_all()
+        free = int(self._limit) - self._in_flight
+        while free > 0 and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(_resolve, waiter)
+                free -= 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._cond:
+            return {"limit": self.limit, "in_flight": self._in_flight}
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -1,17 +1,73 @@
-import requests
+import sys
+import inspect
 
 from functools import wraps
+from typing import Tuple
 from .logger import logger
 
+
+def imported_types(*names: str) -> Tuple[type, ...]:
+    """
+    Resolve ``"module.Class"`` names from modules that are already imported.
+
+    Classes of a module that was never imported are left out, since no object can
+    be an instance of them. This lets error checks cover ``requests`` and ``httpx``
+    exceptions without importing either transport. An empty result matches nothing
+    in ``except`` and ``isinstance``.
+
+    Args:
+        names (str): Dotted names such as ``"httpx.TransportError"``.
+
+    Returns:
+        tuple: The classes found.
+    """
+    found = []
+    for name in names:
+        module_name, _, attr = name.rpartition(".")
+        module = sys.modules.get(module_name)
+        if module is not None:
+            found.append(getattr(module, attr))
+    return tuple(found)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse an endpoint path to its route template so per-resource calls share a key.
+
+    Args:
+        endpoint (str): Request path, e.g. "/contacts/abc123?x=1".
+
+    Returns:
+        str: The template, e.g. "/contacts/{id}".
+    """
+    segments = [segment for segment in endpoint.split("?", 1)[0].split("/") if segment]
+    if not segments:
+        return "/"
+    return "/" + "/".join([segments[0]] + ["{id}"] * (len(segments) - 1))
+
+
 def handle_request_errors(func):
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except imported_types("httpx.HTTPStatusError") as e:
+                logger.error("HTTPError: %s", e)
+                raise
+            except imported_types("httpx.HTTPError") as e:
+                logger.error("RequestException: %s", e)
+                raise
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTPError: {e}")
+        except imported_types("requests.exceptions.HTTPError") as e:
+            logger.error("HTTPError: %s", e)
             raise
-        except requests.exceptions.RequestException as e:
-            logger.error(f"RequestException: {e}")
+        except imported_types("requests.exceptions.RequestException") as e:
+            logger.error("RequestException: %s", e)
             raise
     return wrapper
@@ -1,32 +1,364 @@
 import time
+import random
+import asyncio
+import inspect
+import threading
+
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from functools import wraps
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 from .logger import logger
 from .exceptions import TransientError
+from .requests import imported_types
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+# Statuses with which the server refuses a request without handling it, so retrying cannot repeat its effect
+REJECTED_STATUS_CODES = (429, 503)
+# Methods that may be repeated without changing the outcome (RFC 9110, section 9.2.2)
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# Resolved lazily so neither HTTP library is imported here
+CONNECTION_ERRORS = ("requests.exceptions.ConnectionError", "httpx.ConnectError", "httpx.ConnectTimeout")
+# requests reports both failed connects and connections dropped mid-request as ConnectionError;
+# only the former carry one of these urllib3 errors as the reason
+CONNECT_REASONS = ("urllib3.exceptions.NewConnectionError", "urllib3.exceptions.ConnectTimeoutError")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value (str, optional): Either a number of seconds or an HTTP date.
+
+    Returns:
+        float | None: The delay in seconds, or None if the header is missing or invalid.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def request_not_sent(error: Exception) -> bool:
+    """
+    Tell whether a connection error happened before the request reached the server
+    (connection refused, DNS failure, connect timeout), as opposed to a connection
+    dropped after the request was written.
+    """
+    if isinstance(error, imported_types("httpx.ConnectError", "httpx.ConnectTimeout")):
+        return True
+    if not isinstance(error, imported_types("requests.exceptions.ConnectionError")) or not error.args:
+        return False
+    return isinstance(getattr(error.args[0], "reason", None), imported_types(*CONNECT_REASONS))
+
+
+class RetryBudget:
+    """
+    Client-wide cap on retry traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one, so
+    retries stay within ``ratio`` of the request rate. A floor of
+    ``min_retries_per_second`` keeps low-traffic clients able to retry at all.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 10.0, max_tokens: float = None):
+        """
+        Args:
+            ratio (float): Share of requests that may be retried (0.2 means 20%).
+            min_retries_per_second (float): Retries always allowed regardless of traffic.
+            max_tokens (float, optional): Upper bound of saved-up retries.
+                Defaults to ten seconds' worth of ``min_retries_per_second``.
+        """
+        if ratio < 0:
+            raise ValueError("ratio must be >= 0")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens if max_tokens is not None else max(min_retries_per_second * 10, 1.0)
+        self._tokens = min(self.max_tokens, max(min_retries_per_second, 1.0))
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_retries_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Try to spend one retry.
+
+        Returns:
+            bool: True if the retry fits in the budget.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryStats:
+    """Thread-safe counters describing retry behaviour."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.give_ups = 0
+        self.budget_exhausted = 0
 
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
 
-def retry(max_retries: int = 3, backoff: int = 2, retry_on: tuple = (502, 503)):
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "give_ups": self.give_ups,
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+
+class RetryPolicy:
+    """
+    Retry policy with capped exponential backoff and full jitter.
+
+    The delay before retry ``n`` (starting at 0) is a random value in
+    ``[0, min(max_delay, base_delay * 2 ** n)]``. A ``Retry-After`` value carried by
+    the error is used as the lower bound of the delay; when it is longer than
+    ``max_delay`` the policy gives up instead of waiting that long.
+
+    Requests with a non-idempotent method (``POST``, ``PATCH``) are only retried
+    when the server cannot have acted on them: on ``non_idempotent_retry_on``
+    statuses, and on connection errors raised before the request was sent.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_on: tuple = RETRYABLE_STATUS_CODES,
+        non_idempotent_retry_on: tuple = REJECTED_STATUS_CODES,
+        retry_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+        budget: RetryBudget = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            max_attempts (int): Total number of attempts, including the first one.
+            base_delay (float): Backoff base in seconds.
+            max_delay (float): Upper bound of the jittered backoff in seconds.
+            retry_on (tuple): HTTP status codes to retry on.
+            non_idempotent_retry_on (tuple): Status codes to retry on for non-idempotent
+                methods; only those in ``retry_on`` as well are retried.
+            retry_connection_errors (bool): Retry on connection errors. For non-idempotent
+                methods, only when the connection could not be made.
+            respect_retry_after (bool): Wait at least as long as the server's ``Retry-After``,
+                giving up when it exceeds ``max_delay``.
+            budget (RetryBudget, optional): Shared retry budget. No limit when omitted.
+            rng (Callable, optional): Source of uniform random numbers in [0, 1).
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = tuple(retry_on)
+        self.non_idempotent_retry_on = tuple(code for code in non_idempotent_retry_on if code in self.retry_on)
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget
+        self.rng = rng
+        self.stats = RetryStats()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> "RetryPolicy":
+        """Build the policy configured through ``Settings``."""
+        from .config import get_settings
+
+        settings = config or get_settings()
+
+        return cls(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY,
+            budget=RetryBudget(
+                ratio=settings.RETRY_BUDGET_RATIO,
+                min_retries_per_second=settings.RETRY_BUDGET_MIN_PER_SECOND,
+            ),
+        )
+
+    def is_retryable(self, error: Exception, method: str = None) -> bool:
+        """
+        Tell whether ``error`` may be retried for a request with ``method``. Calls
+        without a method are treated as idempotent.
+        """
+        idempotent = method is None or method.upper() in IDEMPOTENT_METHODS
+        if isinstance(error, TransientError):
+            return error.status_code in (self.retry_on if idempotent else self.non_idempotent_retry_on)
+        if not self.retry_connection_errors or not isinstance(error, imported_types(*CONNECTION_ERRORS)):
+            return False
+        return idempotent or request_not_sent(error)
+
+    def compute_delay(self, retry_number: int, error: Exception = None) -> float:
+        """
+        Compute the wait before the given retry.
+
+        Args:
+            retry_number (int): Zero-based retry index.
+            error (Exception, optional): The error that triggered the retry.
+
+        Returns:
+            float: Delay in seconds, at most ``max_delay``.
+        """
+        delay = self.rng() * min(self.max_delay, self.base_delay * (2 ** retry_number))
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            delay = min(max(delay, retry_after), self.max_delay)
+        return delay
+
+    def next_delay(self, attempt: int, error: Exception, method: str = None) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt (int): One-based number of the attempt that just failed.
+            error (Exception): The error raised by that attempt.
+            method (str, optional): HTTP method of the request, if any.
+
+        Returns:
+            float | None: Seconds to wait before retrying, or None to give up.
+        """
+        if not self.is_retryable(error, method):
+            return None
+        if attempt >= self.max_attempts:
+            self.stats.increment("give_ups")
+            logger.error("Giving up after %s attempts: %s", attempt, error)
+            return None
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None and retry_after > self.max_delay:
+            self.stats.increment("give_ups")
+            logger.error("Retry-After of %.0fs exceeds the %.0fs maximum delay, not retrying: %s", retry_after, self.max_delay, error)
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            self.stats.increment("budget_exhausted")
+            self.stats.increment("give_ups")
+            logger.error("Retry budget exhausted, not retrying: %s", error)
+            return None
+        self.stats.increment("retries")
+        delay = self.compute_delay(attempt - 1, error)
+        logger.warning("Retrying due to %s in %.2fs (attempt %s/%s)...", error, delay, attempt + 1, self.max_attempts)
+        return delay
+
+    def record_attempt(self, attempt: int) -> None:
+        self.stats.increment("attempts")
+        if attempt == 1 and self.budget is not None:
+            self.budget.deposit()
+
+
+def retry(max_retries: int = 3, backoff: float = 0.5, retry_on: tuple = RETRYABLE_STATUS_CODES, policy: RetryPolicy = None):
     """
     Retry decorator for handling transient errors.
 
+    When the decorated function is a method whose instance has a ``retry_policy``
+    attribute, that policy is used so retry settings and budgets stay per client.
+    If the function takes a ``method`` argument, it is passed to the policy so
+    non-idempotent requests are only retried when that is safe.
+    If the instance defines ``_on_retry(attempt, error, delay, *args, **kwargs)``,
+    it is called with the call's arguments before each retry.
+
     Args:
-        max_retries (int): Maximum number of retries.
-        backoff (int): Backoff time in seconds between retries.
+        max_retries (int): Maximum number of attempts.
+        backoff (float): Base backoff time in seconds.
         retry_on (tuple): HTTP status codes to retry on.
+        policy (RetryPolicy, optional): Explicit policy, overriding the other arguments.
+
+    Raises:
+        Exception: The last error once attempts or the retry budget are exhausted.
     """
+    default_policy = policy or RetryPolicy(max_attempts=max_retries, base_delay=backoff, retry_on=retry_on)
+
+    def resolve(args) -> RetryPolicy:
+        owner_policy = getattr(args[0], "retry_policy", None) if args else None
+        return owner_policy if isinstance(owner_policy, RetryPolicy) else default_policy
+
+    def notify(args, kwargs, attempt: int, error: Exception, delay: float) -> None:
+        on_retry = getattr(args[0], "_on_retry", None) if args else None
+        if on_retry is not None:
+            on_retry(attempt, error, delay, *args[1:], **kwargs)
+
     def decorator(func):
+        parameters = list(inspect.signature(func).parameters)
+        method_index = parameters.index("method") if "method" in parameters else None
+
+        def method_of(args, kwargs) -> Optional[str]:
+            if method_index is None:
+                return None
+            return args[method_index] if len(args) > method_index else kwargs.get("method")
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                active = resolve(args)
+                attempt = 0
+                while True:
+                    attempt += 1
+                    active.record_attempt(attempt)
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = active.next_delay(attempt, e, method_of(args, kwargs))
+                        if delay is None:
+                            raise
+                        notify(args, kwargs, attempt, e, delay)
+                    await asyncio.sleep(delay)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
+            active = resolve(args)
+            attempt = 0
+            while True:
+                attempt += 1
+                active.record_attempt(attempt)
                 try:
                     return func(*args, **kwargs)
-                except TransientError as e:
-                    if e.status_code in retry_on:
-                        logger.warning(f"Retrying due to {e} (attempt {retries + 1}/{max_retries})...")
-                        retries += 1
-                        time.sleep(backoff)
-                    else:
+                except Exception as e:
+                    delay = active.next_delay(attempt, e, method_of(args, kwargs))
+                    if delay is None:
                         raise
-            raise RuntimeError(f"Failed after {max_retries} retries.")
+                    notify(args, kwargs, attempt, e, delay)
+                time.sleep(delay)
         return wrapper
     return decorator
@@ -3,30 +3,53 @@ import json
 import hashlib
 
 from functools import wraps
+from typing import Callable, Dict, Union
 from .logger import logger
 from src.schemas.errors import UnauthorizedError
 
 
-def generate_signature(payload: dict, secret: str) -> str:
+def generate_signature(payload: Union[dict, bytes], secret: str) -> str:
     """
     Generate HMAC signature for a given payload.
 
     Args:
-        payload (dict): The payload to sign.
+        payload (dict | bytes): The payload to sign. Bytes are signed as is, so a body
+            encoded once for sending is never serialized again; dicts are serialized with
+            ``json.dumps`` (compact, ASCII-escaped), independent of the configured codec,
+            so signatures match across peers and SDK versions.
         secret (str): The secret key.
 
     Returns:
         str: Hexadecimal HMAC signature.
     """
     try:
-        # Serialize payload to JSON with stable formatting
-        message = json.dumps(payload, separators=(",", ":")).encode("utf-8")  # Convert to bytes
+        if isinstance(payload, (bytes, bytearray)):
+            message = bytes(payload)
+        else:
+            # Serialize payload to JSON with stable formatting
+            message = json.dumps(payload, separators=(",", ":")).encode("utf-8")  # Convert to bytes
         hmac_instance = hmac.new(secret.encode("utf-8"), message, hashlib.sha256)
         return hmac_instance.hexdigest()
     except Exception as e:
         raise ValueError(f"Error generating signature: {str(e)}")
 
 
+def hmac_signer(secret: str, header: str = "X-Signature") -> Callable[[str, str, bytes], Dict[str, str]]:
+    """
+    Build a ``request_signer`` for the API clients that signs each encoded request body.
+
+    Args:
+        secret (str): The secret key.
+        header (str): Header carrying the hexadecimal signature.
+
+    Returns:
+        Callable: ``signer(method, endpoint, body)`` returning the header to add.
+    """
+    def signer(method: str, endpoint: str, body: bytes) -> Dict[str, str]:
+        return {header: generate_signature(body, secret)}
+    return signer
+
+
 def verify_signature(message: bytes, signature: str, secret: str):
     """
     Validate the HMAC signature of incoming webhooks.
@@ -39,7 +62,7 @@ def verify_signature(message: bytes, signature: str, secret: str):
     Raises:
         UnauthorizedError: If the signature is invalid.
     """
-    logger.info("Validating HMAC signature.")
+    logger.debug("Validating HMAC signature.")
     try:
         # Create HMAC using secret and SHA256
         hmac_instance = hmac.new(secret.encode("utf-8"), message, hashlib.sha256)
@@ -52,9 +75,9 @@ def verify_signature(message: bytes, signature: str, secret: str):
                 message="Unauthorized: Signature validation failed."
             )
 
-        logger.info("HMAC signature validated successfully.")
+        logger.debug("HMAC signature validated successfully.")
         return True
 
     except Exception as e:
-        logger.error(f"Error validating signature: {str(e)}")
+        logger.error("Error validating signature: %s", e)
         raise
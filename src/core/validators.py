@@ -1,31 +1,286 @@
-from pydantic import ValidationError
+import time
+import inspect
+import itertools
+import threading
+from contextvars import ContextVar
+from enum import Enum
+from pydantic import BaseModel, ValidationError
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from .codec import get_codec
+from .hooks import RequestTrace, add_phase, close_trace, current_trace, open_trace
 from .logger import logger
 
 
+class ValidationMode(str, Enum):
+    """
+    How much Pydantic validation the SDK runs.
+
+    - ``strict``: validate every request payload and every response.
+    - ``sampled``: validate every request payload and one ``as_dict`` response in
+      ``sample_rate``; response failures are logged and counted but do not raise.
+    - ``off``: skip request validation, and response validation for ``as_dict`` calls.
+
+    Response validation can only be skipped for ``as_dict`` calls: typed results are
+    always parsed by the model's compiled validator, since that is the cheapest way to
+    build them with nested models and timestamps. Using ``sampled`` or ``off`` for a
+    typed call logs a warning once per mode. Outside ``strict`` mode a response that
+    fails to parse is logged and returned as decoded JSON rather than as a model.
+    """
+    STRICT = "strict"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class ValidationStats:
+    """Thread-safe counters of validated, skipped and failed responses."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.validated = 0
+            self.skipped = 0
+            self.failures = 0
+            self.failures_by_model: Dict[str, int] = {}
+
+    def record(self, outcome: str, model: Any = None) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if outcome == "failures":
+                name = getattr(model, "__name__", str(model))
+                self.failures_by_model[name] = self.failures_by_model.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "validated": self.validated,
+                "skipped": self.skipped,
+                "failures": self.failures,
+                "failures_by_model": dict(self.failures_by_model),
+            }
+
+
+CALL_OPTIONS = ("validation", "as_dict")
+RAW_TYPES = (bytes, bytearray, memoryview)
+
+_config = {"mode": None, "sample_rate": None}
+_call_options: ContextVar[Dict[str, Any]] = ContextVar("validation_call_options", default={})
+_sample_counter = itertools.count()
+_typed_result_warnings = set()
+validation_stats = ValidationStats()
+
+
+def set_validation_mode(mode: Union[ValidationMode, str], sample_rate: int = None) -> None:
+    """
+    Set the process-wide validation mode, overriding ``VALIDATION_MODE``.
+
+    Args:
+        mode (ValidationMode | str): ``"strict"``, ``"sampled"`` or ``"off"``.
+        sample_rate (int, optional): Validate one response in ``sample_rate`` when sampled.
+            Defaults to ``VALIDATION_SAMPLE_RATE``.
+    """
+    if sample_rate is not None and sample_rate < 1:
+        raise ValueError("sample_rate must be >= 1")
+    _config["mode"] = ValidationMode(mode)
+    _config["sample_rate"] = sample_rate
+
+
+def get_validation_mode() -> ValidationMode:
+    """Return the mode in effect: the per-call override, then the global setting."""
+    mode = _call_options.get().get("validation") or _config["mode"]
+    if mode is None:
+        from .config import get_settings
+
+        mode = _config["mode"] = ValidationMode(get_settings().VALIDATION_MODE)
+    return mode
+
+
+def _sample_rate() -> int:
+    if _config["sample_rate"] is None:
+        from .config import get_settings
+
+        _config["sample_rate"] = get_settings().VALIDATION_SAMPLE_RATE
+    return _config["sample_rate"]
+
+
+def _should_sample() -> bool:
+    return next(_sample_counter) % _sample_rate() == 0
+
+
+def raw_response_requested() -> bool:
+    """
+    Tell the API client whether the current call decodes the response itself.
+
+    ``validate_response`` sets this so the client hands over the raw body bytes,
+    which are then parsed once, straight into the model.
+    """
+    return _call_options.get().get("raw_response", False)
+
+
+def _call_override(kwargs: dict, raw_response: bool = False):
+    """
+    Pop the per-call ``validation`` and ``as_dict`` arguments and apply them for the
+    duration of the call, including to decorated methods it calls.
+    """
+    options = {name: kwargs.pop(name) for name in CALL_OPTIONS if name in kwargs}
+    if raw_response:
+        options["raw_response"] = True
+    if not options:
+        return None
+    if options.get("validation") is not None:
+        options["validation"] = ValidationMode(options["validation"])
+    return _call_options.set({**_call_options.get(), **options})
+
+
+def _open_call_trace(args: tuple) -> Tuple[Optional[RequestTrace], Any]:
+    """
+    Join the trace of the call in progress, or start one if the feature's client has
+    hooks. Calls on clients without hooks run without a trace.
+    """
+    if current_trace() is None:
+        client = getattr(args[0], "client", None) if args else None
+        if not getattr(client, "hooks", None):
+            return None, None
+    return open_trace()
+
+
+def serialize_payload(payload: Any) -> Any:
+    """
+    Turn a request payload into the JSON body to send.
+
+    Models are dumped by alias with only the fields that were set; dicts (as left
+    by validation mode ``off``) are sent unchanged.
+    """
+    if isinstance(payload, BaseModel):
+        started = time.perf_counter()
+        body = payload.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        add_phase("serialization", started)
+        return body
+    return payload
+
+
+def validate_payload(model: Any, payload: dict) -> Any:
+    """
+    Validate a single request payload against a Pydantic model.
+
+    Returns:
+        BaseModel: The validated model, ready to be serialized with ``serialize_payload``.
+
+    Raises:
+        ValueError: If the payload does not match the model.
+    """
+    if isinstance(payload, model):
+        return payload
+    try:
+        logger.debug("Validating request payload: %s", payload)
+        return model(**payload)  # Validate the payload
+    except ValidationError as e:
+        logger.error("Request Validation Error: %s", e.json())
+        for error in e.errors():
+            logger.error("Field: %s, Error: %s", error['loc'], error['msg'])
+        raise ValueError("Invalid payload")  # Halt execution here
+
+
+def _check_request(model: Any, kwargs: dict) -> None:
+    if get_validation_mode() is ValidationMode.OFF:
+        return
+    if "payload" in kwargs:
+        logger.debug("Entering validate_request decorator.")
+        kwargs["payload"] = validate_payload(model, kwargs["payload"])
+        logger.debug("Exiting validate_request decorator.")
+    else:
+        logger.warning("No payload provided for validation.")
+
+
+def _check_response(model: Any, response: Any) -> Any:
+    as_dict = _call_options.get().get("as_dict", False)
+    if response is None:
+        return None
+    raw = isinstance(response, RAW_TYPES)
+    mode = get_validation_mode()
+    if as_dict and (mode is ValidationMode.OFF or (mode is ValidationMode.SAMPLED and not _should_sample())):
+        validation_stats.record("skipped")
+        return get_codec().loads(response) if raw else response
+    if mode is not ValidationMode.STRICT and not as_dict and mode not in _typed_result_warnings:
+        _typed_result_warnings.add(mode)
+        logger.warning(
+            "Validation mode %r does not skip validation of typed results; pass as_dict=True to skip it.", mode.value,
+        )
+    # Typed results always come out of the compiled validator: building nested models
+    # any other way is slower in Python and, with ``model_construct``, leaves them as dicts
+    data = response
+    try:
+        if raw and not as_dict:
+            parsed = model.model_validate_json(response)  # Decode and validate in one pass
+        else:
+            data = get_codec().loads(response) if raw else response
+            parsed = model.model_validate(data)
+        validation_stats.record("validated")
+        logger.debug("Exiting validate_response decorator.")
+        return data if as_dict else parsed
+    except ValidationError as e:
+        validation_stats.record("failures", model)
+        logger.error("Response Validation Error: %s", e.json())
+        for error in e.errors():
+            logger.error("Field: %s, Error: %s", error['loc'], error['msg'])
+        if mode is not ValidationMode.STRICT:
+            # Returned as received: a model built from it would be half-typed, or fail for a non-object body
+            return get_codec().loads(response) if raw else response
+        raise ValueError(f"Invalid response: {e}")
+
+
 def validate_request(model: Any):
     """
     Decorator to validate request payloads using a Pydantic model.
     Logs detailed errors for invalid inputs and halts execution.
+    Works on both regular and ``async`` functions.
+
+    The ``payload`` argument is replaced by the validated model, so it is built once
+    and serialized directly into the request body (see ``serialize_payload``).
+    The decorated function accepts extra ``validation`` (``"strict"``, ``"sampled"``
+    or ``"off"``) and ``as_dict`` keyword arguments that apply to that call only.
     """
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                trace, trace_token = _open_call_trace(args)
+                token = _call_override(kwargs)
+                error = None
+                try:
+                    started = time.perf_counter()
+                    _check_request(model, kwargs)
+                    add_phase("validation", started)
+                    return await func(*args, **kwargs)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    if token is not None:
+                        _call_options.reset(token)
+                    close_trace(trace, trace_token, error)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if "payload" in kwargs:
-                try:
-                    logger.debug("Entering validate_request decorator.")
-                    logger.info(f"Validating request payload: {kwargs['payload']}")
-                    model(**kwargs["payload"])  # Validate the payload
-                    logger.debug("Exiting validate_request decorator.")
-                except ValidationError as e:
-                    logger.error(f"Request Validation Error: {e.json()}")
-                    for error in e.errors():
-                        logger.error(f"Field: {error['loc']}, Error: {error['msg']}")
-                    raise ValueError("Invalid payload")  # Halt execution here
-            else:
-                logger.warning("No payload provided for validation.")
-            return func(*args, **kwargs)
+            trace, trace_token = _open_call_trace(args)
+            token = _call_override(kwargs)
+            error = None
+            try:
+                started = time.perf_counter()
+                _check_request(model, kwargs)
+                add_phase("validation", started)
+                return func(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                if token is not None:
+                    _call_options.reset(token)
+                close_trace(trace, trace_token, error)
         return wrapper
     return decorator
 
@@ -34,20 +289,54 @@ def validate_response(model: Any):
     """
     Decorator to validate API responses using a Pydantic model.
     Logs detailed errors for invalid responses.
+    Works on both regular and ``async`` functions.
+
+    The response is parsed once and returned as the model: the client hands over the
+    raw body, which goes straight to ``model_validate_json``. Pass ``as_dict=True`` to
+    get the decoded JSON instead; that is the path ``sampled`` and ``off`` skip.
+    Like ``validate_request``, it accepts a per-call ``validation`` keyword argument.
     """
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                logger.debug("Entering validate_response decorator.")
+                trace, trace_token = _open_call_trace(args)
+                token = _call_override(kwargs, raw_response=True)
+                error = None
+                try:
+                    response = await func(*args, **kwargs)
+                    started = time.perf_counter()
+                    result = _check_response(model, response)
+                    add_phase("decode", started)
+                    return result
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    if token is not None:
+                        _call_options.reset(token)
+                    close_trace(trace, trace_token, error)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             logger.debug("Entering validate_response decorator.")
-            response = func(*args, **kwargs)
+            trace, trace_token = _open_call_trace(args)
+            token = _call_override(kwargs, raw_response=True)
+            error = None
             try:
-                model(**response)  # Validate the response
-                logger.debug("Exiting validate_response decorator.")
-                return response
-            except ValidationError as e:
-                logger.error(f"Response Validation Error: {e.json()}")
-                for error in e.errors():
-                    logger.error(f"Field: {error['loc']}, Error: {error['msg']}")
-                raise ValueError(f"Invalid response: {e}")
+                response = func(*args, **kwargs)
+                started = time.perf_counter()
+                result = _check_response(model, response)
+                add_phase("decode", started)
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                if token is not None:
+                    _call_options.reset(token)
+                close_trace(trace, trace_token, error)
         return wrapper
     return decorator
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Literal, Union, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -67,7 +67,7 @@ class Message(BaseModel):
     Attributes:
         id (str): Unique identifier for the message.
         from_sender (str): Sender's phone number.
-        to (Union[ContactDetails, str]): Recipient details or just contact ID.
+        to (ContactDetails): Recipient details, normalized from a bare contact ID if needed.
         content (str): Message content.
         status (str): Message status, one of 'queued', 'delivered', or 'failed'.
         created_at (datetime): Timestamp when the message was created.
@@ -80,9 +80,9 @@ class Message(BaseModel):
         description="Sender's phone number.", 
         json_schema_extra={"example": "+0987654321"}
     )
-    to: Union[ContactDetails, str] = Field(
+    to: ContactDetails = Field(
         ..., 
-        description="Recipient details or just contact ID."
+        description="Recipient details; a bare contact ID is accepted and normalized."
     )
     content: str = Field(..., description="Message content.", json_schema_extra={"example": "Hello, World!"})
     status: Literal["queued", "delivered", "failed"] = Field(
@@ -103,27 +103,17 @@ class Message(BaseModel):
         json_schema_extra={"example": "2024-12-06T03:01:37.416Z"}
     )
 
+    @field_validator("to", mode="before")
     @classmethod
     def validate_to_field(cls, value):
         """
-        Custom validator for the 'to' field to normalize its structure.
+        Normalize the 'to' field: a bare contact ID becomes a ContactDetails object.
+        Runs inside the compiled validator, so it also applies to ``model_validate_json``.
         """
         if isinstance(value, str):
-            # Treat the string as a contact ID and wrap it in a ContactDetails object
-            return ContactDetails(id=value)
-        elif isinstance(value, dict):
-            # Parse it as a ContactDetails object
-            return ContactDetails(**value)
-        raise ValueError("'to' must be a valid contact ID (str) or ContactDetails object.")
-
-    @classmethod
-    def model_validate(cls, data):
-        """
-        Custom validation for the entire model to preprocess 'to'.
-        """
-        if "to" in data:
-            data["to"] = cls.validate_to_field(data["to"])
-        return super().model_validate(data)
+            # Treat the string as a contact ID
+            return {"id": value}
+        return value
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -1,63 +1,480 @@
-import requests
-from typing import Any
-from src.core.config import settings
+import time
+import asyncio
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
 from src.core.logger import logger
-from src.core.requests import handle_request_errors
-from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, TransientError
-from src.core.retry import retry
+from src.core.requests import handle_request_errors, endpoint_template
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.core.rate_limit import RateLimiter, AdaptiveConcurrencyLimiter
+from src.core.cache import ResponseCache
+from src.core.coalesce import SingleFlight
+from src.core.metrics import MetricsRegistry
+from src.core.hooks import RequestHooks, RequestTrace, add_phase, close_trace, current_trace, open_trace
+from src.core.validators import raw_response_requested
+from src.core.codec import JsonCodec, get_codec
+from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, TransientError, RateLimitError
+from src.core.retry import retry, RetryPolicy, RETRYABLE_STATUS_CODES, parse_retry_after
 
+if TYPE_CHECKING:
+    import httpx
+    from src.core.config import Settings
 
-class ApiClient:
+# HTTP libraries are imported by the client that uses them, not by this module
+_TRANSPORT_MODULES = ("requests", "httpx")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TRANSPORT_MODULES:
+        return importlib.import_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class BaseClient:
     """
-    A base API client for handling HTTP requests with authentication, error handling, 
-    and advanced retry logic for transient errors.
+    Transport-agnostic behaviour shared by the sync and async API clients:
+    configuration, request preparation and error mapping.
     """
 
-    def __init__(self):
+    # Keyword argument of the underlying transport that carries an encoded body
+    _body_argument = "data"
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerRegistry = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        cache: ResponseCache = None,
+        single_flight: SingleFlight = None,
+        codec: JsonCodec = None,
+        request_signer: Callable[[str, str, bytes], Dict[str, str]] = None,
+        config: "Settings" = None,
+        metrics: MetricsRegistry = None,
+        hooks: Sequence[RequestHooks] = None,
+    ):
+        if config is None:
+            from src.core.config import get_settings
+
+            config = get_settings()
+        self.config = config
+        self.base_url = config.BASE_URL
+        self.api_key = config.API_KEY
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(config)
+        if circuit_breakers is None and config.CIRCUIT_BREAKER_ENABLED:
+            circuit_breakers = CircuitBreakerRegistry.from_settings(config)
+        self.circuit_breakers = circuit_breakers
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings(config)
+        self.concurrency_limiter = concurrency_limiter or AdaptiveConcurrencyLimiter.from_settings(config)
+        self.cache = cache or ResponseCache.from_settings(config)
+        self.single_flight = single_flight or SingleFlight.from_settings(config)
+        self.codec = codec or get_codec()
+        self.request_signer = request_signer
+        self.metrics = metrics or MetricsRegistry.from_settings(config)
+        self.hooks: Tuple[RequestHooks, ...] = tuple(hooks or ())
+
+    def retry_stats(self) -> Dict[str, int]:
         """
-        Initialize the API client with configuration and authentication details.
+        Report retry counters for this client.
+
+        Returns:
+            dict: ``attempts``, ``retries``, ``give_ups`` and ``budget_exhausted`` counts.
+        """
+        return self.retry_policy.stats.snapshot()
+
+    def circuit_state(self) -> Dict[str, Dict[str, object]]:
+        """
+        Report the circuit breaker state per endpoint.
+
+        Returns:
+            dict: Breaker snapshots keyed by ``"<METHOD> <endpoint template>"``.
+        """
+        return self.circuit_breakers.snapshot() if self.circuit_breakers is not None else {}
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Report response cache counters for this client.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions``, ``expirations`` and ``invalidations``
+            counts plus the current ``entries`` and ``bytes``; empty when caching is disabled.
+        """
+        return self.cache.snapshot() if self.cache is not None else {}
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """
+        Report request coalescing counters for this client.
+
+        Returns:
+            dict: ``executions`` (GETs actually sent) and ``coalesced`` (GETs that shared
+            an in-flight call); empty when coalescing is disabled.
         """
-        self.base_url = settings.BASE_URL
-        self.api_key = settings.API_KEY
+        return self.single_flight.stats.snapshot() if self.single_flight is not None else {}
 
+    def metrics_stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Report request metrics per endpoint; see ``MetricsRegistry.snapshot``.
 
-    def _handle_api_errors(self, response: requests.Response) -> None:
+        Returns:
+            dict: Readings keyed by ``"<METHOD> <endpoint template>"``; empty when metrics are disabled.
+        """
+        return self.metrics.snapshot() if self.metrics is not None else {}
+
+    def add_hook(self, hook: RequestHooks) -> None:
+        """Register a lifecycle hook for all subsequent calls."""
+        self.hooks = (*self.hooks, hook)
+
+    def _open_trace(self, method: str, endpoint: str) -> Tuple[Optional[RequestTrace], Any]:
+        """
+        Attach this client's hooks to the trace of the call in progress, starting one
+        if the client is called directly. No trace is used when there are no hooks.
+        """
+        if not self.hooks:
+            return None, None
+        trace, token = open_trace()
+        trace.hooks, trace.method, trace.endpoint = self.hooks, method.upper(), endpoint
+        return trace, token
+
+    def _trace_attempt(
+        self, trace: Optional[RequestTrace], sent: Optional[float], received: Optional[float], response: Any,
+    ) -> None:
+        """Add the network and decode time of an attempt to the trace."""
+        if trace is None or sent is None:
+            return
+        now = time.perf_counter()
+        trace.add("network", (received or now) - sent)
+        if received is not None:
+            trace.add("decode", now - received)
+        trace.status = response.status_code if response is not None else None
+
+    def _on_retry(self, attempt: int, error: Exception, delay: float, method: str, endpoint: str, **kwargs) -> None:
+        """Called by ``retry`` before each new attempt of ``_send``."""
+        if self.metrics is not None:
+            self.metrics.record_retry(f"{method.upper()} {endpoint_template(endpoint)}")
+        trace = current_trace()
+        if trace is not None and trace.hooks:
+            trace.error = error
+            trace.emit("on_retry")
+            trace.attempt, trace.status, trace.error = attempt + 1, None, None
+
+    def _start_observation(self, key: str) -> Optional[float]:
+        """Mark a request as in flight and return its start time, or None when metrics are disabled."""
+        if self.metrics is None:
+            return None
+        self.metrics.request_started(key)
+        return time.perf_counter()
+
+    def _observe(
+        self, key: str, started: Optional[float], kwargs: Dict[str, Any], response: Any, error: BaseException = None,
+    ) -> None:
+        """Record a finished request started with ``_start_observation``."""
+        if started is None:
+            return
+        self.metrics.request_finished(
+            key,
+            time.perf_counter() - started,
+            response.status_code if response is not None else "error",
+            bytes_sent=len(kwargs.get(self._body_argument) or b""),
+            bytes_received=len(response.content) if response is not None else 0,
+            transient=isinstance(error, TransientError),
+        )
+
+    def _cache_lookup(
+        self, method: str, endpoint: str, kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[float], Optional[int], Any]:
+        """
+        Serve a GET from the response cache, or invalidate the endpoint before a write.
+
+        Called once per request, before coalescing and retries, so cache hits are not
+        counted as attempts and earn no retry budget.
+
+        Returns:
+            tuple: The TTL to store the response with (None if not cacheable), the cache
+            generation to store it under, and the cached body, if any.
+        """
+        if self.cache is None:
+            return None, None, None
+        if method.upper() != "GET":
+            self.cache.invalidate(endpoint)
+            return None, None, None
+        ttl = None if kwargs.get("params") else self.cache.ttl_for(method, endpoint)
+        if not ttl:
+            return None, None, None
+        generation = self.cache.generation
+        body = self.cache.get(endpoint)
+        if body is None:
+            return ttl, generation, None
+        return ttl, generation, body if raw_response_requested() else self.codec.loads(body)
+
+    def _cache_store(
+        self, method: str, endpoint: str, ttl: Optional[float], generation: Optional[int], result: Any, response: Any,
+    ) -> None:
+        """
+        Cache the raw body of a fresh GET response unless a write invalidated the endpoint
+        while it was fetched, or invalidate the endpoint again once a write completed.
+        """
+        if self.cache is None:
+            return
+        if ttl and result is not None:
+            self.cache.set(endpoint, response.content, ttl, size=len(response.content), generation=generation)
+        elif method.upper() != "GET":
+            self.cache.invalidate(endpoint)
+
+    def _admit(self, key: str) -> Tuple[Optional[CircuitBreaker], Optional[int], float]:
+        """
+        Run the admission checks before sending a request: the endpoint's circuit
+        breaker first, so rejected calls do not consume rate-limit tokens, then the
+        rate limiter.
+
+        Returns:
+            tuple: The breaker (if any), its ticket for the call and the seconds to wait before sending.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call.
+        """
+        breaker = ticket = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(key)
+            ticket = breaker.before_call()
+        try:
+            delay = self.rate_limiter.acquire(self.api_key, key) if self.rate_limiter is not None else 0.0
+        except BaseException:
+            if breaker is not None:
+                breaker.cancel(ticket)
+            raise
+        return breaker, ticket, delay
+
+    def _complete(
+        self, key: str, breaker: Optional[CircuitBreaker], ticket: Optional[int], error: BaseException = None,
+        sent: bool = True, acquired: bool = True,
+    ) -> None:
+        """
+        Feed the outcome of an admitted request back to the breaker and the limiters.
+        Requests that were never ``sent``, or were cancelled (``KeyboardInterrupt``,
+        ``asyncio.CancelledError``), only free their slots; the concurrency slot is
+        only given back if it was ``acquired``.
+        """
+        if breaker is not None:
+            if sent and (error is None or isinstance(error, Exception)):
+                breaker.record(error, ticket)
+            else:
+                breaker.cancel(ticket)
+        if isinstance(error, RateLimitError) and error.retry_after and self.rate_limiter is not None:
+            self.rate_limiter.pause(self.api_key, key, error.retry_after)
+        if acquired and self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(
+                overloaded=isinstance(error, TransientError), succeeded=sent and error is None,
+            )
+
+    def _encode_body(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encode a ``json=`` body to bytes exactly once, before any retry, and pass the
+        same bytes to the ``request_signer`` so they are signed as sent.
+
+        Returns:
+            dict: The transport arguments, with the body under ``_body_argument``.
+        """
+        if "json" in kwargs:
+            kwargs[self._body_argument] = self.codec.dumps(kwargs.pop("json"))
+        if self.request_signer is not None:
+            body = kwargs.get(self._body_argument) or b""
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.request_signer(method, endpoint, body)}
+        return kwargs
+
+    def _prepare(self, endpoint: str, headers: Dict[str, str] = None) -> Tuple[str, Dict[str, str]]:
+        """
+        Build the absolute URL and the authenticated headers for a request.
+
+        Args:
+            endpoint (str): The API endpoint path (e.g., "/contacts").
+            headers (dict, optional): Extra headers supplied by the caller.
+
+        Returns:
+            tuple: The URL and the headers to send.
+        """
+        headers = headers or {}
+        headers["Authorization"] = f"Bearer {self.api_key}"
+        headers["Content-Type"] = "application/json"
+        return f"{self.base_url}{endpoint}", headers
+
+    def _handle_api_errors(self, response: Any) -> None:
         """
         Handle API errors based on the HTTP status code.
 
         Args:
-            response (requests.Response): The HTTP response object.
+            response (requests.Response | httpx.Response): The HTTP response object.
 
         Raises:
             UnauthorizedError: For 401 Unauthorized.
             NotFoundError: For 404 Not Found.
-            TransientError: For retryable server errors like 502 or 503.
+            RateLimitError: For 429 Too Many Requests.
+            TransientError: For retryable errors like 502, 503 or 504.
             ServerError: For other 500+ server errors.
             ApiError: Generic API error for unexpected status codes.
         """
         if response.status_code == 401:
-            logger.error(f"Unauthorized: {response.text}")
+            logger.error("Unauthorized: %s", response.text)
             raise UnauthorizedError("Unauthorized. Check your API key.")
         if response.status_code == 404:
-            logger.error(f"Resource Not Found: {response.text}")
+            logger.error("Resource Not Found: %s", response.text)
             raise NotFoundError("Resource not found.")
-        if response.status_code in (502, 503):
-            logger.warning(f"Transient Error: {response.text}")
-            raise TransientError("Transient server error. Please retry.", status_code=response.status_code)
+        if response.status_code == 429:
+            logger.warning("Rate Limited: %s", response.text)
+            raise RateLimitError(retry_after=parse_retry_after(response.headers.get("Retry-After")))
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            logger.warning("Transient Error: %s", response.text)
+            raise TransientError(
+                "Transient server error. Please retry.",
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
         if response.status_code >= 500:
-            logger.error(f"Server Error: {response.text}")
+            logger.error("Server Error: %s", response.text)
             raise ServerError("Server error. Please try again later.")
-        if not response.ok:
-            logger.error(f"Unhandled API Error: {response.status_code} - {response.text}")
+        if response.status_code >= 400:
+            logger.error("Unhandled API Error: %s - %s", response.status_code, response.text)
             raise ApiError(f"Unhandled API Error: {response.status_code}: {response.text}")
 
+    def _parse(self, response: Any) -> Any:
+        """
+        Map the HTTP response to the SDK result: ``None`` for deletions, otherwise the
+        decoded JSON body, or the raw body bytes when the caller decodes them itself
+        (see ``raw_response_requested``).
+        """
+        # Handle deletion api
+        if response.status_code == 204:
+            logger.debug("Item successfully deleted.")
+            return None
+
+        # Handle API errors
+        self._handle_api_errors(response)
+        return response.content if raw_response_requested() else response.json()
+
+
+class ApiClient(BaseClient):
+    """
+    A base API client for handling HTTP requests with authentication, error handling,
+    and advanced retry logic for transient errors.
+
+    The client owns a pooled ``requests.Session`` so connections are kept alive and
+    reused between calls. Call ``close()`` when done, or use the client as a context
+    manager.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        pool_block: bool = None,
+        timeout: tuple = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerRegistry = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        cache: ResponseCache = None,
+        single_flight: SingleFlight = None,
+        codec: JsonCodec = None,
+        request_signer: Callable[[str, str, bytes], Dict[str, str]] = None,
+        config: "Settings" = None,
+        metrics: MetricsRegistry = None,
+        hooks: Sequence[RequestHooks] = None,
+    ):
+        """
+        Initialize the API client with configuration and authentication details.
+
+        Args:
+            pool_connections (int, optional): Number of per-host pools to cache.
+                Defaults to ``settings.HTTP_POOL_CONNECTIONS``.
+            pool_maxsize (int, optional): Maximum connections kept per host.
+                Defaults to ``settings.HTTP_POOL_MAXSIZE``.
+            pool_block (bool, optional): Block when a host has no free connection instead
+                of opening a throwaway one. Defaults to ``settings.HTTP_POOL_BLOCK``.
+            timeout (tuple, optional): ``(connect, read)`` timeouts in seconds.
+                Defaults to ``settings.HTTP_CONNECT_TIMEOUT`` and ``settings.HTTP_READ_TIMEOUT``.
+            retry_policy (RetryPolicy, optional): Retry behaviour and budget for this client.
+                Defaults to ``RetryPolicy.from_settings()``.
+            circuit_breakers (CircuitBreakerRegistry, optional): Per-endpoint breakers.
+                Built from settings when ``CIRCUIT_BREAKER_ENABLED`` is true.
+            rate_limiter (RateLimiter, optional): Token buckets per API key and endpoint.
+                Built from settings when ``RATE_LIMIT_PER_SECOND`` is set.
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): AIMD in-flight limit.
+                Built from settings when ``ADAPTIVE_CONCURRENCY_ENABLED`` is true.
+            cache (ResponseCache, optional): TTL+LRU cache of single-resource GETs.
+                Built from settings when ``CACHE_ENABLED`` is true.
+            single_flight (SingleFlight, optional): Coalescer sharing identical in-flight GETs.
+                Built from settings when ``COALESCE_GET_REQUESTS`` is true.
+            codec (JsonCodec, optional): Encoder of ``json=`` bodies. Defaults to the
+                process-wide codec (``JSON_CODEC``).
+            request_signer (Callable, optional): ``signer(method, endpoint, body)`` returning
+                extra headers, called once per request with the exact encoded body bytes.
+            config (Settings, optional): Explicit configuration for this client and the
+                components it builds. Defaults to the process-wide settings, loaded from
+                the environment on first use.
+            metrics (MetricsRegistry, optional): Per-endpoint latency, status, retry and
+                byte metrics. Built from settings when ``METRICS_ENABLED`` is true.
+            hooks (Sequence[RequestHooks], optional): Lifecycle hooks called with a
+                ``RequestTrace`` holding per-phase timings of each call.
+        """
+        super().__init__(
+            retry_policy, circuit_breakers, rate_limiter, concurrency_limiter, cache, single_flight, codec,
+            request_signer, config, metrics, hooks,
+        )
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        config = self.config
+        self.timeout = timeout or (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+        self.pool_maxsize = pool_maxsize or config.HTTP_POOL_MAXSIZE
+
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections or config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=config.HTTP_POOL_BLOCK if pool_block is None else pool_block,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release all pooled connections.
+        """
+        self.session.close()
+        logger.debug("ApiClient session closed.")
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Report connection pool usage across all hosts.
+
+        Returns:
+            dict: ``in_use``, ``idle`` and ``created`` connection counts, plus the number
+            of host ``pools`` and the configured per-host ``maxsize``.
+        """
+        stats = {"pools": 0, "in_use": 0, "idle": 0, "created": 0, "maxsize": self.pool_maxsize}
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            stats["pools"] += 1
+            stats["idle"] += idle
+            stats["in_use"] += max(pool.pool.maxsize - pool.pool.qsize(), 0)
+            stats["created"] += pool.num_connections
+        return stats
 
-    @retry(max_retries=3, backoff=2, retry_on=(502, 503))
-    @handle_request_errors
     def request(self, method: str, endpoint: str, **kwargs) -> Any:
         """
         Sends an HTTP request to the API server with retry and error handling.
 
+        Identical GETs issued concurrently from several threads share one call. Registered
+        hooks are called around it with a ``RequestTrace``.
+
         Args:
             method (str): The HTTP method (GET, POST, etc.).
             endpoint (str): The API endpoint path (e.g., "/contacts").
@@ -67,22 +484,244 @@ class ApiClient:
             dict: The JSON response from the API.
 
         Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
             ApiError: For unexpected errors during the request.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self.api_key}"
-        headers["Content-Type"] = "application/json"
+        trace, token = self._open_trace(method, endpoint)
+        try:
+            ttl, generation, cached = self._cache_lookup(method, endpoint, kwargs)
+            if cached is not None:
+                logger.debug("Serving %s %s from cache", method, endpoint)
+                close_trace(trace, token)
+                return cached
+            key = SingleFlight.key_for(method, endpoint, kwargs) if self.single_flight is not None else None
+            if key is not None:
+                key += (raw_response_requested(),)
+            started = time.perf_counter()
+            kwargs = self._encode_body(method, endpoint, kwargs)
+            add_phase("serialization", started)
+            if key is None:
+                result = self._send(method, endpoint, ttl=ttl, generation=generation, **kwargs)
+            else:
+                result = self.single_flight.do(
+                    key, lambda: self._send(method, endpoint, ttl=ttl, generation=generation, **kwargs),
+                )
+        except BaseException as e:
+            close_trace(trace, token, e)
+            raise
+        close_trace(trace, token)
+        return result
 
-        logger.info(f"Sending {method} request to {url} with headers {headers} and payload {kwargs}")
-        response = requests.request(method, url, headers=headers, **kwargs)
-        logger.info(f"Received response with status {response.status_code}")
-        
-        # Handle deletion api
-        if response.status_code == 204:
-            logger.info(f"Item successfully deleted.")
-            return None
+    @retry()
+    @handle_request_errors
+    def _send(
+        self, method: str, endpoint: str, ttl: Optional[float] = None, generation: Optional[int] = None, **kwargs,
+    ) -> Any:
+        url, headers = self._prepare(endpoint, kwargs.pop("headers", None))
+        kwargs.setdefault("timeout", self.timeout)
 
-        # Handle API errors
-        self._handle_api_errors(response)
-        return response.json()
+        logger.debug("Sending %s request to %s", method, url)
+        key = f"{method.upper()} {endpoint_template(endpoint)}"
+        trace = current_trace()
+        breaker = ticket = response = received = started = sent = None
+        acquired = False
+        try:
+            breaker, ticket, delay = self._admit(key)
+            if delay > 0:
+                time.sleep(delay)
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.acquire()
+                acquired = True
+            if trace is not None:
+                trace.emit("before_request")
+            started = self._start_observation(key)
+            sent = time.perf_counter()
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            received = time.perf_counter()
+            logger.debug("Received response with status %s", response.status_code)
+            result = self._parse(response)
+        except BaseException as e:
+            self._trace_attempt(trace, sent, received, response)
+            self._complete(key, breaker, ticket, e, sent=sent is not None, acquired=acquired)
+            self._observe(key, started, kwargs, response, e)
+            raise
+        self._trace_attempt(trace, sent, received, response)
+        self._complete(key, breaker, ticket)
+        self._observe(key, started, kwargs, response)
+        self._cache_store(method, endpoint, ttl, generation, result, response)
+        return result
+
+
+class AsyncApiClient(BaseClient):
+    """
+    Asyncio counterpart of ``ApiClient`` built on a pooled ``httpx.AsyncClient``.
+
+    It shares configuration and error mapping with ``ApiClient``, and waits between
+    retries without blocking the event loop. Use ``await client.aclose()`` or
+    ``async with AsyncApiClient() as client`` to release connections.
+    """
+
+    _body_argument = "content"
+
+    def __init__(
+        self,
+        max_connections: int = None,
+        max_keepalive_connections: int = None,
+        timeout: tuple = None,
+        transport: "httpx.AsyncBaseTransport" = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breakers: CircuitBreakerRegistry = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        cache: ResponseCache = None,
+        single_flight: SingleFlight = None,
+        codec: JsonCodec = None,
+        request_signer: Callable[[str, str, bytes], Dict[str, str]] = None,
+        config: "Settings" = None,
+        metrics: MetricsRegistry = None,
+        hooks: Sequence[RequestHooks] = None,
+    ):
+        """
+        Initialize the async API client.
+
+        Args:
+            max_connections (int, optional): Maximum concurrent connections.
+                Defaults to ``settings.HTTP_MAX_CONNECTIONS``.
+            max_keepalive_connections (int, optional): Idle connections kept alive.
+                Defaults to ``settings.HTTP_POOL_MAXSIZE``.
+            timeout (tuple, optional): ``(connect, read)`` timeouts in seconds.
+                Defaults to ``settings.HTTP_CONNECT_TIMEOUT`` and ``settings.HTTP_READ_TIMEOUT``.
+            transport (httpx.AsyncBaseTransport, optional): Custom transport, mainly for testing.
+            retry_policy (RetryPolicy, optional): Retry behaviour and budget for this client.
+                Defaults to ``RetryPolicy.from_settings()``.
+            circuit_breakers (CircuitBreakerRegistry, optional): Per-endpoint breakers.
+                Built from settings when ``CIRCUIT_BREAKER_ENABLED`` is true.
+            rate_limiter (RateLimiter, optional): Token buckets per API key and endpoint.
+                Built from settings when ``RATE_LIMIT_PER_SECOND`` is set.
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): AIMD in-flight limit.
+                Built from settings when ``ADAPTIVE_CONCURRENCY_ENABLED`` is true.
+            cache (ResponseCache, optional): TTL+LRU cache of single-resource GETs.
+                Built from settings when ``CACHE_ENABLED`` is true.
+            single_flight (SingleFlight, optional): Coalescer sharing identical in-flight GETs.
+                Built from settings when ``COALESCE_GET_REQUESTS`` is true.
+            codec (JsonCodec, optional): Encoder of ``json=`` bodies. Defaults to the
+                process-wide codec (``JSON_CODEC``).
+            request_signer (Callable, optional): ``signer(method, endpoint, body)`` returning
+                extra headers, called once per request with the exact encoded body bytes.
+            config (Settings, optional): Explicit configuration for this client and the
+                components it builds. Defaults to the process-wide settings, loaded from
+                the environment on first use.
+            metrics (MetricsRegistry, optional): Per-endpoint latency, status, retry and
+                byte metrics. Built from settings when ``METRICS_ENABLED`` is true.
+            hooks (Sequence[RequestHooks], optional): Lifecycle hooks called with a
+                ``RequestTrace`` holding per-phase timings of each call.
+        """
+        super().__init__(
+            retry_policy, circuit_breakers, rate_limiter, concurrency_limiter, cache, single_flight, codec,
+            request_signer, config, metrics, hooks,
+        )
+        import httpx
+
+        config = self.config
+        connect_timeout, read_timeout = timeout or (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections or config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive_connections or config.HTTP_POOL_MAXSIZE,
+        )
+        self.session = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, transport=transport)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying ``httpx.AsyncClient`` and release all pooled connections.
+        """
+        await self.session.aclose()
+        logger.debug("AsyncApiClient session closed.")
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """
+        Sends an HTTP request to the API server with retry and error handling.
+
+        Identical GETs awaited concurrently by several tasks share one call. Registered
+        hooks are called around it with a ``RequestTrace``.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            endpoint (str): The API endpoint path (e.g., "/contacts").
+            **kwargs: Additional arguments for ``httpx.AsyncClient.request``.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            ApiError: For unexpected errors during the request.
+        """
+        trace, token = self._open_trace(method, endpoint)
+        try:
+            ttl, generation, cached = self._cache_lookup(method, endpoint, kwargs)
+            if cached is not None:
+                logger.debug("Serving %s %s from cache", method, endpoint)
+                close_trace(trace, token)
+                return cached
+            key = SingleFlight.key_for(method, endpoint, kwargs) if self.single_flight is not None else None
+            if key is not None:
+                key += (raw_response_requested(),)
+            started = time.perf_counter()
+            kwargs = self._encode_body(method, endpoint, kwargs)
+            add_phase("serialization", started)
+            if key is None:
+                result = await self._send(method, endpoint, ttl=ttl, generation=generation, **kwargs)
+            else:
+                result = await self.single_flight.do_async(
+                    key, lambda: self._send(method, endpoint, ttl=ttl, generation=generation, **kwargs),
+                )
+        except BaseException as e:
+            close_trace(trace, token, e)
+            raise
+        close_trace(trace, token)
+        return result
+
+    @retry()
+    @handle_request_errors
+    async def _send(
+        self, method: str, endpoint: str, ttl: Optional[float] = None, generation: Optional[int] = None, **kwargs,
+    ) -> Any:
+        url, headers = self._prepare(endpoint, kwargs.pop("headers", None))
+
+        logger.debug("Sending %s request to %s", method, url)
+        key = f"{method.upper()} {endpoint_template(endpoint)}"
+        trace = current_trace()
+        breaker = ticket = response = received = started = sent = None
+        acquired = False
+        try:
+            breaker, ticket, delay = self._admit(key)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.concurrency_limiter is not None:
+                await self.concurrency_limiter.acquire_async()
+                acquired = True
+            if trace is not None:
+                trace.emit("before_request")
+            started = self._start_observation(key)
+            sent = time.perf_counter()
+            response = await self.session.request(method, url, headers=headers, **kwargs)
+            received = time.perf_counter()
+            logger.debug("Received response with status %s", response.status_code)
+            result = self._parse(response)
+        except BaseException as e:
+            self._trace_attempt(trace, sent, received, response)
+            self._complete(key, breaker, ticket, e, sent=sent is not None, acquired=acquired)
+            self._observe(key, started, kwargs, response, e)
+            raise
+        self._trace_attempt(trace, sent, received, response)
+        self._complete(key, breaker, ticket)
+        self._observe(key, started, kwargs, response)
+        self._cache_store(method, endpoint, ttl, generation, result, response)
+        return result
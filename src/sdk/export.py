@@ -0,0 +1,193 @@
+import os
+import csv
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence
+
+from src.core.logger import logger
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+class ExportResult(NamedTuple):
+    """
+    Summary of a finished export.
+
+    Attributes:
+        written (int): Records written to the output, including those of resumed runs.
+        duplicates (int): Records dropped because they were already written.
+        pages (int): Last page read.
+        resumed (bool): True if the export continued from a checkpoint.
+    """
+    written: int
+    duplicates: int
+    pages: int
+    resumed: bool
+
+
+class ExportCheckpoint:
+    """
+    JSON checkpoint of an export, written atomically after every page.
+
+    It stores the next page to read, the output size at that point and the ids of
+    the last pages written, so a resumed export truncates any partially written
+    page and keeps dropping records that shift across page boundaries.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Location of the checkpoint file.
+        """
+        self.path = path
+
+    def load(self) -> Dict[str, Any]:
+        """Return the saved state, or an empty dict if there is none."""
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, state: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _csv_value(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+
+def _write_records(f, output_format: str, records: Sequence[Dict], fieldnames: List[str]) -> None:
+    if output_format == "ndjson":
+        f.writelines(json.dumps(record, default=str) + "\n" for record in records)
+        return
+    if not records or fieldnames is None:
+        # No columns known yet: the header is written with the first record
+        return
+    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+    if f.tell() == 0:
+        writer.writeheader()
+    writer.writerows({key: _csv_value(value) for key, value in record.items()} for record in records)
+
+
+def export_records(
+    fetch_page: Callable[[int], Sequence[Dict]],
+    output_path: str,
+    output_format: str = "ndjson",
+    page_size: int = 100,
+    workers: int = 4,
+    checkpoint_path: str = None,
+    key: str = "id",
+    fieldnames: List[str] = None,
+    dedup_pages: int = 2,
+) -> ExportResult:
+    """
+    Export every record of a paginated endpoint to a file.
+
+    Up to ``workers`` consecutive pages are fetched concurrently and written in page
+    order, so memory holds at most ``workers`` pages. A record whose ``key`` was
+    already written in one of the last ``dedup_pages`` pages is dropped, which
+    absorbs records that move to the next page when the listing shifts during the
+    crawl. With ``checkpoint_path`` set, progress is saved after each page and an
+    interrupted export resumes where it stopped; the checkpoint is removed once the
+    export completes.
+
+    Args:
+        fetch_page (Callable[[int], Sequence[dict]]): Returns the records of a page number.
+        output_path (str): File to write.
+        output_format (str): ``"ndjson"`` or ``"csv"``. Defaults to ``"ndjson"``.
+        page_size (int): Records requested per page. Defaults to 100.
+        workers (int): Pages fetched concurrently. Defaults to 4.
+        checkpoint_path (str, optional): Checkpoint file enabling resumption.
+        key (str): Record field identifying duplicates. Defaults to ``"id"``.
+        fieldnames (list, optional): CSV columns. Defaults to the keys of the first record.
+        dedup_pages (int): Number of previous pages checked for duplicates. Defaults to 2.
+
+    Returns:
+        ExportResult: Counts of written and dropped records.
+
+    Raises:
+        ValueError: If the format, page size or worker count is invalid.
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"output_format must be one of {EXPORT_FORMATS}")
+    if page_size < 1 or workers < 1:
+        raise ValueError("page_size and workers must be >= 1")
+
+    checkpoint = ExportCheckpoint(checkpoint_path) if checkpoint_path else None
+    state = checkpoint.load() if checkpoint else {}
+    resumed = bool(state)
+    page = state.get("next_page", 1)
+    written = state.get("written", 0)
+    duplicates = state.get("duplicates", 0)
+    fieldnames = fieldnames or state.get("fieldnames")
+    recent = deque((set(ids) for ids in state.get("recent_ids", [])), maxlen=max(dedup_pages, 1))
+    if resumed:
+        logger.info("Resuming export to %s at page %s (%s records written)", output_path, page, written)
+
+    mode = "r+" if resumed and os.path.exists(output_path) else "w"
+    pending = deque()
+    exhausted = False
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+    try:
+        with open(output_path, mode, encoding="utf-8", newline="") as f:
+            f.seek(state.get("offset", 0) if mode == "r+" else 0)
+            f.truncate()
+            next_page = page
+            while True:
+                while not exhausted and len(pending) < workers:
+                    pending.append(pool.submit(fetch_page, next_page))
+                    next_page += 1
+                if not pending:
+                    break
+                records = pending.popleft().result()
+
+                fresh, page_ids = [], set()
+                for record in records:
+                    record_id = record.get(key)
+                    if record_id is not None and (record_id in page_ids or any(record_id in ids for ids in recent)):
+                        duplicates += 1
+                        continue
+                    page_ids.add(record_id)
+                    fresh.append(record)
+                if output_format == "csv" and fieldnames is None and fresh:
+                    fieldnames = list(fresh[0].keys())
+                _write_records(f, output_format, fresh, fieldnames)
+                written += len(fresh)
+                recent.append(page_ids)
+
+                if len(records) < page_size:
+                    exhausted = True
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                else:
+                    page += 1
+                if checkpoint and not exhausted:
+                    f.flush()
+                    checkpoint.save({
+                        "next_page": page,
+                        "offset": f.tell(),
+                        "written": written,
+                        "duplicates": duplicates,
+                        "fieldnames": fieldnames,
+                        "recent_ids": [sorted(ids, key=str) for ids in recent],
+                    })
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+    if checkpoint:
+        checkpoint.clear()
+    logger.info("Exported %s records to %s (%s duplicates dropped)", written, output_path, duplicates)
+    return ExportResult(written=written, duplicates=duplicates, pages=page, resumed=resumed)
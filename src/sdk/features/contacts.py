@@ -1,10 +1,12 @@
-from typing import Dict, List
-from httpx import HTTPStatusError
+from typing import AsyncIterator, Callable, Dict, Iterator, List
 
-from ..client import ApiClient
+from ..client import ApiClient, AsyncApiClient
+from ..export import ExportResult, export_records
+from ..pagination import iter_records, aiter_records
 from src.schemas.contacts import CreateContactRequest, Contact, ListContactsResponse
-from src.core.validators import validate_request, validate_response
+from src.core.validators import validate_request, validate_response, serialize_payload
 from src.core.exceptions import handle_exceptions, handle_404_error
+from src.core.requests import imported_types
 from src.core.logger import logger
 
 
@@ -37,8 +39,8 @@ class Contacts:
         Returns:
             Contact: The created contact details.
         """
-        logger.info(f"Creating contact with payload: {payload}")
-        return self.client.request("POST", "/contacts", json=payload)
+        logger.debug("Creating contact with payload: %s", payload)
+        return self.client.request("POST", "/contacts", json=serialize_payload(payload))
 
 
     @validate_response(ListContactsResponse)
@@ -55,9 +57,70 @@ class Contacts:
             ListContactsResponse: A paginated list of contacts.
         """
         params = {"pageIndex": page, "max": max}
-        logger.info(f"Listing contacts with params: {params}")
+        logger.debug("Listing contacts with params: %s", params)
         return self.client.request("GET", "/contacts", params=params)
 
+    def iter_contacts(
+        self,
+        page_size: int = 10,
+        start_page: int = 1,
+        max_items: int = None,
+        stop: Callable[[Contact], bool] = None,
+        prefetch: bool = True,
+        as_dict: bool = False,
+    ) -> Iterator[Contact]:
+        """
+        Iterate over all contacts, fetching pages lazily.
+
+        The next page is requested in the background while the current one is consumed.
+
+        Args:
+            page_size (int): Contacts per page. Defaults to 10.
+            start_page (int): First page to read. Defaults to 1.
+            max_items (int, optional): Stop after this many contacts.
+            stop (Callable, optional): Stop (without yielding) at the first contact for which it returns True.
+            prefetch (bool): Fetch the next page in the background. Defaults to True.
+            as_dict (bool): Yield dicts instead of ``Contact`` models. Defaults to False.
+
+        Yields:
+            Contact: Contacts in page order.
+        """
+        def fetch_page(page: int):
+            result = self.list_contacts(page=page, max=page_size, as_dict=as_dict)
+            return result["contactsList"] if as_dict else result.contacts
+
+        return iter_records(
+            fetch_page, page_size, start_page=start_page, max_items=max_items, stop=stop, prefetch=prefetch,
+        )
+
+    def export_contacts(
+        self,
+        output_path: str,
+        output_format: str = "ndjson",
+        page_size: int = 100,
+        workers: int = 4,
+        checkpoint_path: str = None,
+    ) -> ExportResult:
+        """
+        Export all contacts to an NDJSON or CSV file, fetching pages concurrently.
+
+        See ``src.sdk.export.export_records`` for deduplication and resumption.
+
+        Args:
+            output_path (str): File to write.
+            output_format (str): ``"ndjson"`` or ``"csv"``. Defaults to ``"ndjson"``.
+            page_size (int): Contacts per page. Defaults to 100.
+            workers (int): Pages fetched concurrently. Defaults to 4.
+            checkpoint_path (str, optional): Checkpoint file used to resume an interrupted export.
+
+        Returns:
+            ExportResult: Counts of written and dropped contacts.
+        """
+        return export_records(
+            lambda page: self.list_contacts(page=page, max=page_size, as_dict=True)["contactsList"], output_path,
+            output_format=output_format, page_size=page_size, workers=workers, checkpoint_path=checkpoint_path,
+        )
+
     @validate_response(Contact)
     @handle_exceptions
     def get_contact(self, contact_id: str) -> Contact:
@@ -70,10 +133,10 @@ class Contacts:
         Returns:
             Contact: The retrieved contact details.
         """
-        logger.info(f"Fetching contact with ID: {contact_id}")
+        logger.debug("Fetching contact with ID: %s", contact_id)
         try:
             return self.client.request("GET", f"/contacts/{contact_id}")
-        except HTTPStatusError as e:
+        except imported_types("httpx.HTTPStatusError") as e:
             handle_404_error(e, contact_id, "Contact")
 
     @validate_request(CreateContactRequest)
@@ -90,10 +153,10 @@ class Contacts:
         Returns:
             Contact: The updated contact details.
         """
-        logger.info(f"Updating contact {contact_id} with payload: {payload}")
+        logger.debug("Updating contact %s with payload: %s", contact_id, payload)
         try:
-            return self.client.request("PATCH", f"/contacts/{contact_id}", json=payload)
-        except HTTPStatusError as e:
+            return self.client.request("PATCH", f"/contacts/{contact_id}", json=serialize_payload(payload))
+        except imported_types("httpx.HTTPStatusError") as e:
             handle_404_error(e, contact_id, "Contact")
 
     @handle_exceptions
@@ -107,9 +170,146 @@ class Contacts:
         Returns:
             None
         """
-        logger.info(f"Deleting contact with ID: {contact_id}")
+        logger.debug("Deleting contact with ID: %s", contact_id)
         try:
             self.client.request("DELETE", f"/contacts/{contact_id}")
-            logger.info(f"Successfully deleted contact with ID: {contact_id}")
-        except HTTPStatusError as e:
+            logger.debug("Successfully deleted contact with ID: %s", contact_id)
+        except imported_types("httpx.HTTPStatusError") as e:
+            handle_404_error(e, contact_id, "Contact")
+
+
+class AsyncContacts:
+    """
+    Asyncio Contacts SDK module, mirroring ``Contacts`` on top of ``AsyncApiClient``.
+
+    Provides coroutine methods for creating, listing, retrieving, updating, and deleting contacts.
+    """
+
+    def __init__(self, client: AsyncApiClient):
+        """
+        Initialize the AsyncContacts module.
+
+        Args:
+            client (AsyncApiClient): The shared async API client instance.
+        """
+        self.client = client
+
+    @validate_request(CreateContactRequest)
+    @validate_response(Contact)
+    @handle_exceptions
+    async def create_contact(self, payload: Dict) -> Contact:
+        """
+        Create a new contact in the system.
+
+        Args:
+            payload (dict): A dictionary containing 'name' and 'phone'.
+
+        Returns:
+            Contact: The created contact details.
+        """
+        logger.debug("Creating contact with payload: %s", payload)
+        return await self.client.request("POST", "/contacts", json=serialize_payload(payload))
+
+    @validate_response(ListContactsResponse)
+    @handle_exceptions
+    async def list_contacts(self, page: int = 1, max: int = 10) -> ListContactsResponse:
+        """
+        List all contacts with pagination.
+
+        Args:
+            page (int): The page number to retrieve. Defaults to 1.
+            max (int): The maximum number of contacts per page. Defaults to 10.
+
+        Returns:
+            ListContactsResponse: A paginated list of contacts.
+        """
+        params = {"pageIndex": page, "max": max}
+        logger.debug("Listing contacts with params: %s", params)
+        return await self.client.request("GET", "/contacts", params=params)
+
+    def iter_contacts(
+        self,
+        page_size: int = 10,
+        start_page: int = 1,
+        max_items: int = None,
+        stop: Callable[[Contact], bool] = None,
+        prefetch: bool = True,
+        as_dict: bool = False,
+    ) -> AsyncIterator[Contact]:
+        """
+        Asynchronously iterate over all contacts, fetching pages lazily.
+
+        Args:
+            page_size (int): Contacts per page. Defaults to 10.
+            start_page (int): First page to read. Defaults to 1.
+            max_items (int, optional): Stop after this many contacts.
+            stop (Callable, optional): Stop (without yielding) at the first contact for which it returns True.
+            prefetch (bool): Fetch the next page concurrently. Defaults to True.
+            as_dict (bool): Yield dicts instead of ``Contact`` models. Defaults to False.
+
+        Yields:
+            Contact: Contacts in page order.
+        """
+        async def fetch_page(page: int):
+            result = await self.list_contacts(page=page, max=page_size, as_dict=as_dict)
+            return result["contactsList"] if as_dict else result.contacts
+
+        return aiter_records(
+            fetch_page, page_size, start_page=start_page, max_items=max_items, stop=stop, prefetch=prefetch,
+        )
+
+    @validate_response(Contact)
+    @handle_exceptions
+    async def get_contact(self, contact_id: str) -> Contact:
+        """
+        Retrieve a specific contact by ID.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+
+        Returns:
+            Contact: The retrieved contact details.
+        """
+        logger.debug("Fetching contact with ID: %s", contact_id)
+        try:
+            return await self.client.request("GET", f"/contacts/{contact_id}")
+        except imported_types("httpx.HTTPStatusError") as e:
+            handle_404_error(e, contact_id, "Contact")
+
+    @validate_request(CreateContactRequest)
+    @validate_response(Contact)
+    @handle_exceptions
+    async def update_contact(self, contact_id: str, payload: Dict) -> Contact:
+        """
+        Update the details of an existing contact.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+            payload (dict): A dictionary containing 'name' and/or 'phone'.
+
+        Returns:
+            Contact: The updated contact details.
+        """
+        logger.debug("Updating contact %s with payload: %s", contact_id, payload)
+        try:
+            return await self.client.request("PATCH", f"/contacts/{contact_id}", json=serialize_payload(payload))
+        except imported_types("httpx.HTTPStatusError") as e:
+            handle_404_error(e, contact_id, "Contact")
+
+    @handle_exceptions
+    async def delete_contact(self, contact_id: str) -> None:
+        """
+        Delete a contact by ID.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+
+        Returns:
+            None
+        """
+        logger.debug("Deleting contact with ID: %s", contact_id)
+        try:
+            await self.client.request("DELETE", f"/contacts/{contact_id}")
+            logger.debug("Successfully deleted contact with ID: %s", contact_id)
+        except imported_types("httpx.HTTPStatusError") as e:
             handle_404_error(e, contact_id, "Contact")
@@ -1,14 +1,61 @@
-from typing import Dict
-from httpx import HTTPStatusError
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Union
 
-from ..client import ApiClient
+from ..client import ApiClient, AsyncApiClient
+from ..export import ExportResult, export_records
+from ..pagination import iter_records, aiter_records
 from src.schemas.messages import CreateMessageRequest, Message, ListMessagesResponse
-from src.core.validators import validate_request, validate_response
+from src.core.validators import (
+    validate_request, validate_response, validate_payload, serialize_payload, get_validation_mode, ValidationMode,
+)
 from src.core.exceptions import handle_exceptions, handle_404_error
+from src.core.requests import imported_types
 from src.core.logger import logger
 from src.core.security import verify_signature
 
 
+class SendResult(NamedTuple):
+    """
+    Outcome of one message in a bulk send.
+
+    Attributes:
+        index (int): Position of the payload in the input.
+        payload (dict): The payload that was sent.
+        result (Message | dict, optional): The created message, if the send succeeded.
+        error (Exception, optional): The validation or API error, if it failed.
+    """
+    index: int
+    payload: Dict
+    result: Optional[Any] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _aenumerate(payloads: Union[Iterable[Dict], AsyncIterator[Dict]]):
+    index = 0
+    if hasattr(payloads, "__aiter__"):
+        async for payload in payloads:
+            yield index, payload
+            index += 1
+    else:
+        for payload in payloads:
+            yield index, payload
+            index += 1
+
+
+def _message_body(payload: Union[CreateMessageRequest, Dict]) -> Dict:
+    """Serialize a validated payload, or align a raw one with the API's ``from`` field."""
+    body = serialize_payload(payload)
+    if isinstance(body, dict) and "from_sender" in body:
+        body = {**body, "from": body["from_sender"]}
+        del body["from_sender"]
+    return body
+
+
 class Messages:
     """
     Messages SDK module for managing messages via the API.
@@ -26,27 +73,83 @@ class Messages:
         self.client = client
 
     @validate_request(CreateMessageRequest)
-    @validate_response(Message)
-    @handle_exceptions
     def send_message(self, payload: Dict) -> Message:
         """
         Send a new message to a contact.
 
         Args:
-            payload (dict): A dictionary containing 'to', 'content', and 'from_sender'.
+            payload (dict | CreateMessageRequest): A dictionary containing 'to', 'content', and 'from'.
 
         Returns:
-            Message: The details of the sent message.
+            Message: The details of the sent message, or a dict with ``as_dict=True``.
         """
-        logger.info("Preparing to send a message.")
-        # Ensure the payload aligns with the API's expected format
-        if "from_sender" in payload:
-            payload["from"] = payload.pop("from_sender")
-        logger.debug(f"Transformed payload: {payload}")
+        return self._send_validated(payload)
+
+    @validate_response(Message)
+    @handle_exceptions
+    def _send_validated(self, payload: Union[CreateMessageRequest, Dict]) -> Message:
+        logger.debug("Preparing to send a message.")
+        body = _message_body(payload)
+        logger.debug("Transformed payload: %s", body)
 
         # Make the API call to send the message
-        logger.info("Sending message request to the API.")
-        return self.client.request("POST", "/messages", json=payload)
+        logger.debug("Sending message request to the API.")
+        return self.client.request("POST", "/messages", json=body)
+
+    def _send_one(self, index: int, payload: Dict, request: Any, as_dict: bool) -> SendResult:
+        try:
+            return SendResult(index, payload, result=self._send_validated(request, as_dict=as_dict))
+        except Exception as e:
+            return SendResult(index, payload, error=e)
+
+    def send_many(self, payloads: Iterable[Dict], concurrency: int = 10, as_dict: bool = False) -> Iterator[SendResult]:
+        """
+        Send many messages concurrently and stream the outcomes as they complete.
+
+        Payloads are read lazily and validated once against ``CreateMessageRequest``.
+        At most ``concurrency`` sends are in flight at any time, so memory stays
+        bounded for arbitrarily large inputs. Failures are reported per item and never
+        stop the batch. Size the client pool (``pool_maxsize``) to at least ``concurrency``.
+
+        Args:
+            payloads (Iterable[dict]): Message payloads, as accepted by ``send_message``.
+            concurrency (int): Maximum number of concurrent sends. Defaults to 10.
+            as_dict (bool): Return each created message as a dict instead of a ``Message``.
+
+        Yields:
+            SendResult: One result per payload, in completion order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        source = enumerate(payloads)
+        in_flight = set()
+        exhausted = False
+        pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="send_many")
+        try:
+            while True:
+                while not exhausted and len(in_flight) < concurrency:
+                    try:
+                        index, payload = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    try:
+                        request = payload
+                        if get_validation_mode() is not ValidationMode.OFF:
+                            request = validate_payload(CreateMessageRequest, payload)
+                    except ValueError as e:
+                        yield SendResult(index, payload, error=e)
+                        continue
+                    in_flight.add(pool.submit(self._send_one, index, payload, request, as_dict))
+                if not in_flight:
+                    return
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=True)
 
     @validate_response(ListMessagesResponse)
     @handle_exceptions
@@ -62,9 +165,70 @@ class Messages:
             ListMessagesResponse: A paginated list of sent messages.
         """
         params = {"page": page, "limit": limit}
-        logger.info(f"Requesting a list of messages with params: {params}")
+        logger.debug("Requesting a list of messages with params: %s", params)
         return self.client.request("GET", "/messages", params=params)
 
+    def iter_messages(
+        self,
+        page_size: int = 10,
+        start_page: int = 1,
+        max_items: int = None,
+        stop: Callable[[Message], bool] = None,
+        prefetch: bool = True,
+        as_dict: bool = False,
+    ) -> Iterator[Message]:
+        """
+        Iterate over all sent messages, fetching pages lazily.
+
+        The next page is requested in the background while the current one is consumed.
+
+        Args:
+            page_size (int): Messages per page. Defaults to 10.
+            start_page (int): First page to read. Defaults to 1.
+            max_items (int, optional): Stop after this many messages.
+            stop (Callable, optional): Stop (without yielding) at the first message for which it returns True.
+            prefetch (bool): Fetch the next page in the background. Defaults to True.
+            as_dict (bool): Yield dicts instead of ``Message`` models. Defaults to False.
+
+        Yields:
+            Message: Messages in page order.
+        """
+        def fetch_page(page: int):
+            result = self.list_messages(page=page, limit=page_size, as_dict=as_dict)
+            return result["messages"] if as_dict else result.messages
+
+        return iter_records(
+            fetch_page, page_size, start_page=start_page, max_items=max_items, stop=stop, prefetch=prefetch,
+        )
+
+    def export_messages(
+        self,
+        output_path: str,
+        output_format: str = "ndjson",
+        page_size: int = 100,
+        workers: int = 4,
+        checkpoint_path: str = None,
+    ) -> ExportResult:
+        """
+        Export all messages to an NDJSON or CSV file, fetching pages concurrently.
+
+        See ``src.sdk.export.export_records`` for deduplication and resumption.
+
+        Args:
+            output_path (str): File to write.
+            output_format (str): ``"ndjson"`` or ``"csv"``. Defaults to ``"ndjson"``.
+            page_size (int): Messages per page. Defaults to 100.
+            workers (int): Pages fetched concurrently. Defaults to 4.
+            checkpoint_path (str, optional): Checkpoint file used to resume an interrupted export.
+
+        Returns:
+            ExportResult: Counts of written and dropped messages.
+        """
+        return export_records(
+            lambda page: self.list_messages(page=page, limit=page_size, as_dict=True)["messages"], output_path,
+            output_format=output_format, page_size=page_size, workers=workers, checkpoint_path=checkpoint_path,
+        )
+
     @validate_response(Message)
     @handle_exceptions
     def get_message(self, message_id: str) -> Message:
@@ -77,11 +241,195 @@ class Messages:
         Returns:
             Message: The retrieved message details.
         """
-        logger.info(f"Fetching message details for ID: {message_id}")
+        logger.debug("Fetching message details for ID: %s", message_id)
         try:
             return self.client.request("GET", f"/messages/{message_id}")
-        except HTTPStatusError as e:
-            logger.error(f"Message with ID {message_id} not found.")
+        except imported_types("httpx.HTTPStatusError") as e:
+            logger.error("Message with ID %s not found.", message_id)
+            handle_404_error(e, message_id, "Message")
+
+    def validate_webhook_signature(self, raw_body: bytes, signature: str, secret: str):
+        """
+        Validate the webhook signature using the SDK.
+
+        Args:
+            raw_body (bytes): Raw request body from webhook.
+            signature (str): Authorization header containing the signature.
+            secret (str): Secret key for signature validation.
+
+        Raises:
+            ValueError: If the signature validation fails.
+        """
+        logger.debug("Validating webhook signature via the SDK.")
+        try:
+            verify_signature(raw_body, signature, secret)
+            logger.debug("Webhook signature successfully validated.")
+        except ValueError as e:
+            logger.error("Invalid webhook signature: %s", e)
+            raise
+
+
+class AsyncMessages:
+    """
+    Asyncio Messages SDK module, mirroring ``Messages`` on top of ``AsyncApiClient``.
+
+    Provides coroutine methods for sending, listing, and retrieving messages.
+    """
+
+    def __init__(self, client: AsyncApiClient):
+        """
+        Initialize the AsyncMessages module.
+
+        Args:
+            client (AsyncApiClient): The shared async API client instance.
+        """
+        self.client = client
+
+    @validate_request(CreateMessageRequest)
+    async def send_message(self, payload: Dict) -> Message:
+        """
+        Send a new message to a contact.
+
+        Args:
+            payload (dict | CreateMessageRequest): A dictionary containing 'to', 'content', and 'from'.
+
+        Returns:
+            Message: The details of the sent message, or a dict with ``as_dict=True``.
+        """
+        return await self._send_validated(payload)
+
+    async def _send_one(self, index: int, payload: Dict, request: Any, as_dict: bool) -> SendResult:
+        try:
+            return SendResult(index, payload, result=await self._send_validated(request, as_dict=as_dict))
+        except Exception as e:
+            return SendResult(index, payload, error=e)
+
+    async def send_many(
+        self,
+        payloads: Union[Iterable[Dict], AsyncIterator[Dict]],
+        concurrency: int = 10,
+        as_dict: bool = False,
+    ) -> AsyncIterator[SendResult]:
+        """
+        Send many messages concurrently and stream the outcomes as they complete.
+
+        Async counterpart of ``Messages.send_many``; ``payloads`` may be a regular or
+        an async iterable. Pending sends are cancelled if the caller stops iterating.
+
+        Args:
+            payloads (Iterable[dict] | AsyncIterator[dict]): Message payloads.
+            concurrency (int): Maximum number of concurrent sends. Defaults to 10.
+            as_dict (bool): Return each created message as a dict instead of a ``Message``.
+
+        Yields:
+            SendResult: One result per payload, in completion order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        source = _aenumerate(payloads)
+        in_flight = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < concurrency:
+                    try:
+                        index, payload = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    try:
+                        request = payload
+                        if get_validation_mode() is not ValidationMode.OFF:
+                            request = validate_payload(CreateMessageRequest, payload)
+                    except ValueError as e:
+                        yield SendResult(index, payload, error=e)
+                        continue
+                    in_flight.add(asyncio.ensure_future(self._send_one(index, payload, request, as_dict)))
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await source.aclose()
+
+    @validate_response(Message)
+    @handle_exceptions
+    async def _send_validated(self, payload: Union[CreateMessageRequest, Dict]) -> Message:
+        logger.debug("Preparing to send a message.")
+        body = _message_body(payload)
+        logger.debug("Transformed payload: %s", body)
+
+        logger.debug("Sending message request to the API.")
+        return await self.client.request("POST", "/messages", json=body)
+
+    @validate_response(ListMessagesResponse)
+    @handle_exceptions
+    async def list_messages(self, page: int = 1, limit: int = 10) -> ListMessagesResponse:
+        """
+        List all sent messages with pagination.
+
+        Args:
+            page (int): The page number to retrieve. Defaults to 1.
+            limit (int): The maximum number of messages per page. Defaults to 10.
+
+        Returns:
+            ListMessagesResponse: A paginated list of sent messages.
+        """
+        params = {"page": page, "limit": limit}
+        logger.debug("Requesting a list of messages with params: %s", params)
+        return await self.client.request("GET", "/messages", params=params)
+
+    def iter_messages(
+        self,
+        page_size: int = 10,
+        start_page: int = 1,
+        max_items: int = None,
+        stop: Callable[[Message], bool] = None,
+        prefetch: bool = True,
+        as_dict: bool = False,
+    ) -> AsyncIterator[Message]:
+        """
+        Asynchronously iterate over all sent messages, fetching pages lazily.
+
+        Args:
+            page_size (int): Messages per page. Defaults to 10.
+            start_page (int): First page to read. Defaults to 1.
+            max_items (int, optional): Stop after this many messages.
+            stop (Callable, optional): Stop (without yielding) at the first message for which it returns True.
+            prefetch (bool): Fetch the next page concurrently. Defaults to True.
+            as_dict (bool): Yield dicts instead of ``Message`` models. Defaults to False.
+
+        Yields:
+            Message: Messages in page order.
+        """
+        async def fetch_page(page: int):
+            result = await self.list_messages(page=page, limit=page_size, as_dict=as_dict)
+            return result["messages"] if as_dict else result.messages
+
+        return aiter_records(
+            fetch_page, page_size, start_page=start_page, max_items=max_items, stop=stop, prefetch=prefetch,
+        )
+
+    @validate_response(Message)
+    @handle_exceptions
+    async def get_message(self, message_id: str) -> Message:
+        """
+        Retrieve a specific message by ID.
+
+        Args:
+            message_id (str): The unique ID of the message.
+
+        Returns:
+            Message: The retrieved message details.
+        """
+        logger.debug("Fetching message details for ID: %s", message_id)
+        try:
+            return await self.client.request("GET", f"/messages/{message_id}")
+        except imported_types("httpx.HTTPStatusError") as e:
+            logger.error("Message with ID %s not found.", message_id)
             handle_404_error(e, message_id, "Message")
 
     def validate_webhook_signature(self, raw_body: bytes, signature: str, secret: str):
@@ -96,10 +444,10 @@ class Messages:
         Raises:
             ValueError: If the signature validation fails.
         """
-        logger.info("Validating webhook signature via the SDK.")
+        logger.debug("Validating webhook signature via the SDK.")
         try:
             verify_signature(raw_body, signature, secret)
-            logger.info("Webhook signature successfully validated.")
+            logger.debug("Webhook signature successfully validated.")
         except ValueError as e:
-            logger.error(f"Invalid webhook signature: {e}")
+            logger.error("Invalid webhook signature: %s", e)
             raise
@@ -0,0 +1,120 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Sequence
+
+from src.core.logger import logger
+
+PageFetcher = Callable[[int], Sequence[Any]]
+AsyncPageFetcher = Callable[[int], Awaitable[Sequence[Any]]]
+
+
+def iter_records(
+    fetch_page: PageFetcher,
+    page_size: int,
+    start_page: int = 1,
+    max_items: int = None,
+    stop: Callable[[Any], bool] = None,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """
+    Lazily iterate over the records of a paginated endpoint.
+
+    While the caller consumes a full page, the next one is already being fetched on
+    a background thread. Iteration ends on the first short or empty page, after
+    ``max_items`` records, or when ``stop(record)`` returns True (that record is not
+    yielded).
+
+    Args:
+        fetch_page (Callable[[int], Sequence]): Returns the records of a page number.
+        page_size (int): Records requested per page.
+        start_page (int): First page to fetch. Defaults to 1.
+        max_items (int, optional): Maximum number of records to yield.
+        stop (Callable, optional): Predicate ending the iteration.
+        prefetch (bool): Fetch the next page in the background. Defaults to True.
+
+    Yields:
+        Any: Records in page order.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page_prefetch") if prefetch else None
+    pending = None
+    page = start_page
+    yielded = 0
+    try:
+        records = fetch_page(page)
+        while True:
+            full = len(records) >= page_size
+            more_wanted = max_items is None or yielded + len(records) < max_items
+            if executor is not None and full and more_wanted:
+                logger.debug("Prefetching page %s", page + 1)
+                pending = executor.submit(fetch_page, page + 1)
+            for record in records:
+                if (max_items is not None and yielded >= max_items) or (stop is not None and stop(record)):
+                    return
+                yield record
+                yielded += 1
+            if not full or (max_items is not None and yielded >= max_items):
+                return
+            page += 1
+            if pending is not None:
+                records, pending = pending.result(), None
+            else:
+                records = fetch_page(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_records(
+    fetch_page: AsyncPageFetcher,
+    page_size: int,
+    start_page: int = 1,
+    max_items: int = None,
+    stop: Callable[[Any], bool] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of ``iter_records``; the next page is fetched by a concurrent task.
+
+    Args:
+        fetch_page (Callable[[int], Awaitable[Sequence]]): Coroutine returning the records of a page.
+        page_size (int): Records requested per page.
+        start_page (int): First page to fetch. Defaults to 1.
+        max_items (int, optional): Maximum number of records to yield.
+        stop (Callable, optional): Predicate ending the iteration.
+        prefetch (bool): Fetch the next page concurrently. Defaults to True.
+
+    Yields:
+        Any: Records in page order.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    pending = None
+    page = start_page
+    yielded = 0
+    try:
+        records = await fetch_page(page)
+        while True:
+            full = len(records) >= page_size
+            more_wanted = max_items is None or yielded + len(records) < max_items
+            if prefetch and full and more_wanted:
+                logger.debug("Prefetching page %s", page + 1)
+                pending = asyncio.ensure_future(fetch_page(page + 1))
+            for record in records:
+                if (max_items is not None and yielded >= max_items) or (stop is not None and stop(record)):
+                    return
+                yield record
+                yielded += 1
+            if not full or (max_items is not None and yielded >= max_items):
+                return
+            page += 1
+            if pending is not None:
+                records, pending = await pending, None
+            else:
+                records = await fetch_page(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
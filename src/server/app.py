@@ -1,59 +1,219 @@
-import json
+import asyncio
+
+from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 from src.core.config import settings
-from src.sdk.client import ApiClient
 from src.schemas.webhook import WebhookPayload
-from src.sdk.features.messages import Messages
 from src.core.security import verify_signature
 from src.core.logger import webhook_logger as logger
-from src.schemas.errors import UnauthorizedError, BadRequestError, ServerError
+from src.schemas.errors import UnauthorizedError, ServerError
+from src.server.admission import AdmissionController
+from src.server.dedup import DedupStore, event_key
+from src.server.status_store import MessageStatusStore
+from src.server.webhook_queue import WebhookQueue
+
+
+async def process_webhook(payload: WebhookPayload) -> None:
+    """Process one verified delivery event. Runs on the webhook queue's workers when the queue is enabled."""
+    logger.info("Webhook received: id=%s status=%s", payload.id, payload.status)
+
+
+# Queue between the endpoint and ``process_webhook``, built on first use; None runs events inline
+webhook_queue: Optional[WebhookQueue] = None
+_webhook_queue_built = False
+
+
+def get_webhook_queue() -> Optional[WebhookQueue]:
+    """Return the shared ``WebhookQueue``, creating it on first call, or None when the queue is disabled."""
+    global webhook_queue, _webhook_queue_built
+    if not _webhook_queue_built:
+        webhook_queue = webhook_queue or WebhookQueue.from_settings(process_webhook)
+        _webhook_queue_built = True
+    return webhook_queue
+
+
+# Load shedding in front of the endpoint, built on first use
+admission: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the shared ``AdmissionController``, creating it on first call."""
+    global admission
+    if admission is None:
+        admission = AdmissionController.from_settings()
+    return admission
+
+
+# Events already accepted, built on first use; None when deduplication is disabled
+dedup_store: Optional[DedupStore] = None
+_dedup_store_built = False
+
+
+def get_dedup_store() -> Optional[DedupStore]:
+    """Return the shared ``DedupStore``, creating it on first call, or None when deduplication is disabled."""
+    global dedup_store, _dedup_store_built
+    if not _dedup_store_built:
+        dedup_store = dedup_store or DedupStore.from_settings()
+        _dedup_store_built = True
+    return dedup_store
+
+
+# Latest status per message, built on first use; None when status tracking is disabled
+status_store: Optional[MessageStatusStore] = None
+_status_store_built = False
+
+
+def get_status_store() -> Optional[MessageStatusStore]:
+    """Return the shared ``MessageStatusStore``, creating it on first call, or None when tracking is disabled."""
+    global status_store, _status_store_built
+    if not _status_store_built:
+        # Not ``or``: an empty store is falsy
+        status_store = status_store if status_store is not None else MessageStatusStore.from_settings()
+        _status_store_built = True
+    return status_store
+
+
+async def dedup_call(store: DedupStore, method: str, *args):
+    """Call ``method`` of the dedup store, in the thread pool if the store blocks (e.g. SQLite)."""
+    function = getattr(store, method)
+    return await run_in_threadpool(function, *args) if store.blocking else function(*args)
+
+
+def webhook_source(request: Request) -> str:
+    """Identify the sender of a webhook: the first ``WEBHOOK_SOURCE_HEADER`` hop if configured, else the client address."""
+    if settings.WEBHOOK_SOURCE_HEADER:
+        forwarded = request.headers.get(settings.WEBHOOK_SOURCE_HEADER)
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
 
-# Initialize FastAPI app
-app = FastAPI()
 
-# SDK instance for validation
-# Initialize ApiClient and Messages
-api_client = ApiClient()
-messages_sdk = Messages(client=api_client)
+def retry_later(message: str) -> JSONResponse:
+    """503 asking the provider to redeliver after ``Retry-After`` seconds."""
+    return JSONResponse(
+        status_code=503,
+        content=ServerError(message=message).model_dump(),
+        headers={"Retry-After": f"{get_admission_controller().retry_after:g}"},
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if webhook_queue is not None:
+        # Drain the events already acknowledged without blocking the server's loop
+        await asyncio.get_running_loop().run_in_executor(None, webhook_queue.close)
+    if dedup_store is not None:
+        await dedup_call(dedup_store, "close")
+    if status_store is not None and settings.WEBHOOK_STATUS_SNAPSHOT_PATH:
+        status_store.snapshot(settings.WEBHOOK_STATUS_SNAPSHOT_PATH)
+
+
+# Initialize FastAPI app
+app = FastAPI(lifespan=lifespan)
 
 
 @app.post("/webhooks")
-async def handle_webhook(
-    payload: WebhookPayload,
-    authorization: str = Header(...),
-    request: Request = None,
-):
+async def handle_webhook(request: Request, authorization: str = Header(...)):
     """
     Webhook endpoint to process incoming events.
+
+    Each request first passes admission control: over the in-flight, queue or
+    per-source limits it is refused with a 503 and ``Retry-After`` before its
+    body is even read. The raw body is read once and its signature checked before anything is
+    parsed, so forged requests are rejected without decoding them. Authentic
+    bodies are then parsed once, straight from bytes, with ``model_validate_json``.
+    Redeliveries of an event already accepted are acknowledged without being
+    processed again, and so are stale events that would move a message's
+    status backwards (e.g. ``queued`` after ``delivered``). New events are handed to the webhook queue and acknowledged right away;
+    when the queue is full the provider is asked to retry later with a 503.
     """
+    queue = get_webhook_queue()
+    controller = get_admission_controller()
+    source = webhook_source(request)
+    rejected = controller.acquire(
+        source,
+        queued=queue.depth if queue is not None else 0,
+        max_queued=queue.maxsize if queue is not None else None,
+    )
+    if rejected is not None:
+        logger.warning("Shedding webhook from %s (%s limit reached).", source, rejected)
+        return retry_later("Webhook server is busy. Please retry.")
     try:
-        # Extract raw request body
-        raw_body = await request.body()
+        return await _handle_webhook(request, authorization, queue)
+    finally:
+        controller.release(source)
 
-        # Validate signature using the SDK
+
+async def _handle_webhook(request: Request, authorization: str, queue: Optional[WebhookQueue]):
+    raw_body = await request.body()
+    try:
         verify_signature(raw_body, authorization.removeprefix("Bearer "), settings.WEBHOOK_SECRET)
+    except UnauthorizedError as e:
+        raise HTTPException(status_code=401, detail=e.message)
+
+    try:
+        payload = WebhookPayload.model_validate_json(raw_body)
+    except ValidationError as e:
+        # Same 422 body FastAPI produces when it validates the body itself
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=raw_body,
+        )
 
-        # Log the received payload
-        logger.info(f"Webhook received: {payload.model_dump()}")
+    dedup = get_dedup_store()
+    key = event_key(payload)
+    if dedup is not None and await dedup_call(dedup, "check", key):
+        logger.debug("Duplicate webhook for message %s (%s) acknowledged.", payload.id, payload.status)
+        return {"message": "Webhook processed successfully."}
 
-        # Simulate event processing (printing is sufficient per task)
-        print(f"Processed webhook payload: {payload.model_dump()}")
+    statuses = get_status_store()
+    if statuses is not None and not statuses.apply(payload.id, payload.status):
+        logger.debug("Stale webhook for message %s (%s) dropped.", payload.id, payload.status)
+        return {"message": "Webhook processed successfully."}
 
+    if queue is not None:
+        if not queue.submit(payload):
+            # The provider will redeliver it
+            # Revert before awaiting, or a newer event applied meanwhile would be clobbered
+            if statuses is not None:
+                statuses.revert(payload.id, payload.status)
+            if dedup is not None:
+                await dedup_call(dedup, "forget", key)
+            logger.warning("Webhook queue full, asking the provider to retry event %s.", payload.id)
+            return retry_later("Webhook queue is full. Please retry.")
+        # Same acknowledgement as inline processing, so providers see no difference
+        return {"message": "Webhook processed successfully."}
+
+    try:
+        await process_webhook(payload)
         return {"message": "Webhook processed successfully."}
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=BadRequestError(error=str(e)).model_dump()
-        )
-    except UnauthorizedError as e:
-        raise HTTPException(
-            status_code=401,
-            detail=e.message
-        )
     except Exception:
+        # Revert before awaiting, or a newer event applied meanwhile would be clobbered
+        if statuses is not None:
+            statuses.revert(payload.id, payload.status)
+        if dedup is not None:
+            await dedup_call(dedup, "forget", key)
         raise HTTPException(
             status_code=500,
             detail=ServerError(message="An unexpected error occurred").model_dump()
         )
+
+
+@app.get("/webhooks/stats")
+async def webhook_stats():
+    """Webhook queue readings (depth, wait and processing latency, outcome counts), admission control counts, duplicate rate and status tracking counts."""
+    queue = get_webhook_queue()
+    stats = queue.stats() if queue is not None else {"enabled": False}
+    stats["admission"] = get_admission_controller().snapshot()
+    dedup = get_dedup_store()
+    stats["dedup"] = await dedup_call(dedup, "stats") if dedup is not None else {"enabled": False}
+    statuses = get_status_store()
+    stats["statuses"] = statuses.stats() if statuses is not None else {"enabled": False}
+    return stats
@@ -0,0 +1,208 @@
+import time
+import sqlite3
+import threading
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+from src.schemas.webhook import WebhookPayload
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+
+def event_key(payload: WebhookPayload) -> str:
+    """Identity of a delivery event: message id, status and delivery time."""
+    delivered_at = payload.delivered_at.isoformat() if payload.delivered_at else ""
+    return f"{payload.id}|{payload.status}|{delivered_at}"
+
+
+class DedupStore:
+    """
+    Remembers which webhook events were already accepted, so redeliveries of the
+    same event are acknowledged without being processed again.
+
+    ``check`` records a key and reports whether it was already there in one step,
+    so two concurrent deliveries of an event cannot both be taken as new.
+    Subclasses implement ``_add``, ``forget`` and ``size``, and set ``blocking``
+    when those do I/O that async callers must keep off their event loop.
+    """
+    backend = ""
+    blocking = False
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl (float): Seconds an event is remembered; redeliveries after that are processed again.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.ttl = ttl
+        self.checked = 0
+        self.duplicates = 0
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["DedupStore"]:
+        """Build the store configured through ``Settings``, or None when disabled."""
+        from src.core.config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.WEBHOOK_DEDUP_ENABLED:
+            return None
+        if settings.WEBHOOK_DEDUP_SQLITE_PATH:
+            return SqliteDedupStore(settings.WEBHOOK_DEDUP_SQLITE_PATH, ttl=settings.WEBHOOK_DEDUP_TTL)
+        return MemoryDedupStore(ttl=settings.WEBHOOK_DEDUP_TTL, max_entries=settings.WEBHOOK_DEDUP_MAX_ENTRIES)
+
+    def check(self, key: str) -> bool:
+        """
+        Record ``key`` as seen.
+
+        Returns:
+            bool: True if the key was already seen within the TTL (a duplicate).
+        """
+        duplicate = not self._add(key)
+        with self._stats_lock:
+            self.checked += 1
+            if duplicate:
+                self.duplicates += 1
+        return duplicate
+
+    def forget(self, key: str) -> None:
+        """Drop ``key``, e.g. when its event could not be accepted after all and will be redelivered."""
+        raise NotImplementedError
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def _add(self, key: str) -> bool:
+        """Store ``key``, returning False if it was already stored and not expired."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report the store's readings.
+
+        Returns:
+            dict: ``backend``, ``size``, ``checked`` and ``duplicates`` counts, and
+            ``duplicate_rate`` (duplicates / checked, 0 before any check).
+        """
+        with self._stats_lock:
+            checked, duplicates = self.checked, self.duplicates
+        return {
+            "backend": self.backend,
+            "size": self.size(),
+            "checked": checked,
+            "duplicates": duplicates,
+            "duplicate_rate": duplicates / checked if checked else 0.0,
+        }
+
+
+class MemoryDedupStore(DedupStore):
+    """
+    Per-process store bounded by both TTL and entry count. When full, the least
+    recently seen event is forgotten first.
+    """
+    backend = "memory"
+
+    def __init__(self, ttl: float = 86400.0, max_entries: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl (float): Seconds an event is remembered.
+            max_entries (int): Events remembered at most.
+            clock (Callable, optional): Monotonic time source.
+        """
+        super().__init__(ttl)
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, float]" = OrderedDict()  # key -> expiry
+        self._lock = threading.Lock()
+
+    def _add(self, key: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is not None and expires > now:
+                self._entries.move_to_end(key)
+                return False
+            self._entries[key] = now + self.ttl
+            self._entries.move_to_end(key)
+            # Least recently seen first: drop expired entries there, then whatever exceeds the bound
+            while self._entries:
+                oldest, oldest_expires = next(iter(self._entries.items()))
+                if oldest_expires > now and len(self._entries) <= self.max_entries:
+                    break
+                del self._entries[oldest]
+            return True
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def size(self) -> int:
+        now = self._clock()
+        with self._lock:
+            # Entries are ordered by last sighting, not expiry, so expired ones may sit anywhere
+            return sum(1 for expires in self._entries.values() if expires > now)
+
+
+class SqliteDedupStore(DedupStore):
+    """
+    Store kept in a SQLite file, so every worker process of the server (for
+    example ``uvicorn --workers 4``) shares one view of the events already seen.
+    The check is a single atomic upsert. Expired rows are purged every
+    ``purge_every`` checks. Calls may wait up to 5 seconds for another process's
+    write lock, so the store is ``blocking``.
+    """
+    backend = "sqlite"
+    blocking = True
+
+    def __init__(self, path: str, ttl: float = 86400.0, purge_every: int = 1000, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path (str): Database file, created if missing.
+            ttl (float): Seconds an event is remembered.
+            purge_every (int): Checks between purges of expired rows.
+            clock (Callable, optional): Wall-clock time source, shared across processes.
+        """
+        super().__init__(ttl)
+        self.path = path
+        self.purge_every = purge_every
+        self._clock = clock
+        self._added = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS webhook_events (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+
+    def _add(self, key: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            # Inserts a new key, or revives an expired one; leaves a live key untouched
+            cursor = self._db.execute(
+                "INSERT INTO webhook_events (key, expires) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET expires = excluded.expires WHERE webhook_events.expires <= ?",
+                (key, now + self.ttl, now),
+            )
+            self._added += 1
+            if self._added % self.purge_every == 0:
+                self._db.execute("DELETE FROM webhook_events WHERE expires <= ?", (now,))
+            return cursor.rowcount == 1
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM webhook_events WHERE key = ?", (key,))
+
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM webhook_events WHERE expires > ?", (self._clock(),)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
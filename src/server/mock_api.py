@@ -0,0 +1,487 @@
+"""
+Local mock of the messaging API described in ``docs/openapi.yaml``.
+
+Serves every ``/messages`` and ``/contacts`` route over HTTP/1.1 with keep-alive,
+storing state in memory, and can misbehave on purpose: responses are delayed by
+a configurable latency distribution, a share of requests fails with 429, 502 or
+503, and created messages can be reported back through signed delivery
+webhooks. Built on the standard library, so it needs neither Docker nor an ASGI
+server::
+
+    python -m src.server.mock_api --port 3000 --latency lognormal:40:0.5 \\
+        --fault 429=0.05 --fault 503=0.02 --webhook-url http://localhost:8000/webhooks
+
+or in process::
+
+    with MockApi(api_key="test", faults={503: 0.1}) as api:
+        client = ApiClient(config=Settings(BASE_URL=api.url, API_KEY="test", WEBHOOK_SECRET="..."))
+"""
+import json
+import time
+import heapq
+import random
+import argparse
+import threading
+import itertools
+import urllib.request
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FAULT_STATUS_CODES = (429, 502, 503)
+FAULT_MESSAGES = {429: "Too many requests", 502: "Bad gateway", 503: "Service unavailable"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class LatencyModel:
+    """
+    Distribution of the delay added before each response, in milliseconds.
+
+    Supported distributions and their parameters:
+
+    - ``fixed:<ms>``
+    - ``uniform:<low ms>:<high ms>``
+    - ``normal:<mean ms>:<stddev ms>`` (clipped at 0)
+    - ``lognormal:<median ms>:<sigma>``, a long right tail like real networks
+    - ``exponential:<mean ms>``
+    """
+    DISTRIBUTIONS = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+    def __init__(self, distribution: str = "fixed", *params: float, rng: random.Random = None):
+        """
+        Args:
+            distribution (str): One of ``DISTRIBUTIONS``.
+            *params (float): The distribution's parameters, see above.
+            rng (random.Random, optional): Random source, e.g. seeded for reproducible runs.
+
+        Raises:
+            ValueError: For an unknown distribution or the wrong number of parameters.
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {distribution!r}; expected one of {sorted(self.DISTRIBUTIONS)}")
+        if len(params) != self.DISTRIBUTIONS[distribution]:
+            raise ValueError(f"{distribution} latency takes {self.DISTRIBUTIONS[distribution]} parameter(s)")
+        self.distribution = distribution
+        self.params = tuple(float(param) for param in params)
+        self._rng = rng or random.Random()
+
+    @classmethod
+    def parse(cls, spec: str, rng: random.Random = None) -> "LatencyModel":
+        """Build a model from a ``name:param[:param]`` spec such as ``lognormal:40:0.5``."""
+        name, *params = spec.split(":")
+        try:
+            return cls(name, *(float(param) for param in params), rng=rng)
+        except TypeError as e:
+            raise ValueError(f"Invalid latency spec {spec!r}") from e
+
+    def sample(self) -> float:
+        """Draw one delay, in seconds."""
+        a, *rest = self.params
+        if self.distribution == "fixed":
+            ms = a
+        elif self.distribution == "uniform":
+            ms = self._rng.uniform(a, rest[0])
+        elif self.distribution == "normal":
+            ms = self._rng.gauss(a, rest[0])
+        elif self.distribution == "lognormal":
+            ms = a * self._rng.lognormvariate(0.0, rest[0]) if a > 0 else 0.0
+        else:
+            ms = self._rng.expovariate(1.0 / a) if a > 0 else 0.0
+        return max(ms, 0.0) / 1000
+
+    def __repr__(self) -> str:
+        return f"LatencyModel({self.distribution}:{':'.join(f'{p:g}' for p in self.params)})"
+
+
+class WebhookDispatcher:
+    """
+    Sends delivery events for created messages from a background thread.
+
+    Events are due ``delay`` seconds after the message was created and are posted
+    as ``MessageDeliveryEvent`` JSON with ``Authorization: Bearer <HMAC-SHA256 of
+    the body>``, the scheme the webhook server verifies.
+    """
+
+    def __init__(self, url: str, secret: str, delay: float = 0.5, timeout: float = 5.0):
+        """
+        Args:
+            url (str): Webhook endpoint, e.g. ``http://localhost:8000/webhooks``.
+            secret (str): ``WEBHOOK_SECRET`` shared with the receiver.
+            delay (float): Seconds between a message's creation and its event.
+            timeout (float): Timeout of each webhook POST.
+        """
+        self.url = url
+        self.secret = secret
+        self.delay = delay
+        self.timeout = timeout
+        self.sent = 0
+        self.errors = 0
+        self._due: List[Tuple[float, int, Any]] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="mock-api-webhooks", daemon=True)
+        self._thread.start()
+
+    def schedule(self, event: Dict[str, Any], on_sent=None) -> None:
+        """Queue ``event`` to be sent once the delay has passed; ``on_sent(event)`` runs just before."""
+        with self._condition:
+            heapq.heappush(self._due, (time.monotonic() + self.delay, next(self._order), (event, on_sent)))
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the dispatcher; events not yet due are dropped."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._due or self._due[0][0] > time.monotonic()):
+                    self._condition.wait(self._due[0][0] - time.monotonic() if self._due else None)
+                if self._stopped:
+                    return
+                _, _, (event, on_sent) = heapq.heappop(self._due)
+            if on_sent is not None:
+                on_sent(event)
+            self.send(event)
+
+    def send(self, event: Dict[str, Any]) -> bool:
+        """POST one signed event. Failures are counted, never raised."""
+        from src.core.security import generate_signature
+
+        body = json.dumps(event, separators=(",", ":")).encode()
+        request = urllib.request.Request(self.url, data=body, method="POST", headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {generate_signature(body, self.secret)}",
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+            self.sent += 1
+            return True
+        except Exception:
+            self.errors += 1
+            return False
+
+
+class MockApi:
+    """
+    Messaging API mock running in a daemon thread.
+
+    Attributes:
+        url (str): Base URL to point a client at.
+        messages (dict): Messages by id, in creation order.
+        contacts (dict): Contacts by id, in creation order.
+        stats (dict): Requests served and injected faults per status.
+    """
+
+    def __init__(
+        self,
+        api_key: str = "test",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: LatencyModel = None,
+        faults: Dict[int, float] = None,
+        retry_after: Optional[float] = 1.0,
+        webhook_url: str = None,
+        webhook_secret: str = None,
+        webhook_delay: float = 0.5,
+        failure_rate: float = 0.0,
+        seed: int = None,
+        seed_messages: int = 0,
+        seed_contacts: int = 0,
+    ):
+        """
+        Args:
+            api_key (str): Bearer token accepted by the server.
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free one.
+            latency (LatencyModel, optional): Delay added to every response. None for no delay.
+            faults (dict, optional): Share of requests (0-1) failing with each status
+                of ``FAULT_STATUS_CODES``, e.g. ``{429: 0.05, 503: 0.01}``. Faults are
+                injected before the request is handled, so a failed POST creates nothing.
+            retry_after (float, optional): ``Retry-After`` seconds sent with injected
+                429 and 503 responses. None to omit the header.
+            webhook_url (str, optional): Where to send delivery events for created messages.
+            webhook_secret (str, optional): Secret signing the events. Required with ``webhook_url``.
+            webhook_delay (float): Seconds between a message's creation and its event.
+            failure_rate (float): Share of messages reported as ``failed`` instead of ``delivered``.
+            seed (int, optional): Seed of fault and delivery outcomes. Seed latency
+                through the ``LatencyModel``'s ``rng``.
+            seed_messages (int): Messages created up front, e.g. for listing benchmarks.
+            seed_contacts (int): Contacts created up front.
+
+        Raises:
+            ValueError: For an unsupported fault status, rates above 1 in total, or a
+                webhook URL without a secret.
+        """
+        faults = dict(faults or {})
+        unsupported = set(faults) - set(FAULT_STATUS_CODES)
+        if unsupported:
+            raise ValueError(f"Cannot inject status {sorted(unsupported)}; supported: {FAULT_STATUS_CODES}")
+        if any(rate < 0 for rate in faults.values()) or sum(faults.values()) > 1:
+            raise ValueError("Fault rates must be >= 0 and add up to at most 1")
+        if webhook_url and not webhook_secret:
+            raise ValueError("webhook_secret is required to sign webhook callbacks")
+
+        self.api_key = api_key
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.contacts: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, Any] = {"requests": 0, "faults": dict.fromkeys(sorted(faults), 0)}
+        self.faults = faults
+        self.retry_after = retry_after
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self.latency = latency
+        self.webhooks = WebhookDispatcher(webhook_url, webhook_secret, webhook_delay) if webhook_url else None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        for i in range(seed_contacts):
+            self.create_contact({"name": f"Contact {i}", "phone": f"+1555{i:07d}"})
+        for i in range(seed_messages):
+            self.create_message({"from": "+123456789", "to": {"id": f"contact{i}"}, "content": "Hello, World!"})
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockApi":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self.webhooks is not None:
+            self.webhooks.close()
+
+    def __enter__(self) -> "MockApi":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def create_message(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        to = body.get("to")
+        recipient = dict(to) if isinstance(to, dict) else {"id": to}
+        with self._lock:
+            message_id = f"msg{next(self._ids)}"
+            recipient.update(self.contacts.get(recipient.get("id"), {}))
+            message = {
+                "id": message_id,
+                "from": body.get("from"),
+                "to": recipient,
+                "content": body.get("content"),
+                "status": "queued",
+                "createdAt": _now(),
+            }
+            self.messages[message_id] = message
+        if self.webhooks is not None:
+            self.webhooks.schedule(self._delivery_event(message_id), self._apply_event)
+        return message
+
+    def create_contact(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            contact_id = f"contact{next(self._ids)}"
+            contact = {"id": contact_id, "name": body.get("name"), "phone": body.get("phone")}
+            self.contacts[contact_id] = contact
+        return contact
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        """Route one authenticated request and return its status code and JSON body."""
+        segments = [segment for segment in path.split("/") if segment]
+        if not segments or segments[0] not in ("messages", "contacts") or len(segments) > 2:
+            return 404, {"message": "Not found"}
+        resource, resource_id = segments[0], segments[1] if len(segments) > 1 else None
+        store = self.messages if resource == "messages" else self.contacts
+
+        if resource_id is None and method == "POST":
+            error = self._invalid_body(resource, body)
+            if error:
+                return 400, {"error": error}
+            return 201, self.create_message(body) if resource == "messages" else self.create_contact(body)
+        if resource_id is None and method == "GET":
+            try:
+                if resource == "messages":
+                    page, limit = int(query.get("page", 1)), int(query.get("limit", 100))
+                else:
+                    page, limit = int(query.get("pageIndex", 1)), int(query.get("max", 10))
+            except ValueError:
+                return 400, {"error": "Invalid pagination parameters"}
+            page, limit = max(page, 1), max(limit, 0)
+            with self._lock:
+                items = list(itertools.islice(store.values(), (page - 1) * limit, page * limit))
+            if resource == "messages":
+                return 200, {"messages": items, "page": page, "quantityPerPage": limit}
+            return 200, {"contactsList": items, "pageNumber": page, "pageSize": limit}
+
+        item = store.get(resource_id) if resource_id else None
+        if item is None:
+            return 404, {"id": resource_id, "message": f"{resource[:-1].capitalize()} not found"}
+        if method == "GET":
+            return 200, item
+        if method == "PATCH" and resource == "contacts":
+            if not isinstance(body, dict):
+                return 400, {"error": "Invalid JSON body"}
+            with self._lock:
+                item.update({key: body[key] for key in ("name", "phone") if key in body})
+            return 200, item
+        if method == "DELETE" and resource == "contacts":
+            with self._lock:
+                store.pop(resource_id, None)
+            return 204, None
+        return 405, {"message": "Method not allowed"}
+
+    def injected_fault(self) -> Optional[int]:
+        """Draw whether the next request fails, returning the status to answer with."""
+        draw = self._rng.random()
+        for status, rate in self.faults.items():
+            if draw < rate:
+                return status
+            draw -= rate
+        return None
+
+    @staticmethod
+    def _invalid_body(resource: str, body: Any) -> Optional[str]:
+        if not isinstance(body, dict):
+            return "Invalid JSON body"
+        required = ("from", "to", "content") if resource == "messages" else ("name", "phone")
+        missing = [field for field in required if not body.get(field)]
+        return f"Missing required field(s): {', '.join(missing)}" if missing else None
+
+    def _delivery_event(self, message_id: str) -> Dict[str, Any]:
+        if self._rng.random() < self.failure_rate:
+            return {"id": message_id, "status": "failed", "failureReason": "Carrier rejected the message"}
+        return {"id": message_id, "status": "delivered", "deliveredAt": _now()}
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            message = self.messages.get(event["id"])
+            if message is not None:
+                message["status"] = event["status"]
+                if "deliveredAt" in event:
+                    message["deliveredAt"] = event["deliveredAt"]
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def log_message(self, format, *args):  # keep load test output clean
+                pass
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                with api._lock:
+                    api.stats["requests"] += 1
+                if api.latency is not None:
+                    time.sleep(api.latency.sample())
+
+                fault = api.injected_fault() if api.faults else None
+                if fault is not None:
+                    with api._lock:
+                        api.stats["faults"][fault] += 1
+                    headers = {"Retry-After": f"{api.retry_after:g}"} if api.retry_after is not None and fault != 502 else {}
+                    return self._reply(fault, {"message": FAULT_MESSAGES[fault]}, headers)
+                if self.headers.get("Authorization") != f"Bearer {api.api_key}":
+                    return self._reply(401, {"message": "Unauthorized"})
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = raw
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                try:
+                    status, payload = api.handle(self.command, url.path, query, body)
+                except Exception:
+                    status, payload = 500, {"message": "Internal server error"}
+                self._reply(status, payload)
+
+            def _reply(self, status: int, payload: Any, headers: Dict[str, str] = None) -> None:
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+        return Handler
+
+
+def _fault(spec: str) -> Tuple[int, float]:
+    status, _, rate = spec.partition("=")
+    try:
+        return int(status), float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected STATUS=RATE, e.g. 503=0.02, got {spec!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local mock of the messaging API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--api-key", help="Accepted bearer token. Defaults to the API_KEY setting.")
+    parser.add_argument("--latency", help="Latency spec, e.g. fixed:20 or lognormal:40:0.5.")
+    parser.add_argument("--fault", type=_fault, action="append", default=[], metavar="STATUS=RATE",
+                        help="Inject 429, 502 or 503 into a share of requests. Repeatable.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on injected 429/503.")
+    parser.add_argument("--webhook-url", help="Send signed delivery events for created messages here.")
+    parser.add_argument("--webhook-secret", help="Signing secret. Defaults to the WEBHOOK_SECRET setting.")
+    parser.add_argument("--webhook-delay", type=float, default=0.5, help="Seconds before a message's event is sent.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of messages reported as failed.")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible latency, faults and outcomes.")
+    parser.add_argument("--seed-messages", type=int, default=0)
+    parser.add_argument("--seed-contacts", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.api_key or (args.webhook_url and not args.webhook_secret):
+        from src.core.config import get_settings
+        settings = get_settings()
+        args.api_key = args.api_key or settings.API_KEY
+        args.webhook_secret = args.webhook_secret or settings.WEBHOOK_SECRET
+
+    latency = LatencyModel.parse(args.latency, rng=random.Random(args.seed)) if args.latency else None
+    api = MockApi(
+        api_key=args.api_key, host=args.host, port=args.port, latency=latency, faults=dict(args.fault),
+        retry_after=args.retry_after, webhook_url=args.webhook_url, webhook_secret=args.webhook_secret,
+        webhook_delay=args.webhook_delay, failure_rate=args.failure_rate, seed=args.seed,
+        seed_messages=args.seed_messages, seed_contacts=args.seed_contacts,
+    )
+    print(f"Mock messaging API listening on {api.url} (latency={latency}, faults={dict(args.fault)})")
+    api.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.stop()
+        if api.webhooks is not None:
+            api.stats.update(webhooks_sent=api.webhooks.sent, webhook_errors=api.webhooks.errors)
+        print(json.dumps(api.stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import threading
+
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+# Status codes stored per slot; 0 marks a free slot
+STATUSES = ("queued", "delivered", "failed")
+_CODES = {status: code for code, status in enumerate(STATUSES, start=1)}
+# Lifecycle position of each code: queued comes first, delivered and failed are both final
+_RANKS = bytes((0, 0, 1, 1))
+
+
+class MessageStatusStore:
+    """
+    Latest known status of each message, kept so out-of-order webhook events
+    cannot move a message backwards.
+
+    A status may only move forward: ``queued`` to ``delivered`` or ``failed``.
+    Both of those are final, so the first one received wins. ``apply`` accepts an
+    event that advances its message and drops anything else (a late ``queued``
+    after ``delivered``, a repeat, or a ``failed`` after ``delivered``) with a
+    dict lookup and a byte comparison.
+
+    Records live in fixed slots of preallocated arrays (one byte of status, one
+    byte of previous status and one float of first-seen time per message), so
+    memory is bounded by ``capacity`` and does not grow with traffic. Slots are
+    handed out in ring order, so the oldest messages are evicted first: once
+    ``max_age`` seconds have passed since they were first seen, or when every slot
+    is taken. An evicted message is tracked afresh if another event arrives for it.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, max_age: float = 86400.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            capacity (int): Messages tracked at most.
+            max_age (float): Seconds a message is tracked after its first event.
+            clock (Callable, optional): Wall-clock time source, so snapshots stay valid across restarts.
+        """
+        if capacity < 1 or max_age <= 0:
+            raise ValueError("capacity must be >= 1 and max_age > 0")
+        self.capacity = capacity
+        self.max_age = max_age
+        self.applied = 0
+        self.stale = 0
+        self.evicted = 0
+        self._clock = clock
+        self._index: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = [None] * capacity
+        self._status = bytearray(capacity)
+        self._previous = bytearray(capacity)
+        self._seen = array("d", bytes(8 * capacity))
+        self._oldest = 0  # slot allocated longest ago (possibly free)
+        self._used = 0    # slots from ``_oldest`` onwards handed out, including freed ones
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config: "Settings" = None) -> Optional["MessageStatusStore"]:
+        """Build the store configured through ``Settings``, restoring its snapshot if one exists, or None when disabled."""
+        from src.core.config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.WEBHOOK_STATUS_TRACKING_ENABLED:
+            return None
+        store = cls(capacity=settings.WEBHOOK_STATUS_CAPACITY, max_age=settings.WEBHOOK_STATUS_MAX_AGE)
+        if settings.WEBHOOK_STATUS_SNAPSHOT_PATH and os.path.exists(settings.WEBHOOK_STATUS_SNAPSHOT_PATH):
+            store.restore(settings.WEBHOOK_STATUS_SNAPSHOT_PATH)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, message_id: str) -> Optional[str]:
+        """Return the tracked status of ``message_id``, or None if it is not tracked."""
+        slot = self._index.get(message_id)
+        return STATUSES[self._status[slot] - 1] if slot is not None else None
+
+    def apply(self, message_id: str, status: str) -> bool:
+        """
+        Record ``status`` for ``message_id`` if it moves the message forward.
+
+        Returns:
+            bool: True if the status was recorded, False if the event is stale and
+            should be dropped.
+        """
+        code = _CODES[status]
+        with self._lock:
+            slot = self._index.get(message_id)
+            if slot is None:
+                slot = self._allocate(message_id)
+            elif _RANKS[code] <= _RANKS[self._status[slot]]:
+                self.stale += 1
+                return False
+            self._previous[slot] = self._status[slot]
+            self._status[slot] = code
+            self.applied += 1
+            return True
+
+    def revert(self, message_id: str, status: str) -> None:
+        """
+        Undo an ``apply`` of ``status`` whose event was not accepted after all (it
+        will be redelivered). Does nothing if the message has moved on since.
+        """
+        with self._lock:
+            slot = self._index.get(message_id)
+            if slot is None or self._status[slot] != _CODES[status]:
+                return
+            if self._previous[slot]:
+                self._status[slot], self._previous[slot] = self._previous[slot], 0
+            else:
+                self._free(slot)
+            self.applied -= 1
+
+    def evict_expired(self) -> int:
+        """
+        Stop tracking messages first seen more than ``max_age`` seconds ago. Also
+        runs as new messages arrive, so calling it is only needed to free memory
+        early during quiet periods.
+
+        Returns:
+            int: Messages evicted.
+        """
+        with self._lock:
+            return self._evict(self._clock() - self.max_age)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report the store's readings.
+
+        Returns:
+            dict: ``tracked`` messages, ``capacity``, ``applied`` and ``stale`` event
+            counts, and messages ``evicted``.
+        """
+        with self._lock:
+            return {
+                "tracked": len(self._index),
+                "capacity": self.capacity,
+                "applied": self.applied,
+                "stale": self.stale,
+                "evicted": self.evicted,
+            }
+
+    def snapshot(self, path: str) -> int:
+        """
+        Write the tracked statuses to ``path``, oldest first, one JSON array
+        ``[message id, status, first seen]`` per line. The file is written beside
+        ``path`` and moved into place, so a crash never leaves a partial snapshot.
+
+        Returns:
+            int: Messages written.
+        """
+        with self._lock:
+            rows = [
+                (self._ids[slot], STATUSES[self._status[slot] - 1], self._seen[slot])
+                for slot in self._slots_by_age()
+                if self._status[slot]
+            ]
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, separators=(",", ":")))
+                f.write("\n")
+        os.replace(temp_path, path)
+        return len(rows)
+
+    def restore(self, path: str) -> int:
+        """
+        Load a snapshot written by ``snapshot`` on top of the current state. Entries
+        older than ``max_age`` are skipped.
+
+        Returns:
+            int: Messages restored.
+        """
+        cutoff = self._clock() - self.max_age
+        restored = 0
+        with open(path, encoding="utf-8") as f, self._lock:
+            for line in f:
+                message_id, status, seen = json.loads(line)
+                if seen <= cutoff or message_id in self._index:
+                    continue
+                slot = self._allocate(message_id, seen)
+                self._status[slot] = _CODES[status]
+                restored += 1
+        return restored
+
+    def _slots_by_age(self):
+        return ((self._oldest + offset) % self.capacity for offset in range(self._used))
+
+    def _allocate(self, message_id: str, seen: float = None) -> int:
+        now = self._clock()
+        self._evict(now - self.max_age)
+        while self._used == self.capacity:
+            self.evicted += self._pop_oldest()
+        slot = (self._oldest + self._used) % self.capacity
+        self._used += 1
+        self._ids[slot] = message_id
+        self._status[slot] = self._previous[slot] = 0
+        self._seen[slot] = now if seen is None else seen
+        self._index[message_id] = slot
+        return slot
+
+    def _evict(self, cutoff: float) -> int:
+        """Release the oldest slots, free ones and those first seen before ``cutoff``."""
+        evicted = 0
+        while self._used and (self._ids[self._oldest] is None or self._seen[self._oldest] < cutoff):
+            evicted += self._pop_oldest()
+        self.evicted += evicted
+        return evicted
+
+    def _pop_oldest(self) -> int:
+        """Release the oldest slot, returning 1 if it held a message."""
+        slot = self._oldest
+        occupied = self._ids[slot] is not None
+        if occupied:
+            self._free(slot)
+        self._oldest = (slot + 1) % self.capacity
+        self._used -= 1
+        return int(occupied)
+
+    def _free(self, slot: int) -> None:
+        del self._index[self._ids[slot]]
+        self._ids[slot] = None
+        self._status[slot] = self._previous[slot] = 0
@@ -0,0 +1,215 @@
+import time
+import asyncio
+import inspect
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Sequence, Union
+from src.core.logger import webhook_logger as logger
+from src.core.metrics import DEFAULT_BUCKETS, QUANTILES, Histogram
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+WebhookHandler = Callable[[Any], Union[Awaitable[None], None]]
+
+
+class WebhookQueue:
+    """
+    Bounded in-process queue between the webhook endpoint and event processing.
+
+    The endpoint only verifies and enqueues, so the provider gets its 200 as soon
+    as an event is accepted and slow processing never turns into provider-side
+    retries. A pool of ``workers`` coroutines takes events off the queue on the
+    queue's own event loop, in a background thread, so processing never competes
+    with request handling. Coroutine handlers are awaited on that loop (they
+    should open their own HTTP clients rather than share the server's); plain
+    functions are treated as blocking and run on a pool of ``workers`` threads.
+
+    Events still queued when the server shuts down are drained by ``close``.
+    Events are not persisted: a crash loses whatever was accepted but not yet
+    processed.
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        maxsize: int = 1000,
+        workers: int = 4,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            handler (Callable): Processes one event. A coroutine function, or a
+                blocking function run in a thread pool.
+            maxsize (int): Events that may wait at once; ``submit`` refuses more.
+            workers (int): Events processed concurrently.
+            buckets (Sequence[float]): Upper bounds, in seconds, of the wait and
+                processing latency histograms.
+        """
+        if maxsize < 1 or workers < 1:
+            raise ValueError("maxsize and workers must be >= 1")
+        self.handler = handler
+        self.maxsize = maxsize
+        self.workers = workers
+        self.blocking = not inspect.iscoroutinefunction(handler)
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._wait_time = Histogram(buckets)
+        self._processing_time = Histogram(buckets)
+        self._depth = 0
+        self._busy = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks = []
+
+    @classmethod
+    def from_settings(cls, handler: WebhookHandler, config: "Settings" = None) -> Optional["WebhookQueue"]:
+        """Build the queue configured through ``Settings``, or None when disabled."""
+        from src.core.config import get_settings
+
+        settings = config or get_settings()
+
+        if not settings.WEBHOOK_QUEUE_ENABLED:
+            return None
+        return cls(handler, maxsize=settings.WEBHOOK_QUEUE_SIZE, workers=settings.WEBHOOK_WORKERS)
+
+    @property
+    def depth(self) -> int:
+        """Events accepted and not yet picked up by a worker."""
+        return self._depth
+
+    def start(self) -> None:
+        """Start the worker loop. Called by the first ``submit`` if needed."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(ready,), name="webhook-queue", daemon=True)
+            self._thread.start()
+        ready.wait()
+
+    def submit(self, event: Any) -> bool:
+        """
+        Enqueue an event without waiting.
+
+        Returns:
+            bool: True if the event was accepted, False if the queue is full.
+        """
+        if self._thread is None:
+            self.start()
+        with self._lock:
+            if self._depth >= self.maxsize:
+                self.rejected += 1
+                return False
+            self._depth += 1
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (time.perf_counter(), event))
+        return True
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Wait until every accepted event has been processed.
+
+        Returns:
+            bool: False if ``timeout`` seconds passed first.
+        """
+        if self._thread is None:
+            return True
+        future = asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop)
+        try:
+            future.result(timeout)
+            return True
+        except FutureTimeoutError:
+            future.cancel()
+            return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Process the events still queued (for up to ``timeout`` seconds), then stop the workers."""
+        if self._thread is None:
+            return
+        if not self.join(timeout):
+            logger.warning("Webhook queue closed with %d event(s) unprocessed.", self._depth + self._busy)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the queue's readings.
+
+        Returns:
+            dict: ``depth`` (events waiting), ``in_progress``, ``maxsize``, ``workers``,
+            ``processed``, ``failed`` and ``rejected`` counts, and the ``wait`` and
+            ``processing`` latencies (``p50``, ``p90``, ``p99``, ``count`` and ``sum``
+            in seconds).
+        """
+        with self._lock:
+            return {
+                "depth": self._depth,
+                "in_progress": self._busy,
+                "maxsize": self.maxsize,
+                "workers": self.workers,
+                "processed": self.processed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "wait": _summary(self._wait_time),
+                "processing": _summary(self._processing_time),
+            }
+
+    def _run(self, ready: threading.Event) -> None:
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._queue = asyncio.Queue()
+        if self.blocking:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="webhook-worker")
+        self._tasks = [loop.create_task(self._work()) for _ in range(self.workers)]
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+            loop.close()
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            enqueued, event = await self._queue.get()
+            started = time.perf_counter()
+            with self._lock:
+                self._depth -= 1
+                self._busy += 1
+                self._wait_time.observe(started - enqueued)
+            failed = False
+            try:
+                if self.blocking:
+                    await loop.run_in_executor(self._executor, self.handler, event)
+                else:
+                    await self.handler(event)
+            except Exception as e:
+                failed = True
+                logger.error("Webhook processing failed: %s", e)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._processing_time.observe(time.perf_counter() - started)
+                    if failed:
+                        self.failed += 1
+                    else:
+                        self.processed += 1
+                self._queue.task_done()
+
+
+def _summary(histogram: Histogram) -> Dict[str, Optional[float]]:
+    return {
+        **{f"p{round(q * 100)}": histogram.quantile(q) for q in QUANTILES},
+        "count": histogram.count,
+        "sum": histogram.sum,
+    }
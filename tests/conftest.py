@@ -1,8 +1,29 @@
 import pytest
 from src.sdk.client import ApiClient
-from src.sdk.features.contacts import Contacts
-from src.sdk.features.messages import Messages
-from unittest.mock import patch
+from src.sdk.features.contacts import Contacts, AsyncContacts
+from src.sdk.features.messages import Messages, AsyncMessages
+from unittest.mock import patch, AsyncMock, MagicMock
+
+
+class FakeClock:
+    """Manually advanced time source; set or add to ``now`` to move time."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """
+    Fixture to provide a fake clock for components that take a ``clock`` argument.
+
+    Returns:
+        FakeClock: A clock starting at 0 that only moves when the test moves it.
+    """
+    return FakeClock()
 
 
 @pytest.fixture
@@ -61,3 +82,32 @@ def messages(mock_api_client):
         Messages: A Messages instance using the mocked ApiClient.
     """
     return Messages(client=mock_api_client)
+
+
+@pytest.fixture
+def mock_async_api_client():
+    """
+    Fixture to provide a mocked AsyncApiClient whose 'request' is awaitable.
+
+    Returns:
+        MagicMock: A mocked AsyncApiClient instance.
+    """
+    mock_client = MagicMock()
+    mock_client.request = AsyncMock(return_value={"success": True})
+    return mock_client
+
+
+@pytest.fixture
+def async_contacts(mock_async_api_client):
+    """
+    Fixture to provide an AsyncContacts instance with a mocked AsyncApiClient.
+    """
+    return AsyncContacts(client=mock_async_api_client)
+
+
+@pytest.fixture
+def async_messages(mock_async_api_client):
+    """
+    Fixture to provide an AsyncMessages instance with a mocked AsyncApiClient.
+    """
+    return AsyncMessages(client=mock_async_api_client)
@@ -16,7 +16,7 @@ def test_create_and_retrieve_contact(mock_api_client, contacts):
 
     # Step 1: Create a contact
     contact_payload = {"name": "John Doe", "phone": "+123456789"}
-    created_contact = contacts.create_contact(contact_payload)
+    created_contact = contacts.create_contact(contact_payload, as_dict=True)
     assert created_contact == create_response, "Failed to create contact."
 
     # Mock the API response for retrieving the contact
@@ -28,7 +28,7 @@ def test_create_and_retrieve_contact(mock_api_client, contacts):
     mock_api_client.request.return_value = retrieve_response
 
     # Step 2: Retrieve the contact
-    retrieved_contact = contacts.get_contact(contact_id="contact123")
+    retrieved_contact = contacts.get_contact(contact_id="contact123", as_dict=True)
     assert retrieved_contact == retrieve_response, "Failed to retrieve contact."
 
     # Ensure API calls were made as expected
@@ -51,7 +51,7 @@ def test_update_contact_and_verify(mock_api_client, contacts):
 
     # Step 1: Update the contact
     update_payload = {"name": "Johnathan Doe", "phone": "+987654321"}
-    updated_contact = contacts.update_contact(contact_id="contact123", payload=update_payload)
+    updated_contact = contacts.update_contact(contact_id="contact123", payload=update_payload, as_dict=True)
     assert updated_contact == update_response, "Failed to update contact."
 
     # Mock the API response for retrieving the updated contact
@@ -63,7 +63,7 @@ def test_update_contact_and_verify(mock_api_client, contacts):
     mock_api_client.request.return_value = retrieve_response
 
     # Step 2: Retrieve the updated contact
-    retrieved_contact = contacts.get_contact(contact_id="contact123")
+    retrieved_contact = contacts.get_contact(contact_id="contact123", as_dict=True)
     assert retrieved_contact == retrieve_response, "Failed to verify updated contact."
 
     # Ensure API calls were made as expected
@@ -114,7 +114,7 @@ def test_list_contacts_with_pagination(mock_api_client, contacts):
     mock_api_client.request.return_value = list_response
 
     # Step 1: Call the list_contacts method with page and max arguments
-    contacts_list = contacts.list_contacts(page=1, max=2)
+    contacts_list = contacts.list_contacts(page=1, max=2, as_dict=True)
 
     # Validate the response
     assert contacts_list == list_response, "Failed to list contacts with pagination."
@@ -27,7 +27,7 @@ def test_send_message_and_verify(mock_api_client, messages):
         "content": "Hello, World!",
         "from": "+987654321"  # Use the correct field name
     }
-    sent_message = messages.send_message(payload=send_payload)
+    sent_message = messages.send_message(payload=send_payload, as_dict=True)
     assert sent_message == send_response, "Failed to send message."
 
     # Step 3: Mock the API response for retrieving the message
@@ -46,7 +46,7 @@ def test_send_message_and_verify(mock_api_client, messages):
     mock_api_client.request.return_value = retrieve_response
 
     # Step 4: Retrieve the message and verify its details
-    retrieved_message = messages.get_message(message_id="msg123")
+    retrieved_message = messages.get_message(message_id="msg123", as_dict=True)
     assert retrieved_message == retrieve_response, "Failed to retrieve the sent message."
 
     # Ensure the API calls were made as expected
@@ -85,7 +85,7 @@ def test_list_messages_with_pagination(mock_api_client, messages):
     mock_api_client.request.return_value = list_response
 
     # Step 2: List messages
-    messages_list = messages.list_messages(page=1, limit=2)
+    messages_list = messages.list_messages(page=1, limit=2, as_dict=True)
     assert messages_list == list_response, "Failed to list messages with pagination."
 
     # Ensure the API call was made as expected
@@ -115,7 +115,7 @@ def test_resend_failed_message(mock_api_client, messages):
     mock_api_client.request.return_value = retrieve_response
 
     # Step 2: Retrieve the failed message
-    failed_message = messages.get_message(message_id="msg123")
+    failed_message = messages.get_message(message_id="msg123", as_dict=True)
     assert failed_message == retrieve_response, "Failed to retrieve the failed message."
 
     # Step 3: Mock the API response for resending the message
@@ -139,7 +139,7 @@ def test_resend_failed_message(mock_api_client, messages):
     mock_api_client.request.return_value = resend_response
 
     # Step 4: Resend the message
-    resent_message = messages.send_message(payload=resend_payload)
+    resent_message = messages.send_message(payload=resend_payload, as_dict=True)
     assert resent_message == resend_response, "Failed to resend the failed message."
 
     # Ensure the API calls were made as expected
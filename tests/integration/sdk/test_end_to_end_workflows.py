@@ -26,12 +26,12 @@ def test_send_and_check_message_workflow(messages, mock_api_client):
     mock_api_client.request.return_value = sent_message_response
 
     # Send the message
-    sent_message = messages.send_message(payload=send_payload)
+    sent_message = messages.send_message(payload=send_payload, as_dict=True)
     assert sent_message == sent_message_response, "Message sending failed."
 
     # Step 2: Check the status of the message
     mock_api_client.request.return_value = sent_message_response
-    retrieved_message = messages.get_message(message_id="msg123")
+    retrieved_message = messages.get_message(message_id="msg123", as_dict=True)
     assert retrieved_message == sent_message_response, "Failed to retrieve the sent message."
 
     # Ensure the API was called as expected
@@ -56,7 +56,7 @@ def test_list_contacts_and_messages_workflow(contacts, messages, mock_api_client
     mock_api_client.request.return_value = contacts_list_response
 
     # Call the list_contacts method
-    contacts_list = contacts.list_contacts()
+    contacts_list = contacts.list_contacts(as_dict=True)
     assert contacts_list == contacts_list_response, "Failed to list contacts."
 
     # Assert the API call was made with correct parameters
@@ -83,7 +83,7 @@ def test_list_contacts_and_messages_workflow(contacts, messages, mock_api_client
     mock_api_client.request.return_value = messages_list_response
 
     # Call the list_messages method
-    messages_list = messages.list_messages()
+    messages_list = messages.list_messages(as_dict=True)
     assert messages_list == messages_list_response, "Failed to list messages."
 
     # Assert the API call was made with correct parameters
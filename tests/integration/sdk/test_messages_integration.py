@@ -22,7 +22,7 @@ def test_send_message_success(messages, mock_api_client):
         "sender": "Sender123"
     }
 
-    result = messages.send_message(payload)
+    result = messages.send_message(payload, as_dict=True)
 
     mock_api_client.request.assert_called_once_with(
         "POST", "/messages", json=payload
@@ -70,7 +70,7 @@ def test_list_messages_success(messages, mock_api_client):
     }
     mock_api_client.request.return_value = mock_response
 
-    result = messages.list_messages(page=1, limit=10)
+    result = messages.list_messages(page=1, limit=10, as_dict=True)
 
     mock_api_client.request.assert_called_once_with(
         "GET", "/messages", params={"page": 1, "limit": 10}
@@ -103,7 +103,7 @@ def test_get_message_success(messages, mock_api_client):
     }
     mock_api_client.request.return_value = mock_response
 
-    result = messages.get_message("msg123")
+    result = messages.get_message("msg123", as_dict=True)
 
     mock_api_client.request.assert_called_once_with(
         "GET", "/messages/msg123"
@@ -0,0 +1,172 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+from src.sdk.client import AsyncApiClient
+from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, ContactNotFoundError
+from src.core.config import settings
+
+
+def make_client(handler):
+    """Build an AsyncApiClient backed by an in-memory httpx transport."""
+    return AsyncApiClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_async_request_success():
+    """Test a successful async API request sends auth headers and decodes JSON."""
+    seen = {}
+
+    def handler(request):
+        seen["url"] = str(request.url)
+        seen["auth"] = request.headers["Authorization"]
+        return httpx.Response(200, json={"success": True})
+
+    async with make_client(handler) as client:
+        response = await client.request("GET", "/contacts", params={"pageIndex": 1})
+
+    assert response == {"success": True}
+    assert seen["url"] == f"{settings.BASE_URL}/contacts?pageIndex=1"
+    assert seen["auth"] == f"Bearer {settings.API_KEY}"
+
+
+@pytest.mark.asyncio
+async def test_async_request_delete_returns_none():
+    """Test that a 204 response maps to None."""
+    async with make_client(lambda request: httpx.Response(204)) as client:
+        assert await client.request("DELETE", "/contacts/123") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, error", [
+    (401, UnauthorizedError),
+    (404, NotFoundError),
+    (500, ServerError),
+    (418, ApiError),
+])
+async def test_async_request_error_mapping(status, error):
+    """Test that the async client maps status codes to the same errors as ApiClient."""
+    async with make_client(lambda request: httpx.Response(status, text="boom")) as client:
+        with pytest.raises(error):
+            await client.request("GET", "/contacts")
+
+
+@pytest.mark.asyncio
+async def test_async_retry_does_not_block_event_loop():
+    """Test that transient errors are retried with asyncio.sleep instead of time.sleep."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    with patch("src.core.retry.asyncio.sleep") as mock_sleep, patch("src.core.retry.time.sleep") as mock_time_sleep:
+        async with make_client(handler) as client:
+            assert await client.request("GET", "/messages") == {"ok": True}
+
+    assert len(calls) == 3
+    assert mock_sleep.await_count == 2
+    mock_time_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_send_message(async_messages, mock_async_api_client):
+    """Test sending a message through AsyncMessages."""
+    mock_async_api_client.request.return_value = {
+        "id": "msg123",
+        "from": "+123456789",
+        "to": {"id": "contact123"},
+        "content": "Hello, World!",
+        "status": "queued",
+        "createdAt": "2024-11-28T10:00:00Z"
+    }
+    payload = {"to": {"id": "contact123"}, "content": "Hello, World!", "from": "+123456789"}
+
+    response = await async_messages.send_message(payload=payload)
+
+    mock_async_api_client.request.assert_awaited_once_with("POST", "/messages", json=payload)
+    assert response.id == "msg123"
+
+
+@pytest.mark.asyncio
+async def test_async_send_message_validation_error(async_messages, mock_async_api_client):
+    """Test that invalid payloads are rejected before any request is made."""
+    with pytest.raises(ValueError, match="Invalid payload"):
+        await async_messages.send_message(payload={"to": "+987654321"})
+    mock_async_api_client.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_list_messages(async_messages, mock_async_api_client):
+    """Test listing messages through AsyncMessages."""
+    mock_async_api_client.request.return_value = {"messages": [], "page": 2, "quantityPerPage": 5}
+
+    response = await async_messages.list_messages(page=2, limit=5)
+
+    mock_async_api_client.request.assert_awaited_once_with("GET", "/messages", params={"page": 2, "limit": 5})
+    assert response.page == 2
+
+
+@pytest.mark.asyncio
+async def test_async_contacts_crud(async_contacts, mock_async_api_client):
+    """Test the AsyncContacts create, get, update and delete flow."""
+    contact = {"id": "123", "name": "John Doe", "phone": "+123456789"}
+    mock_async_api_client.request.return_value = contact
+
+    assert (await async_contacts.create_contact(payload={"name": "John Doe", "phone": "+123456789"})).id == "123"
+    assert (await async_contacts.get_contact(contact_id="123")).name == "John Doe"
+    assert (await async_contacts.update_contact(contact_id="123", payload={"name": "John Doe", "phone": "+1"}))
+    mock_async_api_client.request.return_value = None
+    await async_contacts.delete_contact(contact_id="123")
+
+    mock_async_api_client.request.assert_any_await("DELETE", "/contacts/123")
+    assert mock_async_api_client.request.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_list_contacts(async_contacts, mock_async_api_client):
+    """Test listing contacts through AsyncContacts."""
+    mock_async_api_client.request.return_value = {"contactsList": [], "pageNumber": 1, "pageSize": 10}
+
+    response = await async_contacts.list_contacts(page=1, max=10)
+
+    mock_async_api_client.request.assert_awaited_once_with("GET", "/contacts", params={"pageIndex": 1, "max": 10})
+    assert response.page_size == 10
+
+
+@pytest.mark.asyncio
+async def test_async_get_contact_not_found(async_contacts, mock_async_api_client):
+    """Test that resource errors propagate from AsyncContacts."""
+    mock_async_api_client.request.side_effect = ContactNotFoundError(id="missing", message="Contact not found.")
+
+    with pytest.raises(ContactNotFoundError, match="Contact not found."):
+        await async_contacts.get_contact(contact_id="missing")
+
+
+@pytest.mark.asyncio
+async def test_async_send_many_bounds_concurrency(async_messages, mock_async_api_client):
+    """Test that async bulk sends never exceed the concurrency limit."""
+    state = {"in_flight": 0, "peak": 0}
+
+    async def fake_request(method, endpoint, json):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.001)
+        state["in_flight"] -= 1
+        return {"id": json["content"], "from": "+1", "to": "c", "content": json["content"],
+                "status": "queued", "createdAt": "2024-11-28T10:00:00Z"}
+
+    mock_async_api_client.request.side_effect = fake_request
+
+    async def payloads():
+        for i in range(20):
+            yield {"to": {"id": "c"}, "content": str(i), "from": "+1"}
+
+    results = [r async for r in async_messages.send_many(payloads(), concurrency=4)]
+
+    assert len(results) == 20
+    assert all(r.ok for r in results)
+    assert state["peak"] == 4
+    assert sorted(r.result.id for r in results) == sorted(str(i) for i in range(20))
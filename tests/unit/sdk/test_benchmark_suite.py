@@ -0,0 +1,24 @@
+from benchmarks.suite import WEBHOOK_APP_STATE, compare, run
+from src.server import app as app_module
+
+
+def test_suite_runs_every_scenario():
+    """Test a tiny run reports each scenario and every webhook call is accepted."""
+    before = {name: getattr(app_module, name) for name in WEBHOOK_APP_STATE}
+    report = run(operations=4, concurrency=2, page_size=5, page_sizes=(5,), iterations=2, signature_sizes=(256,))
+
+    results = report["results"]
+    for name in ("sdk.sync.send_message", "sdk.async.list_messages", "validation.messages.5.off", "signature.verify.256B"):
+        assert results[name]["ops"] > 0 and results[name]["p99_ms"] >= results[name]["p50_ms"]
+    assert results["webhooks.post"]["statuses"] == {"200": 5}
+    assert report["meta"]["parameters"]["operations"] == 4
+    # The queue, dedup and status stores built for the run do not leak into later tests
+    assert {name: getattr(app_module, name) for name in WEBHOOK_APP_STATE} == before
+
+
+def test_compare_flags_throughput_drops_beyond_tolerance():
+    """Test only scenarios slower than the tolerance allows are reported."""
+    baseline = {"results": {"a": {"ops_per_second": 100.0}, "b": {"ops_per_second": 100.0}}}
+    current = {"results": {"a": {"ops_per_second": 85.0}, "b": {"ops_per_second": 70.0}, "new": {"ops_per_second": 1.0}}}
+
+    assert [r["scenario"] for r in compare(current, baseline, tolerance=0.2)] == ["b"]
@@ -0,0 +1,131 @@
+import json
+from unittest.mock import patch, MagicMock
+from src.core.cache import ResponseCache
+from src.sdk.client import ApiClient
+from src.sdk.features.contacts import Contacts
+
+
+def make_response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.content = json.dumps(body).encode()
+    return response
+
+
+def test_cache_hit_miss_and_ttl_expiry(clock):
+    """Test cached entries are served until their TTL expires."""
+    cache = ResponseCache(ttls={"/contacts/{id}": 10}, clock=clock)
+
+    assert cache.get("/contacts/1") is None
+    cache.set("/contacts/1", {"id": "1"}, ttl=10)
+    assert cache.get("/contacts/1") == {"id": "1"}
+    clock.now = 10
+    assert cache.get("/contacts/1") is None
+    assert cache.snapshot() == {
+        "hits": 1, "misses": 2, "evictions": 0, "expirations": 1, "invalidations": 0, "entries": 0, "bytes": 0,
+    }
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when the entry limit is reached."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("/contacts/1", {"id": "1"}, ttl=60)
+    cache.set("/contacts/2", {"id": "2"}, ttl=60)
+    cache.get("/contacts/1")
+    cache.set("/contacts/3", {"id": "3"}, ttl=60)
+
+    assert cache.get("/contacts/2") is None
+    assert cache.get("/contacts/1") == {"id": "1"}
+    assert cache.stats.evictions == 1
+
+
+def test_cache_byte_limit():
+    """Test the total body size stays within ``max_bytes``."""
+    cache = ResponseCache(max_bytes=100)
+    cache.set("/contacts/1", {"id": "1"}, ttl=60, size=60)
+    cache.set("/contacts/2", {"id": "2"}, ttl=60, size=60)
+    cache.set("/contacts/3", {"id": "3"}, ttl=60, size=200)
+
+    assert cache.snapshot()["bytes"] == 60
+    assert cache.get("/contacts/1") is None
+    assert cache.get("/contacts/3") is None
+
+
+def test_cache_returns_copies():
+    """Test callers cannot mutate cached entries."""
+    cache = ResponseCache()
+    cache.set("/contacts/1", {"id": "1"}, ttl=60)
+    cache.get("/contacts/1")["id"] = "changed"
+
+    assert cache.get("/contacts/1") == {"id": "1"}
+
+
+def test_ttl_for_only_covers_single_resource_gets():
+    """Test only GETs on endpoints with a TTL are cacheable."""
+    cache = ResponseCache()
+
+    assert cache.ttl_for("GET", "/contacts/abc") == 300
+    assert cache.ttl_for("GET", "/contacts") is None
+    assert cache.ttl_for("PATCH", "/contacts/abc") is None
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_get_contact_is_cached_and_invalidated_on_update_and_delete(mock_request):
+    """Test get_contact hits the network once, and update/delete invalidate the cached contact."""
+    contact = {"id": "1", "name": "John Doe", "phone": "+123456789"}
+    mock_request.return_value = make_response(contact)
+    client = ApiClient(cache=ResponseCache())
+    contacts = Contacts(client)
+
+    assert contacts.get_contact("1", as_dict=True) == contact
+    assert contacts.get_contact("1").name == "John Doe"
+    assert mock_request.call_count == 1
+
+    contacts.update_contact("1", {"name": "John Doe", "phone": "+123456789"})
+    contacts.get_contact("1")
+    assert mock_request.call_count == 3
+
+    mock_request.return_value = make_response(None, status_code=204)
+    contacts.delete_contact("1")
+    assert client.cache_stats()["entries"] == 0
+    assert client.cache_stats()["invalidations"] == 2
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_cache_stores_raw_body_for_typed_and_dict_callers(mock_request):
+    """Test one cached body serves both typed results and plain ``client.request`` callers."""
+    contact = {"id": "1", "name": "John Doe", "phone": "+123456789"}
+    mock_request.return_value = make_response(contact)
+    client = ApiClient(cache=ResponseCache())
+
+    assert Contacts(client).get_contact("1").name == "John Doe"
+    assert client.request("GET", "/contacts/1") == contact
+    assert mock_request.call_count == 1
+    assert client.cache_stats()["bytes"] == len(json.dumps(contact))
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_cache_hits_are_not_counted_as_attempts(mock_request):
+    """Test reads served from the cache neither count as attempts nor earn retry budget."""
+    mock_request.return_value = make_response({"id": "1", "name": "John Doe", "phone": "+123456789"})
+    client = ApiClient(cache=ResponseCache())
+
+    for _ in range(3):
+        client.request("GET", "/contacts/1")
+
+    assert client.retry_stats()["attempts"] == 1
+    assert client.cache_stats()["hits"] == 2
+
+
+def test_read_racing_with_a_write_is_not_cached():
+    """Test a response fetched before an invalidation is not stored after it."""
+    cache = ResponseCache()
+    generation = cache.generation  # GET starts
+    cache.invalidate("/contacts/1")  # PATCH lands while the GET is in flight
+    cache.set("/contacts/1", b'{"id": "1"}', ttl=60, generation=generation)
+    assert cache.get("/contacts/1") is None
+
+    cache.set("/contacts/1", b'{"id": "1"}', ttl=60, generation=cache.generation)
+    cache.set("/contacts/2", b'{"id": "2"}', ttl=60, generation=generation)  # Other endpoints are unaffected
+    assert cache.snapshot()["entries"] == 2
@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from src.sdk.client import ApiClient
+from src.core.retry import RetryPolicy
+from src.core.requests import endpoint_template
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from src.core.exceptions import CircuitOpenError, NotFoundError, RateLimitError, ServerError, TransientError
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("POST /messages", failure_rate_threshold=0.5, minimum_calls=4, window_size=4,
+                          open_timeout=10, half_open_probes=2, clock=clock)
+
+
+def test_endpoint_template():
+    """Test that resource IDs collapse into a route template."""
+    assert endpoint_template("/messages") == "/messages"
+    assert endpoint_template("/contacts/abc123") == "/contacts/{id}"
+    assert endpoint_template("/contacts/abc123?expand=1") == "/contacts/{id}"
+
+
+def test_breaker_opens_at_failure_rate(breaker):
+    """Test that the breaker opens once the failure rate reaches the threshold."""
+    breaker.record(ServerError())
+    breaker.record()
+    breaker.record(TransientError(status_code=503))
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record()
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == 10
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_client_errors_do_not_trip_breaker(breaker):
+    """Test that 4xx errors are treated as healthy responses."""
+    for _ in range(4):
+        breaker.record(NotFoundError())
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_probes_close_breaker(breaker, clock):
+    """Test that successful probes close the breaker after the open timeout."""
+    for _ in range(4):
+        breaker.record(ServerError())
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # Only two probes allowed in flight
+
+    breaker.record()
+    breaker.record()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_failure_reopens_breaker(breaker, clock):
+    """Test that a failed probe opens the breaker again."""
+    for _ in range(4):
+        breaker.record(ServerError())
+    clock.now = 10
+    breaker.before_call()
+    breaker.record(ServerError())
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_rate_limiting_does_not_trip_breaker(breaker, clock):
+    """Test that 429s neither open the breaker nor count as successful probes."""
+    for _ in range(4):
+        breaker.record(RateLimitError(retry_after=1.0))
+    assert breaker.state is CircuitState.CLOSED
+
+    for _ in range(4):
+        breaker.record(ServerError())
+    clock.now = 10
+    ticket = breaker.before_call()
+    breaker.record(RateLimitError(), ticket)
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+    breaker.before_call()  # The 429 gave its probe slot back
+
+
+def test_late_outcomes_do_not_count_as_probes(breaker, clock):
+    """Test that calls admitted before the breaker opened cannot close it."""
+    slow = [breaker.before_call() for _ in range(2)]
+    for _ in range(4):
+        breaker.record(ServerError())
+    clock.now = 10
+    probe = breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.record(None, slow[0])
+    breaker.record(ServerError(), slow[1])
+    breaker.record(None, probe)
+    assert breaker.state is CircuitState.HALF_OPEN  # One of two probes succeeded, late calls ignored
+
+
+@patch("src.sdk.client.time.sleep", side_effect=KeyboardInterrupt)
+def test_client_releases_probe_when_interrupted_before_sending(mock_sleep, clock):
+    """Test that a probe interrupted during the rate-limit wait frees its slot."""
+    breaker = CircuitBreaker("GET /contacts", minimum_calls=1, window_size=1, open_timeout=10, clock=clock)
+    registry = CircuitBreakerRegistry()
+    registry._breakers["GET /contacts"] = breaker
+    rate_limiter = MagicMock()
+    rate_limiter.acquire.return_value = 1.0
+    client = ApiClient(circuit_breakers=registry, rate_limiter=rate_limiter, retry_policy=RetryPolicy(max_attempts=1))
+    breaker.record(ServerError())
+    clock.now = 10
+
+    with pytest.raises(KeyboardInterrupt):
+        client.request("GET", "/contacts")
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()  # The probe slot is free again
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_client_fails_fast_when_circuit_open(mock_request, mock_sleep):
+    """Test that an open circuit rejects calls without touching the network."""
+    registry = CircuitBreakerRegistry(minimum_calls=2, window_size=2, open_timeout=60)
+    client = ApiClient(circuit_breakers=registry, retry_policy=RetryPolicy(max_attempts=1))
+    mock_request.return_value = MagicMock(status_code=500, ok=False, text="down", headers={})
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.request("POST", "/messages", json={})
+
+    with pytest.raises(CircuitOpenError):
+        client.request("POST", "/messages", json={})
+    assert mock_request.call_count == 2
+
+    # Other endpoints have their own breaker
+    mock_request.return_value = MagicMock(status_code=200, ok=True)
+    mock_request.return_value.json.return_value = {"id": "1"}
+    assert client.request("GET", "/contacts/1") == {"id": "1"}
+
+    state = client.circuit_state()
+    assert state["POST /messages"]["state"] == "open"
+    assert state["GET /contacts/{id}"]["state"] == "closed"
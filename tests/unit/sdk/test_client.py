@@ -1,7 +1,8 @@
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 from src.sdk.client import ApiClient
-from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError
+from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, TransientError
 from src.core.config import settings
 
 
@@ -13,7 +14,7 @@ def api_client():
         return ApiClient()
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_success(mock_request, api_client):
     """Test a successful API request."""
     # Mock response
@@ -33,12 +34,13 @@ def test_request_success(mock_request, api_client):
         headers={
             "Authorization": f"Bearer {settings.API_KEY}",
             "Content-Type": "application/json"
-        }
+        },
+        timeout=(settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT),
     )
     assert response == {"success": True}
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_unauthorized(mock_request, api_client):
     """Test 401 UnauthorizedError."""
     mock_response = MagicMock()
@@ -51,7 +53,7 @@ def test_request_unauthorized(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_not_found(mock_request, api_client):
     """Test 404 NotFoundError."""
     mock_response = MagicMock()
@@ -64,7 +66,7 @@ def test_request_not_found(mock_request, api_client):
         api_client.request("GET", "/contacts/non-existent")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_server_error(mock_request, api_client):
     """Test 500 ServerError."""
     mock_response = MagicMock()
@@ -77,7 +79,7 @@ def test_request_server_error(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_generic_error(mock_request, api_client):
     """Test a generic ApiError for unexpected status codes."""
     mock_response = MagicMock()
@@ -90,16 +92,101 @@ def test_request_generic_error(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
-def test_retry_logic(mock_request, api_client):
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_logic(mock_request, mock_sleep, api_client):
     """Test retry logic for transient errors."""
     mock_response = MagicMock()
     mock_response.status_code = 503
     mock_response.ok = False
+    mock_response.headers = {}
     mock_request.side_effect = [mock_response, mock_response, mock_response]
 
-    with pytest.raises(RuntimeError, match="Failed after 3 retries."):
+    # The last transient error is surfaced once all attempts are used
+    with pytest.raises(TransientError) as exc_info:
         api_client.request("GET", "/contacts")
+    assert exc_info.value.status_code == 503
 
     # Ensure retries happened 3 times
     assert mock_request.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert api_client.retry_stats()["give_ups"] == 1
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_honors_retry_after(mock_request, mock_sleep, api_client):
+    """Test that a 429 is retried after the server's Retry-After delay."""
+    throttled = MagicMock(status_code=429, ok=False, text="slow down", headers={"Retry-After": "7"})
+    success = MagicMock(status_code=200, ok=True)
+    success.json.return_value = {"success": True}
+    mock_request.side_effect = [throttled, success]
+
+    assert api_client.request("GET", "/contacts") == {"success": True}
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] >= 7
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_on_connection_error(mock_request, mock_sleep, api_client):
+    """Test that connection failures are retried."""
+    success = MagicMock(status_code=200, ok=True)
+    success.json.return_value = {"success": True}
+    mock_request.side_effect = [requests.exceptions.ConnectionError("refused"), success]
+
+    assert api_client.request("GET", "/contacts") == {"success": True}
+    assert mock_request.call_count == 2
+
+
+def test_client_reuses_pooled_session(api_client):
+    """Test that every request goes through the same pooled session."""
+    adapter = api_client.session.get_adapter(settings.BASE_URL)
+    assert adapter is api_client._adapter
+    assert adapter._pool_maxsize == settings.HTTP_POOL_MAXSIZE
+    assert adapter._pool_connections == settings.HTTP_POOL_CONNECTIONS
+
+
+def test_client_pool_overrides():
+    """Test that pool size and timeouts can be overridden per client."""
+    client = ApiClient(pool_connections=2, pool_maxsize=4, pool_block=True, timeout=(1, 2))
+    assert client._adapter._pool_connections == 2
+    assert client._adapter._pool_maxsize == 4
+    assert client._adapter._pool_block is True
+    assert client.timeout == (1, 2)
+    client.close()
+
+
+def test_client_context_manager_closes_session():
+    """Test that leaving the context manager closes the session."""
+    client = ApiClient()
+    with patch.object(client.session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+        mock_close.assert_called_once()
+
+
+def test_pool_stats_empty(api_client):
+    """Test pool stats before any connection is opened."""
+    assert api_client.pool_stats() == {
+        "pools": 0,
+        "in_use": 0,
+        "idle": 0,
+        "created": 0,
+        "maxsize": settings.HTTP_POOL_MAXSIZE,
+    }
+
+
+def test_pool_stats_counts_connections(api_client):
+    """Test pool stats reflect idle and in-use connections per host."""
+    pool = api_client._adapter.poolmanager.connection_from_url(settings.BASE_URL)
+    conn = pool._get_conn()
+    stats = api_client.pool_stats()
+    assert stats["pools"] == 1
+    assert stats["in_use"] == 1
+    assert stats["created"] == 1
+
+    pool._put_conn(conn)
+    stats = api_client.pool_stats()
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
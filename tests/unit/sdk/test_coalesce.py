@@ -0,0 +1,118 @@
+import time
+import asyncio
+import threading
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+from src.core.coalesce import SingleFlight
+from src.core.exceptions import NotFoundError
+from src.sdk.client import ApiClient, AsyncApiClient
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_key_for_only_coalesces_plain_reads():
+    """Test only GET/HEAD requests without a body share a key."""
+    assert SingleFlight.key_for("GET", "/contacts/1", {}) == ("GET", "/contacts/1", ())
+    assert SingleFlight.key_for("get", "/contacts", {"params": {"max": 5}}) == ("GET", "/contacts", (("max", 5),))
+    assert SingleFlight.key_for("POST", "/messages", {"json": {}}) is None
+    assert SingleFlight.key_for("GET", "/contacts/1", {"headers": {"X": "1"}}) is None
+
+
+def test_sync_duplicate_gets_share_one_call():
+    """Test concurrent identical GETs from threads cost one HTTP call and get equal, independent results."""
+    client = ApiClient(single_flight=SingleFlight())
+    followers = 4
+
+    def slow_request(*args, **kwargs):
+        wait_for(lambda: client.coalesce_stats()["coalesced"] == followers)
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = {"id": "1"}
+        return response
+
+    with patch("src.sdk.client.requests.Session.request", side_effect=slow_request) as mock_request:
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.request("GET", "/contacts/1")))
+            for _ in range(followers + 1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_request.call_count == 1
+    assert results == [{"id": "1"}] * (followers + 1)
+    assert len({id(result) for result in results}) == followers + 1
+    assert client.coalesce_stats() == {"executions": 1, "coalesced": followers}
+
+
+def test_sync_followers_receive_leader_error():
+    """Test an error of the shared call is raised in every waiting caller."""
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def leader():
+        started.set()
+        wait_for(lambda: flight.stats.coalesced == 1)
+        raise NotFoundError("Resource not found.")
+
+    def call(fn):
+        try:
+            flight.do("key", fn)
+        except NotFoundError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=call, args=(leader,))
+    first.start()
+    started.wait()
+    second = threading.Thread(target=call, args=(lambda: pytest.fail("follower must not run"),))
+    second.start()
+    first.join()
+    second.join()
+
+    assert len(errors) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_duplicate_gets_share_one_call():
+    """Test concurrent identical GETs from tasks cost one HTTP call."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "1"})
+
+    async with AsyncApiClient(transport=httpx.MockTransport(handler), single_flight=SingleFlight()) as client:
+        results = await asyncio.gather(*(client.request("GET", "/messages/1") for _ in range(10)))
+        await client.request("POST", "/messages", json={})
+        await client.request("POST", "/messages", json={})
+
+        assert results == [{"id": "1"}] * 10
+        assert calls.count("/messages/1") == 1
+        assert calls.count("/messages") == 2
+        assert client.coalesce_stats() == {"executions": 1, "coalesced": 9}
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_shared_call():
+    """Test cancelling the first caller leaves the shared call running for the others."""
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {"id": "1"}
+
+    first = asyncio.ensure_future(flight.do_async("key", fetch))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(flight.do_async("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"id": "1"}
@@ -0,0 +1,120 @@
+import json
+import hmac
+import hashlib
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+from src.core import codec as codec_module
+from src.core.codec import StdlibJsonCodec, OrjsonCodec, build_codec, get_codec, set_codec
+from src.core.security import generate_signature, hmac_signer
+from src.sdk.client import ApiClient, AsyncApiClient
+
+
+PAYLOAD = {"to": {"id": "contact-1"}, "content": "Héllo", "from": "+123456789"}
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    """Restore the process-wide codec after each test."""
+    previous = codec_module._codec
+    yield
+    codec_module._codec = previous
+
+
+@pytest.mark.parametrize("codec", [StdlibJsonCodec(), OrjsonCodec()])
+def test_codecs_round_trip_to_compact_bytes(codec):
+    """Test both codecs emit identical compact UTF-8 bytes and decode them back."""
+    body = codec.dumps(PAYLOAD)
+
+    assert isinstance(body, bytes)
+    assert body == json.dumps(PAYLOAD, separators=(",", ":"), ensure_ascii=False).encode()
+    assert codec.loads(body) == PAYLOAD
+    assert codec.loads(memoryview(body)) == PAYLOAD
+
+
+def test_build_codec_by_name():
+    """Test auto prefers orjson when installed and unknown names are rejected."""
+    assert build_codec("auto").name == "orjson"
+    assert build_codec("stdlib").name == "stdlib"
+    with patch.object(codec_module, "orjson", None):
+        assert build_codec("auto").name == "stdlib"
+        with pytest.raises(ImportError):
+            build_codec("orjson")
+    with pytest.raises(ValueError):
+        build_codec("yaml")
+
+
+def test_set_codec_replaces_the_process_codec():
+    """Test the process-wide codec can be swapped by name or instance."""
+    set_codec("stdlib")
+    assert get_codec().name == "stdlib"
+    custom = OrjsonCodec()
+    set_codec(custom)
+    assert get_codec() is custom
+
+
+def test_generate_signature_signs_bytes_as_sent():
+    """Test raw bytes are signed as is, whatever the codec, and dicts keep the stdlib encoding."""
+    body = get_codec().dumps(PAYLOAD)
+    assert generate_signature(body, "secret") == hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+    baseline = json.dumps(PAYLOAD, separators=(",", ":")).encode()
+    for codec in ("orjson", "stdlib"):
+        set_codec(codec)
+        assert generate_signature(PAYLOAD, "secret") == hmac.new(b"secret", baseline, hashlib.sha256).hexdigest()
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_body_is_encoded_once_and_signed_as_sent(mock_request):
+    """Test the JSON body is encoded once, sent as bytes and signed over those bytes."""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"ok": True}
+    mock_request.return_value = response
+    codec = MagicMock(wraps=StdlibJsonCodec())
+    signer = MagicMock(wraps=hmac_signer("secret"))
+    client = ApiClient(codec=codec, request_signer=signer)
+
+    client.request("POST", "/messages", json=PAYLOAD)
+
+    codec.dumps.assert_called_once_with(PAYLOAD)
+    sent = mock_request.call_args.kwargs
+    assert "json" not in sent
+    assert sent["data"] == StdlibJsonCodec().dumps(PAYLOAD)
+    signer.assert_called_once_with("POST", "/messages", sent["data"])
+    assert sent["headers"]["X-Signature"] == generate_signature(sent["data"], "secret")
+    assert sent["headers"]["Content-Type"] == "application/json"
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_retries_resend_the_same_encoded_body(mock_request):
+    """Test a retried request reuses the bytes encoded for the first attempt."""
+    failure = MagicMock(status_code=503, text="unavailable")
+    success = MagicMock(status_code=200)
+    success.json.return_value = {"ok": True}
+    mock_request.side_effect = [failure, success]
+    codec = MagicMock(wraps=StdlibJsonCodec())
+    client = ApiClient(codec=codec)
+
+    with patch("src.core.retry.time.sleep"):
+        assert client.request("POST", "/messages", json=PAYLOAD) == {"ok": True}
+
+    assert codec.dumps.call_count == 1
+    bodies = [call.kwargs["data"] for call in mock_request.call_args_list]
+    assert bodies[0] is bodies[1]
+
+
+@pytest.mark.asyncio
+async def test_async_client_sends_encoded_content():
+    """Test the async client sends the encoded bytes as the request content."""
+    seen = {}
+
+    def handler(request):
+        seen["body"] = request.content
+        seen["signature"] = request.headers["X-Signature"]
+        return httpx.Response(200, json={"ok": True})
+
+    async with AsyncApiClient(transport=httpx.MockTransport(handler), request_signer=hmac_signer("secret")) as client:
+        assert await client.request("POST", "/messages", json=PAYLOAD) == {"ok": True}
+
+    assert seen["body"] == get_codec().dumps(PAYLOAD)
+    assert seen["signature"] == generate_signature(seen["body"], "secret")
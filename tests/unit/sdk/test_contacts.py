@@ -15,9 +15,9 @@ def test_create_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("POST", "/contacts", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
-    assert response["phone"] == "+123456789"
+    assert response.id == "123"
+    assert response.name == "John Doe"
+    assert response.phone == "+123456789"
 
 
 def test_create_contact_validation_error(contacts):
@@ -57,10 +57,10 @@ def test_list_contacts_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/contacts", params={"pageIndex": 1, "max": 10})
-    assert response["pageNumber"] == 1
-    assert len(response["contactsList"]) == 1
-    assert response["contactsList"][0]["id"] == "123"
-    assert response["contactsList"][0]["name"] == "John Doe"
+    assert response.page_number == 1
+    assert len(response.contacts) == 1
+    assert response.contacts[0].id == "123"
+    assert response.contacts[0].name == "John Doe"
 
 
 def test_get_contact_success(contacts, mock_api_client):
@@ -73,9 +73,9 @@ def test_get_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/contacts/123")
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
-    assert response["phone"] == "+123456789"
+    assert response.id == "123"
+    assert response.name == "John Doe"
+    assert response.phone == "+123456789"
 
 
 def test_update_contact_success(contacts, mock_api_client):
@@ -91,9 +91,9 @@ def test_update_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("PATCH", "/contacts/123", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "Jane Doe"
-    assert response["phone"] == "+987654321"
+    assert response.id == "123"
+    assert response.name == "Jane Doe"
+    assert response.phone == "+987654321"
 
 
 def test_delete_contact_success(contacts, mock_api_client):
@@ -0,0 +1,17 @@
+from benchmarks.decode import run, message_page
+from src.schemas.messages import ListMessagesResponse
+
+
+def test_benchmark_pages_are_valid():
+    """Test the generated pages match the schemas, so both decode paths do the same work."""
+    page = ListMessagesResponse.model_validate_json(message_page(3))
+
+    assert [m.to.id for m in page.messages] == ["contact0", "contact1", "contact2"]
+
+
+def test_decode_benchmark_runs():
+    """Test the benchmark reports both decode paths for every resource and page size."""
+    results = run(page_sizes=[5], iterations=2)
+
+    assert [(r["resource"], r["page_size"]) for r in results] == [("messages", 5), ("contacts", 5)]
+    assert all(r["bytes"]["pages_per_second"] > 0 and r["dict"]["peak_bytes"] > 0 for r in results)
@@ -0,0 +1,107 @@
+import csv
+import json
+import pytest
+from src.sdk.export import ExportCheckpoint, export_records
+
+
+def make_source(total, page_size, fail_on=None):
+    """Return a page fetcher over ``total`` records, optionally failing on one page."""
+    def fetch(page):
+        if page == fail_on:
+            raise RuntimeError("connection lost")
+        start = (page - 1) * page_size
+        return [{"id": str(i), "name": f"n{i}"} for i in range(start, min(start + page_size, total))]
+    return fetch
+
+
+def read_ndjson(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_export_ndjson_in_page_order(tmp_path, workers):
+    """Test every record is written once, in page order, regardless of concurrency."""
+    output = tmp_path / "out.ndjson"
+
+    result = export_records(make_source(23, 5), str(output), page_size=5, workers=workers)
+
+    assert [r["id"] for r in read_ndjson(output)] == [str(i) for i in range(23)]
+    assert result.written == 23
+    assert result.pages == 5
+    assert not result.resumed
+
+
+def test_export_drops_records_shifted_across_pages(tmp_path):
+    """Test records repeated when the listing shifts are written only once."""
+    pages = {1: [{"id": "a"}, {"id": "b"}], 2: [{"id": "b"}, {"id": "c"}], 3: [{"id": "d"}]}
+    output = tmp_path / "out.ndjson"
+
+    result = export_records(lambda page: pages.get(page, []), str(output), page_size=2, workers=2)
+
+    assert [r["id"] for r in read_ndjson(output)] == ["a", "b", "c", "d"]
+    assert result.duplicates == 1
+
+
+def test_export_csv(tmp_path):
+    """Test CSV output has a single header and JSON-encoded nested values."""
+    pages = {1: [{"id": "1", "to": {"id": "c1"}}]}
+    output = tmp_path / "out.csv"
+
+    export_records(lambda page: pages.get(page, []), str(output), output_format="csv", page_size=2)
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"id": "1", "to": '{"id": "c1"}'}]
+
+
+def test_export_csv_of_empty_listing(tmp_path):
+    """Test an empty listing exports to an empty CSV file and clears its checkpoint."""
+    output = tmp_path / "out.csv"
+    checkpoint = tmp_path / "export.checkpoint"
+
+    result = export_records(lambda page: [], str(output), output_format="csv", checkpoint_path=str(checkpoint))
+
+    assert result.written == 0
+    assert output.read_text() == ""
+    assert not checkpoint.exists()
+
+
+def test_export_resumes_from_checkpoint(tmp_path):
+    """Test an interrupted export resumes after the last saved page and then clears its checkpoint."""
+    output = tmp_path / "out.ndjson"
+    checkpoint = tmp_path / "export.checkpoint"
+
+    with pytest.raises(RuntimeError):
+        export_records(make_source(12, 3, fail_on=3), str(output), page_size=3, workers=1,
+                       checkpoint_path=str(checkpoint))
+    assert ExportCheckpoint(str(checkpoint)).load()["next_page"] == 3
+
+    result = export_records(make_source(12, 3), str(output), page_size=3, workers=1, checkpoint_path=str(checkpoint))
+
+    assert result.resumed
+    assert [r["id"] for r in read_ndjson(output)] == [str(i) for i in range(12)]
+    assert not checkpoint.exists()
+
+
+def test_export_invalid_format(tmp_path):
+    """Test unsupported formats are rejected."""
+    with pytest.raises(ValueError):
+        export_records(lambda page: [], str(tmp_path / "out.xml"), output_format="xml")
+
+
+def test_export_messages(messages, mock_api_client, tmp_path):
+    """Test Messages.export_messages reads pages through list_messages."""
+    message = {
+        "id": "msg1", "from": "+123456789", "to": "+987654321", "content": "Hello",
+        "status": "delivered", "createdAt": "2024-11-28T10:00:00Z",
+    }
+    mock_api_client.request.side_effect = lambda method, endpoint, params: {
+        "messages": [message] if params["page"] == 1 else [], "page": params["page"], "quantityPerPage": 1,
+    }
+    output = tmp_path / "messages.ndjson"
+
+    result = messages.export_messages(str(output), page_size=1, workers=2)
+
+    assert result.written == 1
+    assert read_ndjson(output)[0]["id"] == "msg1"
@@ -0,0 +1,108 @@
+import httpx
+import pytest
+from unittest.mock import patch
+from src.core.exceptions import ServerError
+from src.core.hooks import PHASES, RequestHooks, current_trace
+from src.core.retry import RetryPolicy
+from src.sdk.client import AsyncApiClient
+from src.sdk.features.contacts import AsyncContacts
+
+CONTACT = {"id": "1", "name": "John Doe", "phone": "+123456789"}
+
+
+class RecordingHooks(RequestHooks):
+    """Hooks recording every event with a copy of the trace state."""
+
+    def __init__(self):
+        self.events = []
+
+    def _record(self, event, trace):
+        self.events.append((event, trace.attempt, trace.status, dict(trace.timings), trace.error))
+
+    def before_request(self, trace):
+        self._record("before_request", trace)
+
+    def after_response(self, trace):
+        self._record("after_response", trace)
+
+    def on_retry(self, trace):
+        self._record("on_retry", trace)
+
+    def on_error(self, trace):
+        self._record("on_error", trace)
+
+
+def make_client(responses, hooks, max_attempts=3):
+    responses = iter(responses)
+    return AsyncApiClient(
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0, budget=None),
+        hooks=[hooks],
+    )
+
+
+@pytest.mark.asyncio
+async def test_hooks_receive_every_phase_of_a_validated_call():
+    """Test a feature call emits before_request and after_response with all four phases timed."""
+    hooks = RecordingHooks()
+    async with make_client([httpx.Response(200, json=CONTACT)], hooks) as client:
+        contact = await AsyncContacts(client).create_contact(payload={"name": "John Doe", "phone": "+123456789"})
+
+    assert contact.id == "1"
+    assert [event[0] for event in hooks.events] == ["before_request", "after_response"]
+    _, attempt, status, timings, error = hooks.events[-1]
+    assert (attempt, status, error) == (1, 200, None)
+    assert set(timings) == set(PHASES)
+    assert all(timings[phase] > 0 for phase in PHASES)
+    assert current_trace() is None
+
+
+@pytest.mark.asyncio
+async def test_hooks_see_retries_and_final_error():
+    """Test each retry and the final failure are reported with the attempt that failed."""
+    hooks = RecordingHooks()
+    async with make_client([httpx.Response(503)] * 2, hooks, max_attempts=2) as client:
+        with pytest.raises(Exception):
+            await client.request("GET", "/contacts/1")
+
+    assert [event[:3] for event in hooks.events] == [
+        ("before_request", 1, None),
+        ("on_retry", 1, 503),
+        ("before_request", 2, None),
+        ("on_error", 2, 503),
+    ]
+    assert hooks.events[-1][4] is not None
+
+
+@pytest.mark.asyncio
+async def test_failing_hook_does_not_break_the_call():
+    """Test an exception raised by a hook is logged and the request still succeeds."""
+    class BrokenHooks(RequestHooks):
+        def before_request(self, trace):
+            raise ServerError("hook bug")
+
+    async with make_client([httpx.Response(200, json=CONTACT)], BrokenHooks()) as client:
+        assert await client.request("GET", "/contacts/1") == CONTACT
+
+
+@pytest.mark.asyncio
+async def test_client_without_hooks_keeps_no_trace():
+    """Test calls on a client without hooks neither start nor leave a trace."""
+    async with AsyncApiClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=CONTACT))) as client:
+        client.add_hook(RecordingHooks())
+        client.hooks = ()
+        assert await client.request("GET", "/contacts/1") == CONTACT
+
+    assert current_trace() is None
+
+
+@pytest.mark.asyncio
+async def test_validated_call_without_hooks_opens_no_trace():
+    """Test the validation decorators do not create a trace for a client without hooks."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=CONTACT))
+    async with AsyncApiClient(transport=transport) as client:
+        with patch("src.core.validators.open_trace") as open_trace:
+            contact = await AsyncContacts(client).get_contact("1")
+
+    assert contact.name == "John Doe"
+    open_trace.assert_not_called()
@@ -0,0 +1,51 @@
+import pytest
+from unittest.mock import patch
+from benchmarks.import_time import run
+from src.core import config as config_module
+from src.core.config import Settings, get_settings, set_settings, settings
+from src.sdk.client import ApiClient
+
+# Generous ceiling: catches an eager heavy import, not machine-to-machine noise
+IMPORT_BUDGET_MS = 1500
+
+
+def test_sdk_import_is_lazy_and_within_budget():
+    """Test importing the SDK needs no env, loads no HTTP library and writes nothing to disk."""
+    results = run(modules=["src.sdk.client", "src.sdk.features.contacts"], iterations=1)
+
+    for result in results:
+        assert result["heavy_modules"] == []
+        assert not result["settings_loaded"]
+        assert not result["created_logs_dir"]
+        assert result["median_ms"] < IMPORT_BUDGET_MS
+
+
+def test_client_uses_injected_config():
+    """Test a client built with an explicit config ignores the process-wide settings."""
+    config = Settings(API_KEY="explicit", WEBHOOK_SECRET="secret", BASE_URL="http://api.test", HTTP_POOL_MAXSIZE=3)
+
+    with ApiClient(config=config) as client:
+        assert (client.base_url, client.api_key, client.pool_maxsize) == ("http://api.test", "explicit", 3)
+    assert get_settings().API_KEY != "explicit"
+
+
+@pytest.fixture
+def restore_settings():
+    previous = config_module._settings
+    yield
+    if previous is not None:
+        set_settings(previous)
+    else:
+        # Nothing was loaded before: go back to lazy loading rather than passing None on
+        config_module._settings = None
+
+
+def test_settings_proxy_loads_on_first_access(restore_settings):
+    """Test the settings proxy defers loading and follows set_settings."""
+    with patch.object(config_module, "_settings", None):
+        assert repr(settings) == "<Settings (not loaded)>"
+        assert settings.API_KEY == get_settings().API_KEY
+        assert config_module._settings is not None
+
+    set_settings(Settings(API_KEY="replaced", WEBHOOK_SECRET="secret"))
+    assert settings.API_KEY == "replaced"
@@ -0,0 +1,107 @@
+import logging
+import pytest
+from src.core import logger as logger_module
+from src.core.logger import SamplingFilter, configure_logging, logger, webhook_logger
+from src.core.config import settings
+
+
+class Recorder(logging.Handler):
+    """Handler collecting the records that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """Restore the configured logging setup after each test."""
+    yield
+    configure_logging(mode=settings.LOG_MODE, level=settings.LOG_LEVEL, sample_rate=settings.LOG_SAMPLE_RATE)
+
+
+def make_record(msg, level=logging.DEBUG, args=()):
+    return logging.LogRecord("logger.sdk", level, __file__, 1, msg, args, None)
+
+
+def test_sampling_filter_keeps_one_in_rate_per_template():
+    """Test repeated templates are sampled while warnings always pass."""
+    sampler = SamplingFilter(rate=3)
+
+    kept = [sampler.filter(make_record("Fetching %s", args=(i,))) for i in range(7)]
+    assert kept == [True, False, False, True, False, False, True]
+    assert sampler.filter(make_record("Other %s", args=(1,)))
+    assert all(sampler.filter(make_record("Boom", level=logging.WARNING)) for _ in range(5))
+
+
+def test_sampled_record_reports_suppressed_count():
+    """Test a record emitted after drops carries the number of dropped records."""
+    sampler = SamplingFilter(rate=2)
+    records = [make_record("Tick") for _ in range(3)]
+    [sampler.filter(record) for record in records]
+
+    assert records[0].suppressed == 0
+    assert records[2].suppressed == 1
+
+
+def test_level_gating_skips_formatting():
+    """Test records below the logger level never format their arguments."""
+    class Expensive:
+        calls = 0
+
+        def __str__(self):
+            Expensive.calls += 1
+            return "expensive"
+
+    configure_logging(mode="sync", level="WARNING")
+    logger.debug("Payload %s", Expensive())
+    logger.info("Payload %s", Expensive())
+
+    assert Expensive.calls == 0
+    assert not logger.isEnabledFor(logging.INFO)
+
+
+def test_per_context_levels():
+    """Test per-logger levels override the global level."""
+    configure_logging(mode="sync", level="ERROR", levels={"webhooks": "DEBUG"})
+
+    assert not logger.isEnabledFor(logging.WARNING)
+    assert webhook_logger.isEnabledFor(logging.DEBUG)
+
+
+def test_off_mode_emits_nothing():
+    """Test the off mode silences every SDK logger without propagating."""
+    recorder = Recorder()
+    logging.getLogger().addHandler(recorder)
+    try:
+        configure_logging(mode="off")
+        logger.critical("not emitted")
+        webhook_logger.error("not emitted")
+    finally:
+        logging.getLogger().removeHandler(recorder)
+
+    assert recorder.records == []
+    assert not logger.isEnabledFor(logging.CRITICAL)
+
+
+def test_queue_mode_hands_records_to_listener():
+    """Test the queue mode enqueues records and a background listener emits them."""
+    configure_logging(mode="queue")
+    assert [type(h).__name__ for h in logger.handlers] == ["QueueHandler"]
+
+    listener = logger_module._listener
+    recorder = Recorder()
+    listener.handlers = (*listener.handlers, recorder)
+    logger.info("Queued %s", "record")
+    listener.stop()
+    logger_module._listener = None
+
+    assert [record.getMessage() for record in recorder.records] == ["Queued record"]
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        configure_logging(mode="verbose")
@@ -1,5 +1,7 @@
 import pytest
+from unittest.mock import patch
 from src.core.exceptions import ApiError
+from src.schemas.messages import CreateMessageRequest, Message
 
 
 def test_send_message_success(messages, mock_api_client):
@@ -26,10 +28,41 @@ def test_send_message_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("POST", "/messages", json=payload)
-    assert response["id"] == "msg123"
-    assert response["status"] == "queued"
-    assert response["content"] == "Hello, World!"
-    assert response["to"] == {"id": "contact123", "name": "John Doe", "phone": "+987654321"}
+    assert response.id == "msg123"
+    assert response.status == "queued"
+    assert response.content == "Hello, World!"
+    assert response.to.model_dump() == {"id": "contact123", "name": "John Doe", "phone": "+987654321"}
+
+
+def test_send_message_builds_request_model_once(messages, mock_api_client):
+    """Test the payload is validated once and the body is serialized from that model."""
+    mock_api_client.request.return_value = {
+        "id": "msg123", "from": "+123456789", "to": "contact123", "content": "Hi",
+        "status": "queued", "createdAt": "2024-11-28T10:00:00Z",
+    }
+    payload = {"to": {"id": "contact123"}, "content": "Hi", "from": "+123456789"}
+
+    with patch.object(CreateMessageRequest, "model_dump", wraps=CreateMessageRequest(**payload).model_dump) as dump:
+        response = messages.send_message(payload=payload)
+
+    dump.assert_called_once()
+    mock_api_client.request.assert_called_once_with("POST", "/messages", json=payload)
+    assert isinstance(response, Message)
+
+
+def test_send_message_accepts_model_and_returns_dict_on_request(messages, mock_api_client):
+    """Test a ready-made request model is sent as is and ``as_dict`` returns the raw response."""
+    raw = {
+        "id": "msg123", "from": "+123456789", "to": "contact123", "content": "Hi",
+        "status": "queued", "createdAt": "2024-11-28T10:00:00Z",
+    }
+    mock_api_client.request.return_value = raw
+    request = CreateMessageRequest(**{"to": {"id": "contact123"}, "content": "Hi", "from": "+123456789"})
+
+    assert messages.send_message(payload=request, as_dict=True) is raw
+    mock_api_client.request.assert_called_once_with(
+        "POST", "/messages", json={"to": {"id": "contact123"}, "content": "Hi", "from": "+123456789"},
+    )
 
 
 def test_send_message_validation_error(messages):
@@ -83,8 +116,8 @@ def test_list_messages_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/messages", params={"page": 1, "limit": 10})
-    assert len(response["messages"]) == 1
-    assert response["messages"][0]["id"] == "msg123"
+    assert len(response.messages) == 1
+    assert response.messages[0].id == "msg123"
 
 
 def test_get_message_success(messages, mock_api_client):
@@ -105,5 +138,62 @@ def test_get_message_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/messages/msg123")
-    assert response["id"] == "msg123"
-    assert response["content"] == "Hello, World!"
+    assert response.id == "msg123"
+    assert response.content == "Hello, World!"
+
+
+def _message_payload(i):
+    return {"to": {"id": f"contact{i}"}, "content": f"Hello {i}", "from": "+123456789"}
+
+
+def test_send_many_streams_results_and_errors(messages, mock_api_client):
+    """Test bulk sending returns one result per payload, including failures."""
+    def fake_request(method, endpoint, json):
+        if json["to"]["id"] == "contact2":
+            raise ApiError("Unhandled API Error")
+        return {
+            "id": f"msg-{json['to']['id']}",
+            "from": json["from"],
+            "to": json["to"],
+            "content": json["content"],
+            "status": "queued",
+            "createdAt": "2024-11-28T10:00:00Z"
+        }
+
+    mock_api_client.request.side_effect = fake_request
+    payloads = [_message_payload(i) for i in range(5)] + [{"to": "+987654321"}]
+
+    results = sorted(messages.send_many(payloads, concurrency=3), key=lambda r: r.index)
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.ok for r in results] == [True, True, False, True, True, False]
+    assert results[0].result.id == "msg-contact0"
+    assert isinstance(results[2].error, ApiError)
+    assert isinstance(results[5].error, ValueError)
+    # The invalid payload never reaches the API
+    assert mock_api_client.request.call_count == 5
+
+
+def test_send_many_reads_payloads_lazily(messages, mock_api_client):
+    """Test that only `concurrency` payloads are pulled ahead of the consumer."""
+    mock_api_client.request.return_value = {
+        "id": "msg", "from": "+1", "to": "contact", "content": "x", "status": "queued",
+        "createdAt": "2024-11-28T10:00:00Z"
+    }
+    consumed = []
+
+    def payloads():
+        for i in range(1000):
+            consumed.append(i)
+            yield _message_payload(i)
+
+    stream = messages.send_many(payloads(), concurrency=2)
+    next(stream)
+    stream.close()
+    assert len(consumed) <= 4
+
+
+def test_send_many_rejects_bad_concurrency(messages):
+    """Test that concurrency must be positive."""
+    with pytest.raises(ValueError):
+        list(messages.send_many([], concurrency=0))
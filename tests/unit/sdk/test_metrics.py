@@ -0,0 +1,90 @@
+import httpx
+import pytest
+from unittest.mock import patch
+from src.core.metrics import Histogram, MetricsRegistry
+from src.core.retry import RetryPolicy
+from src.core.exceptions import ServerError
+from src.sdk.client import ApiClient, AsyncApiClient
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    """Test quantile estimates fall inside the bucket that holds them."""
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in [0.05] * 50 + [0.15] * 40 + [0.3] * 9 + [5.0]:
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert 0.0 < histogram.quantile(0.5) <= 0.1
+    assert 0.1 < histogram.quantile(0.9) <= 0.2
+    assert 0.2 < histogram.quantile(0.99) <= 0.4
+    assert histogram.quantile(1.0) == 0.4
+    assert Histogram().quantile(0.5) is None
+
+
+def test_registry_snapshot_and_prometheus_text():
+    """Test readings are exported per endpoint as a dict and as Prometheus text."""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.request_started("GET /contacts/{id}")
+    registry.request_finished("GET /contacts/{id}", 0.05, 200, bytes_sent=0, bytes_received=120)
+    registry.request_started("GET /contacts/{id}")
+    registry.request_finished("GET /contacts/{id}", 0.5, 503, transient=True)
+    registry.record_retry("GET /contacts/{id}")
+    registry.request_started("POST /messages")
+
+    snapshot = registry.snapshot()
+    contacts = snapshot["GET /contacts/{id}"]
+    assert contacts["requests"] == 2
+    assert contacts["statuses"] == {"200": 1, "503": 1}
+    assert (contacts["retries"], contacts["transient_errors"], contacts["bytes_received"]) == (1, 1, 120)
+    assert contacts["in_flight"] == 0
+    assert snapshot["POST /messages"]["in_flight"] == 1
+
+    text = registry.to_prometheus()
+    labels = 'method="GET",endpoint="/contacts/{id}"'
+    assert "# TYPE messaging_sdk_request_duration_seconds histogram" in text
+    assert f'messaging_sdk_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'messaging_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"messaging_sdk_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'messaging_sdk_requests_total{{{labels},status="503"}} 1' in text
+    assert 'messaging_sdk_requests_in_flight{method="POST",endpoint="/messages"} 1' in text
+
+
+def test_metrics_disabled_by_default():
+    """Test clients carry no registry unless metrics are enabled."""
+    client = ApiClient()
+
+    assert client.metrics is None
+    assert client.metrics_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_requests_retries_and_bytes():
+    """Test a retried request records both attempts, the retry and the bytes exchanged."""
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"id": "1"})])
+    transport = httpx.MockTransport(lambda request: next(responses))
+    policy = RetryPolicy(max_attempts=2, base_delay=0, budget=None)
+
+    async with AsyncApiClient(transport=transport, metrics=MetricsRegistry(), retry_policy=policy) as client:
+        await client.request("PATCH", "/contacts/1", json={"name": "Jane"})
+
+    readings = client.metrics_stats()["PATCH /contacts/{id}"]
+    assert readings["requests"] == 2
+    assert readings["statuses"] == {"503": 1, "200": 1}
+    assert (readings["retries"], readings["transient_errors"]) == (1, 1)
+    assert readings["bytes_sent"] == 2 * len(b'{"name":"Jane"}')
+    assert readings["bytes_received"] == len(b'{"id":"1"}')
+    assert readings["latency"]["p50"] is not None
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_sync_client_records_transport_errors(mock_request):
+    """Test a request that never got a response is counted under the "error" status."""
+    mock_request.side_effect = ServerError("boom")
+    client = ApiClient(metrics=MetricsRegistry(), retry_policy=RetryPolicy(max_attempts=1, budget=None))
+
+    with pytest.raises(ServerError):
+        client.request("GET", "/messages")
+
+    readings = client.metrics_stats()["GET /messages"]
+    assert readings["statuses"] == {"error": 1}
+    assert readings["in_flight"] == 0
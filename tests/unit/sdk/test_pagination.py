@@ -0,0 +1,118 @@
+import pytest
+from src.sdk.pagination import iter_records, aiter_records
+
+
+def make_pages(total, page_size):
+    """Return a fetcher over ``total`` numbered records plus the list of requested pages."""
+    requested = []
+
+    def fetch(page):
+        requested.append(page)
+        start = (page - 1) * page_size
+        return list(range(start, min(start + page_size, total)))
+
+    return fetch, requested
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_records_reads_all_pages(prefetch):
+    """Test iteration ends on the first short page."""
+    fetch, requested = make_pages(total=7, page_size=3)
+
+    assert list(iter_records(fetch, 3, prefetch=prefetch)) == list(range(7))
+    assert requested == [1, 2, 3]
+
+
+def test_iter_records_prefetches_next_page():
+    """Test the next page is requested before the current one is consumed."""
+    fetch, requested = make_pages(total=10, page_size=5)
+    records = iter_records(fetch, 5)
+
+    assert next(records) == 0
+    records.close()
+    assert 2 in requested
+
+
+def test_iter_records_max_items_skips_unneeded_pages():
+    """Test no page beyond ``max_items`` is fetched."""
+    fetch, requested = make_pages(total=100, page_size=5)
+
+    assert list(iter_records(fetch, 5, max_items=5)) == list(range(5))
+    assert requested == [1]
+
+
+def test_iter_records_stop_condition():
+    """Test the record matching ``stop`` ends iteration without being yielded."""
+    fetch, _ = make_pages(total=100, page_size=5)
+
+    assert list(iter_records(fetch, 5, stop=lambda record: record == 7)) == list(range(7))
+
+
+def test_iter_records_invalid_page_size():
+    """Test a page size below one is rejected."""
+    with pytest.raises(ValueError):
+        list(iter_records(lambda page: [], 0))
+
+
+def message_page(ids, page):
+    """Build a valid ``GET /messages`` response holding the given message ids."""
+    return {
+        "messages": [
+            {
+                "id": message_id,
+                "from": "+123456789",
+                "to": "+987654321",
+                "content": "Hello",
+                "status": "delivered",
+                "createdAt": "2024-11-28T10:00:00Z",
+            }
+            for message_id in ids
+        ],
+        "page": page,
+        "quantityPerPage": 2,
+    }
+
+
+def contact_page(ids, page):
+    """Build a valid ``GET /contacts`` response holding the given contact ids."""
+    return {
+        "contactsList": [{"id": contact_id, "name": "John Doe", "phone": "+123456789"} for contact_id in ids],
+        "pageNumber": page,
+        "pageSize": 2,
+    }
+
+
+def test_iter_messages_hides_pagination_parameters(messages, mock_api_client):
+    """Test iter_messages maps to page/limit and unwraps the messages list."""
+    mock_api_client.request.side_effect = [message_page(["1", "2"], 1), message_page(["3"], 2)]
+
+    assert [m.id for m in messages.iter_messages(page_size=2)] == ["1", "2", "3"]
+    mock_api_client.request.assert_any_call("GET", "/messages", params={"page": 2, "limit": 2})
+
+
+def test_iter_contacts_hides_pagination_parameters(contacts, mock_api_client):
+    """Test iter_contacts maps to pageIndex/max and unwraps the contactsList."""
+    mock_api_client.request.side_effect = [contact_page(["1"], 1), contact_page([], 2)]
+
+    assert [c.id for c in contacts.iter_contacts(page_size=1)] == ["1"]
+    mock_api_client.request.assert_any_call("GET", "/contacts", params={"pageIndex": 2, "max": 1})
+
+
+@pytest.mark.asyncio
+async def test_aiter_records_max_items_and_stop():
+    """Test the async iterator honours ``max_items`` and ``stop``."""
+    fetch, requested = make_pages(total=20, page_size=4)
+
+    async def afetch(page):
+        return fetch(page)
+
+    assert [r async for r in aiter_records(afetch, 4, max_items=6)] == list(range(6))
+    assert [r async for r in aiter_records(afetch, 4, stop=lambda r: r == 2)] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_contacts(async_contacts, mock_async_api_client):
+    """Test AsyncContacts.iter_contacts walks pages until a short one."""
+    mock_async_api_client.request.side_effect = [contact_page(["1", "2"], 1), contact_page(["3"], 2)]
+
+    assert [c.id async for c in async_contacts.iter_contacts(page_size=2)] == ["1", "2", "3"]
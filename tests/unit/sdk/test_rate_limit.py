@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+from src.sdk.client import ApiClient
+from src.core.retry import RetryPolicy
+from src.core.exceptions import RateLimitError
+from src.core.rate_limit import TokenBucket, RateLimiter, AdaptiveConcurrencyLimiter
+
+
+def test_token_bucket_allows_burst_then_spaces_requests(clock):
+    """Test that the bucket serves the burst immediately and then paces callers."""
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    clock.now = 1.0
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_pause_holds_back_callers(clock):
+    """Test that a pause (e.g. from Retry-After) delays every caller."""
+    bucket = TokenBucket(rate=100, burst=100, clock=clock)
+    bucket.pause(5)
+    assert bucket.reserve() == pytest.approx(5)
+
+
+def test_rate_limiter_keys_by_api_key_and_endpoint(clock):
+    """Test per-endpoint overrides and separate buckets per API key."""
+    limiter = RateLimiter(rate=None, limits={"POST /messages": (1, 1)}, clock=clock)
+
+    assert limiter.acquire("key-a", "GET /contacts") == 0  # Unlimited endpoint
+    assert limiter.acquire("key-a", "POST /messages") == 0
+    assert limiter.acquire("key-a", "POST /messages") == pytest.approx(1)
+    assert limiter.acquire("key-b", "POST /messages") == 0
+
+
+def test_aimd_increases_on_success_and_halves_on_overload(clock):
+    """Test additive increase and multiplicative decrease of the concurrency limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=8, cooldown=1, clock=clock)
+
+    for _ in range(5):
+        assert limiter.acquire(timeout=0)
+        limiter.release()
+    assert limiter.limit == 5
+
+    limiter.acquire(timeout=0)
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+    # A second overload within the cooldown does not cut the limit again
+    limiter.acquire(timeout=0)
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+    # Client errors and cancelled requests leave the limit alone
+    for _ in range(5):
+        limiter.acquire(timeout=0)
+        limiter.release(succeeded=False)
+    assert limiter.limit == 2
+
+
+def test_aimd_blocks_when_limit_reached():
+    """Test that acquire times out when all slots are in flight."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    assert limiter.acquire(timeout=0)
+    assert limiter.acquire(timeout=0.01) is False
+    limiter.release()
+    assert limiter.snapshot() == {"limit": 1, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_aimd_async_waiters_are_woken():
+    """Test that coroutines waiting for a slot are resumed on release."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire_async()
+    waiter = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_aimd_cancelled_waiter_passes_its_slot_on():
+    """Test that a waiter cancelled after being woken does not strand the others."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire_async()
+    first = asyncio.create_task(limiter.acquire_async())
+    second = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0)
+
+    limiter.release()  # Wakes ``first``...
+    first.cancel()     # ...which is cancelled before it runs
+    await asyncio.wait_for(second, timeout=1)
+    assert first.cancelled()
+    assert limiter.in_flight == 1
+
+
+@patch("src.sdk.client.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_client_429_raises_rate_limit_error_and_backs_off(mock_request, mock_sleep):
+    """Test that a 429 maps to RateLimitError, pauses the bucket and lowers concurrency."""
+    concurrency = AdaptiveConcurrencyLimiter(initial_limit=8, cooldown=0)
+    client = ApiClient(
+        rate_limiter=RateLimiter(rate=1000, burst=1000),
+        concurrency_limiter=concurrency,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    mock_request.return_value = MagicMock(status_code=429, ok=False, text="slow down", headers={"Retry-After": "3"})
+
+    with pytest.raises(RateLimitError) as exc_info:
+        client.request("POST", "/messages", json={})
+    assert exc_info.value.retry_after == 3
+    assert concurrency.limit == 4
+
+    mock_request.return_value = MagicMock(status_code=200, ok=True)
+    client.request("POST", "/messages", json={})
+    assert mock_sleep.call_args[0][0] == pytest.approx(3, abs=0.1)
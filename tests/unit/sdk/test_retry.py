@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import patch
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from src.core.exceptions import TransientError, ServerError
+from src.core.retry import retry, RetryPolicy, RetryBudget, parse_retry_after
+
+
+def test_parse_retry_after_seconds_and_date():
+    """Test Retry-After parsing for both delta-seconds and HTTP-date forms."""
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(future) <= 30
+
+
+def test_backoff_is_capped_exponential_with_full_jitter():
+    """Test that delays grow exponentially, are capped and scaled by the jitter source."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=lambda: 1.0)
+    assert [policy.compute_delay(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    jittered = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=lambda: 0.25)
+    assert jittered.compute_delay(2) == 1.0
+
+
+def test_retry_after_is_a_lower_bound():
+    """Test that Retry-After overrides shorter jittered delays."""
+    policy = RetryPolicy(base_delay=1.0, rng=lambda: 0.0)
+    error = TransientError(status_code=429, retry_after=3.0)
+    assert policy.compute_delay(0, error) == 3.0
+
+
+def test_retry_budget_limits_retries_to_ratio():
+    """Test that the budget only allows retries in proportion to first attempts."""
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=10)
+    budget._tokens = 0
+    assert budget.withdraw() is False
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
+
+
+@patch("src.core.retry.time.sleep")
+def test_retry_stops_when_budget_exhausted(mock_sleep):
+    """Test that an empty budget surfaces the error without retrying."""
+    budget = RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+    budget._tokens = 0
+    policy = RetryPolicy(max_attempts=5, budget=budget)
+    calls = []
+
+    @retry(policy=policy)
+    def flaky():
+        calls.append(1)
+        raise TransientError(status_code=503)
+
+    with pytest.raises(TransientError):
+        flaky()
+    assert len(calls) == 1
+    assert policy.stats.snapshot() == {"attempts": 1, "retries": 0, "give_ups": 1, "budget_exhausted": 1}
+
+
+@patch("src.core.retry.time.sleep")
+def test_non_retryable_errors_are_raised_immediately(mock_sleep):
+    """Test that non-transient errors are not retried."""
+    policy = RetryPolicy(max_attempts=3)
+
+    @retry(policy=policy)
+    def broken():
+        raise ServerError()
+
+    with pytest.raises(ServerError):
+        broken()
+    mock_sleep.assert_not_called()
+    assert policy.stats.snapshot()["attempts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry_uses_policy_counters():
+    """Test the async variant retries and records attempts."""
+    policy = RetryPolicy(max_attempts=3, rng=lambda: 0.0)
+    calls = []
+
+    @retry(policy=policy)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise TransientError(status_code=504)
+        return "ok"
+
+    assert await flaky() == "ok"
+    assert policy.stats.snapshot() == {"attempts": 2, "retries": 1, "give_ups": 0, "budget_exhausted": 0}
+
+
+def test_retry_after_beyond_max_delay_gives_up():
+    """Test that a Retry-After longer than max_delay is not waited for."""
+    policy = RetryPolicy(max_delay=10.0, rng=lambda: 0.0)
+    assert policy.next_delay(1, TransientError(status_code=503, retry_after=3600.0)) is None
+    assert policy.stats.snapshot()["give_ups"] == 1
+    assert policy.compute_delay(0, TransientError(status_code=503, retry_after=3600.0)) == 10.0
+
+
+def test_non_idempotent_methods_retry_only_unsent_requests():
+    """Test that POST is only retried when the server cannot have handled it."""
+    import requests
+    from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+    policy = RetryPolicy()
+    refused = requests.exceptions.ConnectionError(MaxRetryError(None, "/", NewConnectionError(None, "refused")))
+    aborted = requests.exceptions.ConnectionError(ProtocolError("Connection aborted.", ConnectionResetError()))
+
+    assert policy.is_retryable(refused, "POST") and policy.is_retryable(aborted, "GET")
+    assert not policy.is_retryable(aborted, "POST")
+    assert policy.is_retryable(TransientError(status_code=503), "POST")
+    assert not policy.is_retryable(TransientError(status_code=504), "POST")
+    assert policy.is_retryable(TransientError(status_code=504), "GET")
@@ -0,0 +1,148 @@
+import pytest
+from unittest.mock import patch
+from src.core import validators as validators_module
+from src.core.validators import (
+    ValidationMode, get_validation_mode, set_validation_mode, validation_stats,
+)
+
+INVALID_CONTACT = {"id": "1", "name": "John Doe"}
+MESSAGE_BYTES = (
+    b'{"id": "msg1", "from": "+123456789", "to": "contact1", "content": "Hi",'
+    b' "status": "queued", "createdAt": "2024-11-28T10:00:00Z"}'
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_validation():
+    """Restore strict mode and clear the counters around every test."""
+    set_validation_mode("strict")
+    validation_stats.reset()
+    validators_module._typed_result_warnings.clear()
+    yield
+    set_validation_mode("strict")
+
+
+def test_strict_mode_rejects_invalid_response(contacts, mock_api_client):
+    """Test strict mode raises on a response that does not match the schema."""
+    mock_api_client.request.return_value = INVALID_CONTACT
+
+    with pytest.raises(ValueError, match="Invalid response"):
+        contacts.get_contact("1")
+    assert validation_stats.snapshot()["failures_by_model"] == {"Contact": 1}
+
+
+def test_off_mode_skips_request_and_response_validation(contacts, mock_api_client):
+    """Test off mode sends invalid payloads and returns invalid responses untouched."""
+    set_validation_mode(ValidationMode.OFF)
+    mock_api_client.request.return_value = INVALID_CONTACT
+
+    assert contacts.create_contact(payload={"name": "John Doe"}, as_dict=True) == INVALID_CONTACT
+    mock_api_client.request.assert_called_once_with("POST", "/contacts", json={"name": "John Doe"})
+    assert validation_stats.snapshot()["skipped"] == 1
+
+
+def test_off_mode_returns_invalid_response_as_received(contacts, mock_api_client):
+    """Test a typed response that fails validation outside strict mode comes back as decoded JSON."""
+    set_validation_mode("off")
+    mock_api_client.request.side_effect = [INVALID_CONTACT, b'["not", "an", "object"]']
+
+    assert contacts.get_contact("1") == INVALID_CONTACT
+    assert contacts.get_contact("2") == ["not", "an", "object"]
+    assert validation_stats.snapshot()["failures_by_model"] == {"Contact": 2}
+
+
+def test_typed_calls_warn_once_that_validation_is_not_skipped(contacts, mock_api_client):
+    """Test sampled and off modes warn, once per mode, that typed results are still validated."""
+    mock_api_client.request.return_value = {"id": "1", "name": "John Doe", "phone": "+123456789"}
+
+    with patch.object(validators_module, "logger") as logger:
+        for mode in ("off", "off", "sampled", "strict"):
+            contacts.get_contact("1", validation=mode)
+        contacts.get_contact("1", validation="off", as_dict=True)
+
+    warnings = [call.args[1] for call in logger.warning.call_args_list]
+    assert warnings == ["off", "sampled"]
+    assert validation_stats.snapshot()["validated"] == 4
+
+
+def test_off_mode_returns_the_same_types_as_strict(messages, mock_api_client):
+    """Test typed results have nested models and datetimes whatever the mode."""
+    set_validation_mode("off")
+    mock_api_client.request.side_effect = [
+        b'{"messages": [' + MESSAGE_BYTES + b'], "page": 1, "quantityPerPage": 10}',
+        MESSAGE_BYTES,
+    ]
+
+    page = messages.list_messages(page=1, limit=10)
+    message = messages.get_message("msg1", validation="sampled")
+
+    assert page.messages[0].id == "msg1"
+    assert page.messages[0].to.id == "contact1"
+    assert page.messages[0].created_at.year == 2024
+    assert message.to.id == "contact1"
+
+
+def test_sampled_mode_validates_one_in_n_and_counts_failures(contacts, mock_api_client):
+    """Test sampled mode validates one response in N and records, without raising, failures."""
+    set_validation_mode("sampled", sample_rate=3)
+    mock_api_client.request.return_value = INVALID_CONTACT
+
+    for _ in range(6):
+        assert contacts.get_contact("1", as_dict=True) == INVALID_CONTACT
+
+    stats = validation_stats.snapshot()
+    assert stats["failures"] == 2
+    assert stats["skipped"] == 4
+
+
+def test_per_call_mode_overrides_global(contacts, mock_api_client):
+    """Test the ``validation`` argument applies to a single call only."""
+    mock_api_client.request.return_value = INVALID_CONTACT
+
+    assert contacts.get_contact("1", validation="off", as_dict=True) == INVALID_CONTACT
+    mock_api_client.request.assert_called_once_with("GET", "/contacts/1")
+    assert get_validation_mode() is ValidationMode.STRICT
+    with pytest.raises(ValueError):
+        contacts.get_contact("1")
+
+
+def test_per_call_mode_covers_request_and_response(messages, mock_api_client):
+    """Test a per-call override on send_message reaches the response check too."""
+    mock_api_client.request.return_value = {"unexpected": True}
+
+    assert messages.send_message(payload={"to": "x"}, validation="off", as_dict=True) == {"unexpected": True}
+
+
+@pytest.mark.asyncio
+async def test_async_per_call_mode(async_contacts, mock_async_api_client):
+    """Test per-call overrides on async methods."""
+    mock_async_api_client.request.return_value = INVALID_CONTACT
+
+    assert await async_contacts.get_contact("1", validation="off", as_dict=True) == INVALID_CONTACT
+    with pytest.raises(ValueError):
+        await async_contacts.get_contact("1")
+
+
+def test_invalid_mode_rejected():
+    """Test unknown modes are rejected."""
+    with pytest.raises(ValueError):
+        set_validation_mode("lenient")
+
+
+def test_raw_body_is_decoded_straight_into_the_model(messages, mock_api_client):
+    """Test bytes handed over by the client are parsed once, with the 'to' normalization applied."""
+    mock_api_client.request.return_value = MESSAGE_BYTES
+
+    message = messages.get_message("msg1")
+
+    assert message.to.id == "contact1"
+    assert message.created_at.year == 2024
+    assert messages.get_message("msg1", as_dict=True)["to"] == "contact1"
+
+
+def test_invalid_raw_body_rejected(messages, mock_api_client):
+    """Test a body that is not valid JSON fails validation in strict mode."""
+    mock_api_client.request.return_value = b"not json"
+
+    with pytest.raises(ValueError, match="Invalid response"):
+        messages.get_message("msg1")
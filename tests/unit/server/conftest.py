@@ -0,0 +1,44 @@
+import json
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from src.core.config import settings
+from src.core.security import generate_signature
+from src.server import app as app_module
+
+
+@pytest.fixture
+def webhook_client():
+    """
+    Fixture to provide a TestClient for the webhook app with fresh shared state.
+
+    The app's queue, admission controller, dedup store and status store are reset
+    and rebuilt from settings on first use. A test may install its own by assigning
+    the module global (e.g. ``app_module.webhook_queue = WebhookQueue(...)``); the
+    queue in use is closed afterwards and every global is restored.
+
+    Returns:
+        TestClient: A client for ``src.server.app.app``.
+    """
+    with patch.object(app_module, "webhook_queue", None), patch.object(app_module, "_webhook_queue_built", False), \
+            patch.object(app_module, "admission", None), \
+            patch.object(app_module, "dedup_store", None), patch.object(app_module, "_dedup_store_built", False), \
+            patch.object(app_module, "status_store", None), patch.object(app_module, "_status_store_built", False):
+        yield TestClient(app_module.app)
+        if app_module.webhook_queue is not None:
+            app_module.webhook_queue.close()
+
+
+@pytest.fixture
+def post_webhook():
+    """
+    Fixture to provide a function posting a correctly signed event to ``/webhooks``.
+
+    Returns:
+        Callable: ``post(client, event, headers=None)``, returning the response.
+    """
+    def post(client, event, headers=None):
+        body = json.dumps(event).encode()
+        signature = generate_signature(body, settings.WEBHOOK_SECRET)
+        return client.post("/webhooks", content=body, headers={"Authorization": f"Bearer {signature}", **(headers or {})})
+    return post
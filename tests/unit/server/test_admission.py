@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import patch
+from src.core.config import settings
+from src.server import app as app_module
+from src.server.admission import AdmissionController
+
+
+def test_controller_enforces_global_queue_and_source_limits():
+    """Test each limit refuses with its reason and releasing frees the slot."""
+    controller = AdmissionController(max_in_flight=3, max_per_source=2)
+
+    assert controller.acquire("a") is None
+    assert controller.acquire("a") is None
+    assert controller.acquire("a") == "source"
+    assert controller.acquire("b", queued=10, max_queued=10) == "queued"
+    assert controller.acquire("b") is None
+    assert controller.acquire("c") == "in_flight"
+
+    controller.release("a")
+    assert controller.acquire("c") is None
+    snapshot = controller.snapshot()
+    assert (snapshot["in_flight"], snapshot["sources"], snapshot["admitted"]) == (3, 3, 4)
+    assert snapshot["shed"] == {"in_flight": 1, "queued": 1, "source": 1}
+
+
+def test_controller_without_limits_admits_everything():
+    """Test zero limits disable shedding and idle sources are forgotten."""
+    controller = AdmissionController()
+
+    assert all(controller.acquire(f"source-{i % 3}") is None for i in range(1000))
+    for i in range(1000):
+        controller.release(f"source-{i % 3}")
+    assert controller.snapshot()["sources"] == 0 and controller.in_flight == 0
+
+
+EVENT = {"id": "msg123", "status": "delivered"}
+
+
+@pytest.fixture
+def controller(webhook_client):
+    app_module.admission = AdmissionController(max_in_flight=2, max_per_source=1, retry_after=3)
+    return app_module.admission
+
+
+def test_endpoint_sheds_load_with_retry_after(webhook_client, controller, post_webhook):
+    """Test requests past the limits get a 503 with Retry-After and admitted ones release their slot."""
+    client = webhook_client
+
+    assert post_webhook(client, EVENT).status_code == 200
+    assert controller.in_flight == 0
+
+    # "testclient" is the address TestClient reports; hold its only slot
+    controller.acquire("testclient")
+    busy = post_webhook(client, EVENT)
+    assert busy.status_code == 503 and busy.headers["Retry-After"] == "3"
+
+    controller.acquire("other")
+    assert post_webhook(client, EVENT).status_code == 503
+    assert client.get("/webhooks/stats").json()["admission"]["shed"] == {"in_flight": 1, "queued": 0, "source": 1}
+
+
+def test_source_comes_from_forwarded_header_when_configured(webhook_client, controller, post_webhook):
+    """Test senders behind a proxy are told apart by the configured forwarded-for header."""
+    controller.acquire("testclient")
+
+    with patch.object(settings, "WEBHOOK_SOURCE_HEADER", "X-Forwarded-For"):
+        response = post_webhook(webhook_client, EVENT, headers={"X-Forwarded-For": "203.0.113.7, 10.0.0.1"})
+
+    assert response.status_code == 200
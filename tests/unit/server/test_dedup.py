@@ -0,0 +1,101 @@
+import threading
+import pytest
+from unittest.mock import patch
+from src.schemas.webhook import WebhookPayload
+from src.server import app as app_module
+from src.server.dedup import MemoryDedupStore, SqliteDedupStore, event_key
+from src.server.webhook_queue import WebhookQueue
+
+
+def test_event_key_covers_id_status_and_delivery_time():
+    """Test events differing in status or delivery time are distinct, and alias spelling does not matter."""
+    delivered = WebhookPayload.model_validate_json(b'{"id":"m1","status":"delivered","deliveredAt":"2024-12-01T12:00:00Z"}')
+    same = WebhookPayload(id="m1", status="delivered", delivered_at="2024-12-01T12:00:00+00:00")
+    failed = WebhookPayload(id="m1", status="failed")
+
+    assert event_key(delivered) == event_key(same)
+    assert len({event_key(delivered), event_key(failed), event_key(WebhookPayload(id="m1", status="queued"))}) == 3
+
+
+def test_memory_store_expires_and_evicts_least_recently_seen(clock):
+    """Test keys are forgotten after the TTL and the oldest go first when the store is full."""
+    store = MemoryDedupStore(ttl=60, max_entries=2, clock=clock)
+
+    assert [store.check(key) for key in ("a", "b", "a")] == [False, False, True]
+    store.check("c")  # evicts "b", the least recently seen
+    assert store.check("a") is True and store.check("b") is False
+
+    clock.now += 61
+    assert store.size() == 0  # Expired entries no longer count
+    assert store.check("a") is False
+    stats = store.stats()
+    assert (stats["checked"], stats["duplicates"], stats["size"]) == (7, 2, 1)
+    assert stats["duplicate_rate"] == pytest.approx(2 / 7)
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path, clock):
+    """Test two stores on one file (as in two worker processes) see each other's events."""
+    path = str(tmp_path / "dedup.sqlite3")
+    first, second = SqliteDedupStore(path, ttl=60, clock=clock), SqliteDedupStore(path, ttl=60, clock=clock)
+
+    assert first.check("m1|delivered|") is False
+    assert second.check("m1|delivered|") is True
+    second.forget("m1|delivered|")
+    assert first.check("m1|delivered|") is False
+
+    clock.now += 61
+    assert second.check("m1|delivered|") is False
+    assert second.stats() == {"backend": "sqlite", "size": 1, "checked": 2, "duplicates": 1, "duplicate_rate": 0.5}
+    first.close()
+    second.close()
+
+
+def test_concurrent_checks_admit_an_event_once(tmp_path):
+    """Test only one of many simultaneous deliveries of an event is taken as new."""
+    store = SqliteDedupStore(str(tmp_path / "dedup.sqlite3"))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.check("m1|delivered|"))) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(False) == 1
+
+
+def test_endpoint_acknowledges_duplicates_without_processing(webhook_client, post_webhook):
+    """Test a redelivered event gets 200 but reaches the handler once, and a refused one can be redelivered."""
+    processed = []
+
+    def handler(payload):
+        processed.append(payload.id)
+
+    app_module.dedup_store = MemoryDedupStore()
+    queue = app_module.webhook_queue = WebhookQueue(handler)
+    event = {"id": "dup1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}
+    responses = [post_webhook(webhook_client, event) for _ in range(3)]
+    queue.join(5)
+
+    with patch.object(queue, "submit", return_value=False):
+        assert post_webhook(webhook_client, {"id": "dup2", "status": "failed"}).status_code == 503
+    assert post_webhook(webhook_client, {"id": "dup2", "status": "failed"}).status_code == 200
+    queue.join(5)
+    stats = webhook_client.get("/webhooks/stats").json()["dedup"]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert processed == ["dup1", "dup2"]
+    assert (stats["checked"], stats["duplicates"]) == (5, 2)
+
+
+def test_endpoint_checks_sqlite_store_off_the_event_loop(webhook_client, post_webhook, tmp_path):
+    """Test SQLite calls, which may wait on another process's lock, run in the thread pool."""
+    app_module.dedup_store = SqliteDedupStore(str(tmp_path / "dedup.sqlite3"))
+    app_module.webhook_queue = WebhookQueue(lambda payload: None)
+    event = {"id": "dup3", "status": "delivered"}
+
+    with patch.object(app_module, "run_in_threadpool", wraps=app_module.run_in_threadpool) as run_in_threadpool:
+        assert [post_webhook(webhook_client, event).status_code for _ in range(2)] == [200, 200]
+
+    assert [call.args[0] for call in run_in_threadpool.call_args_list] == [app_module.dedup_store.check] * 2
+    assert app_module.dedup_store.stats()["duplicates"] == 1
+    app_module.dedup_store.close()
@@ -0,0 +1,92 @@
+import json
+import time
+import httpx
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from src.core.security import verify_signature
+from src.server.mock_api import LatencyModel, MockApi
+
+AUTH = {"Authorization": "Bearer key"}
+
+
+def test_mock_api_serves_every_route_and_checks_auth():
+    """Test messages, contacts, pagination, 400s, 404s and 401s follow the OpenAPI spec."""
+    with MockApi(api_key="key", seed_messages=3) as api:
+        contact = httpx.post(f"{api.url}/contacts", json={"name": "Jane", "phone": "+1555"}, headers=AUTH).json()
+        created = httpx.post(f"{api.url}/messages", json={"to": {"id": contact["id"]}, "content": "Hi", "from": "+1"}, headers=AUTH)
+        listed = httpx.get(f"{api.url}/messages", params={"page": 2, "limit": 2}, headers=AUTH).json()
+        updated = httpx.patch(f"{api.url}/contacts/{contact['id']}", json={"name": "Janet"}, headers=AUTH).json()
+        deleted = httpx.delete(f"{api.url}/contacts/{contact['id']}", headers=AUTH)
+        missing = httpx.get(f"{api.url}/contacts/{contact['id']}", headers=AUTH)
+        invalid = httpx.post(f"{api.url}/messages", json={"to": {"id": "c1"}}, headers=AUTH)
+        denied = httpx.get(f"{api.url}/messages", headers={"Authorization": "Bearer wrong"})
+
+    assert created.status_code == 201 and created.json()["to"] == contact
+    assert [message["id"] for message in listed["messages"]] == ["msg3", created.json()["id"]]
+    assert (listed["page"], listed["quantityPerPage"]) == (2, 2)
+    assert updated["name"] == "Janet" and deleted.status_code == 204
+    assert missing.status_code == 404 and missing.json()["message"] == "Contact not found"
+    assert invalid.status_code == 400 and "content" in invalid.json()["error"]
+    assert denied.status_code == 401
+
+
+def test_mock_api_injects_faults_at_the_configured_rate():
+    """Test injected faults follow their rates, carry Retry-After and create nothing."""
+    with MockApi(api_key="key", faults={429: 0.3, 503: 0.2}, retry_after=2, seed=7) as api:
+        with httpx.Client(base_url=api.url, headers=AUTH) as client:
+            responses = [client.post("/contacts", json={"name": "Jane", "phone": "+1555"}) for _ in range(200)]
+
+    statuses = [response.status_code for response in responses]
+    assert 40 <= statuses.count(429) <= 80 and 20 <= statuses.count(503) <= 60
+    assert api.stats["faults"] == {429: statuses.count(429), 503: statuses.count(503)}
+    assert all(r.headers["Retry-After"] == "2" for r in responses if r.status_code == 429)
+    assert len(api.contacts) == statuses.count(201)
+
+
+def test_latency_models():
+    """Test each distribution's samples and spec validation."""
+    assert LatencyModel.parse("fixed:20").sample() == pytest.approx(0.02)
+    uniform = LatencyModel.parse("uniform:10:30")
+    assert all(0.01 <= uniform.sample() <= 0.03 for _ in range(100))
+    lognormal = sorted(LatencyModel("lognormal", 40, 0.5).sample() for _ in range(1001))
+    assert 0.03 < lognormal[500] < 0.05 and lognormal[-1] > lognormal[500] * 2
+    assert LatencyModel("normal", 1, 50).sample() >= 0
+    with pytest.raises(ValueError):
+        LatencyModel.parse("pareto:3")
+    with pytest.raises(ValueError):
+        LatencyModel.parse("uniform:10")
+
+
+def test_mock_api_sends_signed_delivery_webhooks():
+    """Test created messages are reported through webhooks the receiver can verify."""
+    received = []
+
+    class Receiver(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            verify_signature(body, self.headers["Authorization"].removeprefix("Bearer "), "whsecret")
+            received.append(json.loads(body))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    receiver = HTTPServer(("127.0.0.1", 0), Receiver)
+    Thread(target=receiver.serve_forever, daemon=True).start()
+    webhook_url = f"http://127.0.0.1:{receiver.server_address[1]}/webhooks"
+    try:
+        with MockApi(api_key="key", webhook_url=webhook_url, webhook_secret="whsecret", webhook_delay=0.01) as api:
+            message = httpx.post(f"{api.url}/messages", json={"to": {"id": "c1"}, "content": "Hi", "from": "+1"}, headers=AUTH).json()
+            deadline = time.monotonic() + 5
+            while not received and time.monotonic() < deadline:
+                time.sleep(0.01)
+            stored = httpx.get(f"{api.url}/messages/{message['id']}", headers=AUTH).json()
+    finally:
+        receiver.shutdown()
+
+    assert received and received[0]["id"] == message["id"] and received[0]["status"] == "delivered"
+    assert stored["status"] == "delivered" and stored["deliveredAt"] == received[0]["deliveredAt"]
+    assert api.webhooks.sent == 1 and api.webhooks.errors == 0
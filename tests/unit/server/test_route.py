@@ -64,4 +64,22 @@ def test_webhook_invalid_payload():
     assert response.status_code == 422
 
     assert "status" in response.json()["detail"][0]["loc"]
-    assert response.json()["detail"][0]["msg"] == "Input should be 'queued', 'delivered' or 'failed'"
\ No newline at end of file
+    assert response.json()["detail"][0]["msg"] == "Input should be 'queued', 'delivered' or 'failed'"
+
+def test_webhook_forged_request_is_rejected_before_parsing():
+    # An unparseable body with a bad signature must fail on the signature, not on parsing
+    response = client.post(
+        "/webhooks",
+        content=b"{not json",
+        headers={"Authorization": "Bearer invalid-signature"}
+    )
+    assert response.status_code == 401
+
+    signature = generate_signature(b"{not json", settings.WEBHOOK_SECRET)
+    response = client.post(
+        "/webhooks",
+        content=b"{not json",
+        headers={"Authorization": f"Bearer {signature}"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
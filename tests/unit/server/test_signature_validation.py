@@ -31,3 +31,9 @@ def test_empty_signature():
     with pytest.raises(UnauthorizedError, match="Unauthorized: Signature validation failed."):
         verify_signature(serialized_payload, empty_signature, settings.WEBHOOK_SECRET)
 
+
+def test_signature_of_non_ascii_payload_is_stable():
+    """Test dict payloads are signed over ASCII-escaped compact JSON, as by peers and older versions."""
+    assert generate_signature({"a": "é", "n": 1.0}, "secret") == (
+        "a182c44ee10b22188bc3ef5e01e24d9783e4f92f01825bec011c6ae0a95786e6"
+    )
@@ -0,0 +1,105 @@
+from unittest.mock import patch
+from src.server import app as app_module
+from src.server.dedup import MemoryDedupStore
+from src.server.status_store import MessageStatusStore
+from src.server.webhook_queue import WebhookQueue
+
+
+def test_only_forward_transitions_are_applied():
+    """Test queued may move to a final status, and nothing moves back or between final statuses."""
+    store = MessageStatusStore(capacity=10)
+
+    assert store.apply("m1", "queued") is True
+    assert store.apply("m1", "delivered") is True
+    assert [store.apply("m1", status) for status in ("queued", "delivered", "failed")] == [False, False, False]
+    assert store.apply("m2", "failed") is True and store.apply("m2", "queued") is False
+    assert (store.get("m1"), store.get("m2"), store.get("unknown")) == ("delivered", "failed", None)
+    assert store.stats() == {"tracked": 2, "capacity": 10, "applied": 3, "stale": 4, "evicted": 0}
+
+
+def test_revert_restores_the_previous_status():
+    """Test an apply undone because its event was refused lets the redelivery through."""
+    store = MessageStatusStore(capacity=10)
+    store.apply("m1", "queued")
+    store.apply("m1", "delivered")
+    store.apply("m2", "failed")
+
+    store.revert("m1", "delivered")
+    store.revert("m2", "failed")
+
+    assert (store.get("m1"), store.get("m2")) == ("queued", None)
+    assert store.apply("m1", "delivered") is True
+
+
+def test_oldest_messages_are_evicted_by_age_and_capacity(clock):
+    """Test memory stays bounded: full stores drop the oldest message, and old messages expire."""
+    store = MessageStatusStore(capacity=3, max_age=60, clock=clock)
+    for message_id in ("m1", "m2", "m3"):
+        store.apply(message_id, "queued")
+        clock.now += 10
+
+    store.apply("m4", "queued")
+    assert store.get("m1") is None and len(store) == 3
+
+    clock.now += 41  # m2 was first seen 61s ago
+    assert store.evict_expired() == 1
+    assert store.get("m2") is None and store.get("m3") == "queued"
+    assert store.stats()["evicted"] == 2
+
+    # An evicted message is tracked afresh
+    assert store.apply("m1", "delivered") is True
+
+
+def test_snapshot_round_trip_skips_expired_entries(tmp_path, clock):
+    """Test a snapshot restores statuses and ages, and leaves out what expired meanwhile."""
+    store = MessageStatusStore(capacity=100, max_age=60, clock=clock)
+    store.apply("old", "queued")
+    clock.now += 30
+    store.apply("new", "queued")
+    store.apply("new", "delivered")
+    path = str(tmp_path / "statuses.ndjson")
+
+    assert store.snapshot(path) == 2
+    clock.now += 40
+    restored = MessageStatusStore(capacity=100, max_age=60, clock=clock)
+
+    assert restored.restore(path) == 1
+    assert (restored.get("old"), restored.get("new")) == (None, "delivered")
+    assert restored.apply("new", "queued") is False
+
+
+def test_endpoint_drops_out_of_order_events(webhook_client, post_webhook):
+    """Test a late queued event is acknowledged but never reaches the handler."""
+    processed = []
+    app_module.status_store = MessageStatusStore(capacity=10)
+    queue = app_module.webhook_queue = WebhookQueue(lambda payload: processed.append(payload.status))
+    responses = [
+        post_webhook(webhook_client, {"id": "ooo1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}),
+        post_webhook(webhook_client, {"id": "ooo1", "status": "queued"}),
+    ]
+    queue.join(5)
+    stats = webhook_client.get("/webhooks/stats").json()["statuses"]
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert processed == ["delivered"]
+    assert (stats["applied"], stats["stale"]) == (1, 1)
+
+
+def test_failed_event_is_reverted_before_the_dedup_store_is_awaited(webhook_client, post_webhook):
+    """Test the status is reverted before yielding to the loop, so a newer event cannot be clobbered."""
+    statuses = app_module.status_store = MessageStatusStore(capacity=10)
+    seen_on_forget = []
+
+    class RecordingStore(MemoryDedupStore):
+        def forget(self, key):
+            seen_on_forget.append(statuses.get("rev1"))
+            super().forget(key)
+
+    app_module.dedup_store = RecordingStore()
+    app_module._webhook_queue_built = True  # Process inline
+    with patch.object(app_module, "process_webhook", side_effect=RuntimeError("boom")):
+        response = post_webhook(webhook_client, {"id": "rev1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"})
+
+    assert response.status_code == 500
+    assert seen_on_forget == [None]
+    assert app_module.status_store is statuses
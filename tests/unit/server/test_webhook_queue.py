@@ -0,0 +1,84 @@
+import time
+import uuid
+import asyncio
+import threading
+from src.server import app as app_module
+from src.server.webhook_queue import WebhookQueue
+
+
+def test_async_workers_process_events_and_report_latency():
+    """Test coroutine handlers process every event and the queue reports wait and processing times."""
+    seen = []
+
+    async def handler(event):
+        await asyncio.sleep(0.01)
+        seen.append(event)
+
+    queue = WebhookQueue(handler, maxsize=100, workers=4)
+    assert all(queue.submit(i) for i in range(20))
+    queue.close()
+
+    stats = queue.stats()
+    assert sorted(seen) == list(range(20))
+    assert (stats["processed"], stats["failed"], stats["depth"], stats["in_progress"]) == (20, 0, 0, 0)
+    assert stats["wait"]["count"] == stats["processing"]["count"] == 20
+    assert stats["processing"]["p50"] >= 0.005
+
+
+def test_blocking_handler_runs_off_the_caller_and_full_queue_rejects():
+    """Test submit never waits on a blocking handler and refuses events beyond maxsize."""
+    release = threading.Event()
+    failures = []
+
+    def handler(event):
+        release.wait(5)
+        if event == "bad":
+            failures.append(event)
+            raise ValueError("cannot process")
+
+    queue = WebhookQueue(handler, maxsize=2, workers=1)
+    started = time.perf_counter()
+    accepted = [queue.submit(event) for event in ("bad", "a", "b", "c", "d")]
+    assert time.perf_counter() - started < 1
+
+    # The worker holds "bad", so two more fit and the rest are refused
+    assert accepted.count(True) in (2, 3) and queue.stats()["rejected"] == accepted.count(False)
+    release.set()
+    queue.close()
+
+    stats = queue.stats()
+    assert (stats["failed"], stats["processed"]) == (1, accepted.count(True) - 1)
+    assert failures == ["bad"]
+
+
+def new_event():
+    # A new message id each time, so deduplication never swallows the event
+    return {"id": f"msg-{uuid.uuid4()}", "status": "delivered"}
+
+
+def test_endpoint_acknowledges_queued_events_and_exposes_stats(webhook_client, post_webhook):
+    """Test verified events are acknowledged once queued and processed by the workers."""
+    processed = threading.Event()
+
+    async def handler(payload):
+        processed.set()
+
+    app_module.webhook_queue = WebhookQueue(handler)
+    response = post_webhook(webhook_client, new_event())
+
+    assert response.status_code == 200
+    assert processed.wait(5)
+    app_module.webhook_queue.join(5)
+    stats = webhook_client.get("/webhooks/stats").json()
+    assert (stats["processed"], stats["depth"]) == (1, 0)
+
+
+def test_endpoint_answers_503_when_queue_is_full(webhook_client, post_webhook):
+    """Test the provider is asked to retry later once the queue is full."""
+    app_module.webhook_queue = WebhookQueue(lambda payload: time.sleep(0.2), maxsize=1, workers=1)
+
+    statuses = [post_webhook(webhook_client, new_event()) for _ in range(4)]
+
+    assert statuses[0].status_code == 200
+    rejected = [response for response in statuses if response.status_code == 503]
+    assert rejected and rejected[0].headers["Retry-After"] == "1"